@@ -9,6 +9,7 @@ Phase 2C: SQLite story registry + HIGH-only dedup control
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import os
@@ -21,7 +22,8 @@ from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 from src.story.generator import (
     generate_horror_story, customize_template,
-    generate_with_dedup_control
+    generate_with_dedup_control, generate_stories_batch,
+    generate_stories_concurrent
 )
 from src.infra.logging_config import setup_logging
 from src.dedup.similarity import load_past_stories_into_memory
@@ -217,6 +219,12 @@ def parse_args():
   # 24시간 연속 실행, 30분 간격, 중복 제어
   python main.py --enable-dedup --duration-seconds 86400 --interval-seconds 1800
 
+  # Message Batches API로 10편 일괄 생성 (오프라인, 50% 비용)
+  python main.py --batch --max-stories 10
+
+  # AsyncAnthropic으로 10편 동시 생성 (최대 4개 요청 동시 진행)
+  python main.py --concurrency 4 --max-stories 10
+
   # 연구 스텁 실행 (테스트용)
   python main.py --run-research-stub
         """
@@ -279,6 +287,27 @@ def parse_args():
         default=None,
         help="목표 스토리 길이(자). 300-10000 범위. 미지정시 기본값 (~3000-4000자) 사용"
     )
+    # Message Batches API (offline bulk generation)
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        default=False,
+        help="Message Batches API로 --max-stories 편을 일괄 생성 (50%% 비용, 결과 대기 최대 24시간). --enable-dedup과 함께 사용 불가"
+    )
+    parser.add_argument(
+        "--batch-output",
+        type=str,
+        choices=["files", "jsonl_gz"],
+        default="files",
+        help="--batch 결과 저장 방식: files (편마다 .md/.json, 기본값) 또는 jsonl_gz (gzip 압축 JSONL 파일 하나)"
+    )
+    # Concurrent generation (AsyncAnthropic)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="동시 생성 요청 수. 2 이상이면 AsyncAnthropic으로 --max-stories 편을 동시에 생성. 기본값=1 (순차)"
+    )
     return parser.parse_args()
 
 
@@ -358,6 +387,39 @@ def main() -> None:
         run_research_stub()
         return
 
+    # Message Batches API 일괄 생성
+    if args.batch:
+        if args.enable_dedup:
+            logger.error("--batch는 --enable-dedup과 함께 사용할 수 없습니다")
+            sys.exit(1)
+        if args.model:
+            logger.error("--batch는 기본 Claude 모델만 지원합니다 (--model 사용 불가)")
+            sys.exit(1)
+        results = generate_stories_batch(
+            count=args.max_stories,
+            target_length=args.target_length,
+            output_mode=args.batch_output
+        )
+        for result in results:
+            logger.info(f"✓ 저장 위치: {result.get('file_path', 'N/A')}")
+        logger.info(f"[Batch] 생성된 소설: {len(results)}/{args.max_stories}개")
+        return
+
+    # AsyncAnthropic 동시 생성
+    if args.concurrency > 1:
+        if args.enable_dedup or args.model:
+            logger.error("--concurrency는 기본 Claude 모델 + 중복 제어 비활성화 상태에서만 지원합니다")
+            sys.exit(1)
+        results = asyncio.run(generate_stories_concurrent(
+            count=args.max_stories,
+            concurrency=args.concurrency,
+            target_length=args.target_length
+        ))
+        for result in results:
+            logger.info(f"✓ 저장 위치: {result.get('file_path', 'N/A')}")
+        logger.info(f"[Async] 생성된 소설: {len(results)}/{args.max_stories}개")
+        return
+
     # 신호 핸들러 등록
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -4,8 +4,14 @@ Deduplication module - story similarity and research dedup logic.
 Contains two separate dedup systems:
 1. Story similarity (in-memory, process-scoped) - for story generation
 2. Research dedup (FAISS-based, persistent) - for research cards
+
+Research dedup exports are resolved lazily on first attribute access, so
+importing story similarity does not load numpy/faiss.
 """
 
+import importlib
+from importlib.util import find_spec
+
 # Story similarity (in-memory) - always available
 from .similarity import (
     GenerationRecord,
@@ -18,20 +24,19 @@ from .similarity import (
 )
 
 # Research dedup (FAISS-based) - may not be available if numpy/faiss not installed
-try:
-    from .research import (
-        get_embedding,
-        get_embedding_async,
-        OllamaEmbedder,
-        FaissIndex,
-        check_duplicate,
-        add_card_to_index,
-        get_dedup_signal,
-        DedupResult,
-    )
-    RESEARCH_DEDUP_AVAILABLE = True
-except ImportError:
-    RESEARCH_DEDUP_AVAILABLE = False
+# (the index module needs numpy; faiss itself is optional there)
+RESEARCH_DEDUP_AVAILABLE = find_spec("numpy") is not None
+
+_RESEARCH_EXPORTS = (
+    "get_embedding",
+    "get_embedding_async",
+    "OllamaEmbedder",
+    "FaissIndex",
+    "check_duplicate",
+    "add_card_to_index",
+    "get_dedup_signal",
+    "DedupResult",
+)
 
 __all__ = [
     # Story similarity
@@ -48,13 +53,13 @@ __all__ = [
 
 # Add research dedup exports only if available
 if RESEARCH_DEDUP_AVAILABLE:
-    __all__.extend([
-        "get_embedding",
-        "get_embedding_async",
-        "OllamaEmbedder",
-        "FaissIndex",
-        "check_duplicate",
-        "add_card_to_index",
-        "get_dedup_signal",
-        "DedupResult",
-    ])
+    __all__.extend(_RESEARCH_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the research dedup package on first access to one of its exports."""
+    if name in _RESEARCH_EXPORTS and RESEARCH_DEDUP_AVAILABLE:
+        value = getattr(importlib.import_module(".research", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
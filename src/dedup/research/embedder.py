@@ -10,13 +10,12 @@ import json
 import logging
 import urllib.request
 import urllib.error
+from importlib.util import find_spec
 from typing import List, Optional
 
-try:
-    import httpx
-    HTTPX_AVAILABLE = True
-except ImportError:
-    HTTPX_AVAILABLE = False
+# httpx is imported by the async methods that use it, so importing this
+# module (e.g. via src.dedup for story similarity) does not load it
+HTTPX_AVAILABLE = find_spec("httpx") is not None
 
 logger = logging.getLogger("horror_story_generator")
 
@@ -162,6 +161,8 @@ class OllamaEmbedder:
             "input": text.strip()
         }
 
+        import httpx
+
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(url, json=payload)
@@ -244,6 +245,8 @@ class OllamaEmbedder:
             loop = asyncio.get_event_loop()
             return await loop.run_in_executor(None, self.is_available)
 
+        import httpx
+
         try:
             url = f"{self.base_url}/api/tags"
             async with httpx.AsyncClient(timeout=5) as client:
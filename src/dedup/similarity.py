@@ -5,14 +5,20 @@ Phase 2B: In-memory generation memory for similarity observation.
 Phase 2C: HIGH-only dedup control functions.
 """
 
+import hashlib
 import logging
+import os
 import re
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Tuple
 
 logger = logging.getLogger("horror_story_generator")
 
+_WORD_RE = re.compile(r'\w+')  # summary word tokens for Jaccard similarity
+_WHITESPACE_RE = re.compile(r'\s+')  # whitespace runs collapsed for content hashing
+
 
 # =============================================================================
 # Phase 2B: Generation Memory (In-Process Only, Observation Only)
@@ -22,19 +28,171 @@ logger = logging.getLogger("horror_story_generator")
 # It resets on process restart. No disk persistence.
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenerationRecord:
-    """Phase 2B: Single generation record for similarity observation."""
+    """Phase 2B: Single generation record for similarity observation (immutable)."""
     story_id: str
     template_id: Optional[str]
     title: str
     semantic_summary: str  # 1-3 sentence summary for comparison
     canonical_keys: Dict[str, str]  # setting, primary_fear, etc.
     generated_at: str
+    content_hash: Optional[bytes] = None  # story_content_hash() of the story text, if known
+    # Derived once at creation for similarity scans
+    word_set: FrozenSet[str] = field(init=False, repr=False, compare=False)  # summary words
+    canonical_pairs: FrozenSet[Tuple[str, str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "word_set", _summary_words(self.semantic_summary))
+        object.__setattr__(self, "canonical_pairs", _normalize_canonical_keys(self.canonical_keys))
+
+
+def _normalize_canonical_keys(canonical_keys: Dict[str, str]) -> FrozenSet[Tuple[str, str]]:
+    """Phase 2B: Canonical keys as (key, normalized value) pairs for set matching."""
+    return frozenset(
+        (k, str(v).strip().casefold()) for k, v in canonical_keys.items() if v
+    )
+
 
+# Maximum number of records kept in generation memory (oldest dropped first)
+GEN_MEMORY_SIZE = int(os.getenv("GEN_MEMORY_SIZE", "1024"))
 
 # Phase 2B: In-memory generation registry (process-scoped only, not persisted)
-_generation_memory: List[GenerationRecord] = []
+_generation_memory: Deque[GenerationRecord] = deque(maxlen=GEN_MEMORY_SIZE)
+
+# Word sets of each record's semantic_summary as (bitset, word count), parallel
+# to _generation_memory. Computed once at insert so a similarity scan only
+# tokenizes the new summary; |A ∩ B| is then a single int AND + popcount.
+_generation_word_bits: Deque[Tuple[int, int]] = deque(maxlen=GEN_MEMORY_SIZE)
+
+# Word -> bit index for the bitsets above. Grows with distinct summary words
+# and is compacted to the live vocabulary once the memory has fully turned
+# over (see _compact_word_index); reset by clear_generation_memory().
+_word_bit_index: Dict[str, int] = {}
+
+# Records evicted from the full memory since the last word index compaction
+_evictions_since_compaction = 0
+
+# Normalized story content hash -> newest record with that story text.
+# Lets an exact repeat (retries, cron re-runs) reuse the stored summary
+# instead of paying for another summary request. Entries leave with
+# their records.
+_content_hash_index: Dict[bytes, GenerationRecord] = {}
+
+
+def story_content_hash(story_text: str) -> bytes:
+    """Phase 2B: SHA-256 of the story text, lowercased with whitespace runs collapsed."""
+    normalized = _WHITESPACE_RE.sub(' ', story_text.strip().lower())
+    return hashlib.sha256(normalized.encode('utf-8')).digest()
+
+
+def find_summary_by_content(story_text: str) -> Optional[str]:
+    """
+    Phase 2B: Return the stored summary of an identical story already in memory.
+
+    Stories are compared by story_content_hash(), so case and whitespace
+    differences are ignored.
+
+    Args:
+        story_text: Full story text
+
+    Returns:
+        Optional[str]: Semantic summary of the matching record, or None
+    """
+    record = _content_hash_index.get(story_content_hash(story_text))
+    return record.semantic_summary if record else None
+
+
+def _summary_words(text: str) -> FrozenSet[str]:
+    """Phase 2B: Lowercased word set used for Jaccard similarity."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+def _words_to_bits(words: FrozenSet[str], register: bool = True) -> int:
+    """
+    Phase 2B: Encode a word set as an int bitset over _word_bit_index.
+
+    Query sets are encoded with register=False: words never stored in memory
+    cannot intersect any record, so they are left out of the bitset (they
+    still count towards the set size kept alongside it).
+    """
+    bits = 0
+    for word in words:
+        index = _word_bit_index.get(word)
+        if index is None:
+            if not register:
+                continue
+            index = _word_bit_index[word] = len(_word_bit_index)
+        bits |= 1 << index
+    return bits
+
+
+def _append_to_memory(record: GenerationRecord) -> None:
+    """Phase 2B: Append a record and its word bitset, keeping both deques aligned."""
+    global _evictions_since_compaction
+
+    capacity = _generation_memory.maxlen
+    if capacity and len(_generation_memory) == capacity:
+        _evictions_since_compaction += 1
+        evicted = _generation_memory[0]
+        if evicted.content_hash is not None and _content_hash_index.get(evicted.content_hash) is evicted:
+            del _content_hash_index[evicted.content_hash]
+
+    _generation_memory.append(record)
+    if record.content_hash is not None:
+        _content_hash_index[record.content_hash] = record
+    _generation_word_bits.append((_words_to_bits(record.word_set), len(record.word_set)))
+
+    if capacity and _evictions_since_compaction >= capacity:
+        _compact_word_index()
+
+
+def _extend_memory(records: List[GenerationRecord]) -> None:
+    """
+    Phase 2B: Append several records at once, oldest first.
+
+    When they fit without evicting anything (the warm-start case) the
+    deques and the content hash index are extended in one pass each;
+    otherwise records go through _append_to_memory one by one so
+    eviction bookkeeping stays exact.
+    """
+    capacity = _generation_memory.maxlen
+    if capacity and len(_generation_memory) + len(records) > capacity:
+        for record in records:
+            _append_to_memory(record)
+        return
+
+    _generation_memory.extend(records)
+    _generation_word_bits.extend([(_words_to_bits(r.word_set), len(r.word_set)) for r in records])
+    _content_hash_index.update({r.content_hash: r for r in records if r.content_hash is not None})
+
+
+def _compact_word_index() -> None:
+    """
+    Phase 2B: Rebuild _word_bit_index from the records still in memory.
+
+    Words of evicted records keep their bit positions until this runs, so
+    without it the index (and every bitset's width) would grow for the life
+    of the process. Called once per full memory turnover, which keeps the
+    rebuild cost amortized to a single re-encode per inserted record.
+    """
+    global _evictions_since_compaction
+
+    _word_bit_index.clear()
+    word_bits = [(_words_to_bits(r.word_set), len(r.word_set)) for r in _generation_memory]
+    _generation_word_bits.clear()
+    _generation_word_bits.extend(word_bits)
+    _evictions_since_compaction = 0
+
+
+def _jaccard(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+    """Phase 2B: Jaccard similarity of two precomputed word sets."""
+    if not words1 or not words2:
+        return 0.0
+
+    intersection = len(words1 & words2)
+    # |A ∪ B| = |A| + |B| - |A ∩ B| (avoids building the union set)
+    return intersection / (len(words1) + len(words2) - intersection)
 
 
 def compute_text_similarity(text1: str, text2: str) -> float:
@@ -52,22 +210,28 @@ def compute_text_similarity(text1: str, text2: str) -> float:
         float: Similarity score between 0.0 and 1.0
     """
     # Simple word-based Jaccard similarity (no external deps)
-    words1 = set(re.findall(r'\w+', text1.lower()))
-    words2 = set(re.findall(r'\w+', text2.lower()))
-
-    if not words1 or not words2:
-        return 0.0
+    return _jaccard(_summary_words(text1), _summary_words(text2))
 
-    intersection = len(words1 & words2)
-    union = len(words1 | words2)
 
-    return intersection / union if union > 0 else 0.0
+# Observation result banner, emitted as a single multi-line record
+_OBSERVE_BANNER = "\n".join([
+    "[Phase2B][OBSERVE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+    "[Phase2B][OBSERVE] 유사도 관측 결과:",
+    "[Phase2B][OBSERVE]   현재: \"%s\"",
+    "[Phase2B][OBSERVE]   가장 유사: \"%s\" (ID: %s)",
+    "[Phase2B][OBSERVE]   텍스트 유사도: %.2f%%",
+    "[Phase2B][OBSERVE]   정규화 키 일치: %d/5",
+    "[Phase2B][OBSERVE]   신호 수준: %s",
+    "[Phase2B][OBSERVE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+    "[Phase2B][OBSERVE] ⚠️ 이 관측은 생성에 영향을 주지 않습니다",
+])
 
 
 def observe_similarity(
     current_summary: str,
     current_title: str,
-    canonical_keys: Dict[str, str]
+    canonical_keys: Dict[str, str],
+    stop_at_high: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Phase 2B: Observe similarity between current story and existing stories.
@@ -80,6 +244,12 @@ def observe_similarity(
         current_summary: Semantic summary of current story
         current_title: Current story title
         canonical_keys: Canonical keys of current story (setting, primary_fear, etc.)
+        stop_at_high: Stop at the first HIGH match. The signal is unchanged,
+                      but the reported closest story is that match rather
+                      than the global maximum. For callers that only need
+                      the signal. Records are scanned oldest-first either
+                      way, and only a strictly higher score replaces the best
+                      match, so ties resolve to the oldest record.
 
     Returns:
         Optional[Dict]: Similarity observation result (most similar story info)
@@ -90,26 +260,31 @@ def observe_similarity(
         logger.info("[Phase2B][OBSERVE] 첫 번째 생성 - 비교 대상 없음")
         return None
 
-    logger.info(f"[Phase2B][OBSERVE] 유사도 관측 시작 (기존 {len(_generation_memory)}개 스토리와 비교)")
+    logger.info("[Phase2B][OBSERVE] 유사도 관측 시작 (기존 %d개 스토리와 비교)", len(_generation_memory))
 
     highest_similarity = 0.0
     most_similar_record: Optional[GenerationRecord] = None
     canonical_match_count = 0
 
-    for record in _generation_memory:
-        # Text similarity
-        sim = compute_text_similarity(current_summary, record.semantic_summary)
+    current_words = _summary_words(current_summary)
+    current_bits = _words_to_bits(current_words, register=False)
+    current_count = len(current_words)
+    current_pairs = _normalize_canonical_keys(canonical_keys)
 
-        # Canonical key matching (bonus signal)
-        key_matches = sum(
-            1 for k, v in canonical_keys.items()
-            if record.canonical_keys.get(k) == v
-        )
+    for record, (record_bits, record_count) in zip(_generation_memory, _generation_word_bits):
+        # Text similarity (Jaccard on bitsets, same result as compute_text_similarity)
+        if not current_count or not record_count:
+            continue
+        intersection = (current_bits & record_bits).bit_count()
+        sim = intersection / (current_count + record_count - intersection)
 
         if sim > highest_similarity:
             highest_similarity = sim
             most_similar_record = record
-            canonical_match_count = key_matches
+            # Canonical key matching (bonus signal)
+            canonical_match_count = len(current_pairs & record.canonical_pairs)
+            if stop_at_high and sim >= 0.5:
+                break
 
     # Determine signal level (for observation only)
     if highest_similarity >= 0.5:
@@ -121,15 +296,15 @@ def observe_similarity(
 
     # Log observation (THIS IS THE KEY OUTPUT - observation only)
     if most_similar_record:
-        logger.info(f"[Phase2B][OBSERVE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        logger.info(f"[Phase2B][OBSERVE] 유사도 관측 결과:")
-        logger.info(f"[Phase2B][OBSERVE]   현재: \"{current_title}\"")
-        logger.info(f"[Phase2B][OBSERVE]   가장 유사: \"{most_similar_record.title}\" (ID: {most_similar_record.story_id})")
-        logger.info(f"[Phase2B][OBSERVE]   텍스트 유사도: {highest_similarity:.2%}")
-        logger.info(f"[Phase2B][OBSERVE]   정규화 키 일치: {canonical_match_count}/5")
-        logger.info(f"[Phase2B][OBSERVE]   신호 수준: {signal}")
-        logger.info(f"[Phase2B][OBSERVE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        logger.info(f"[Phase2B][OBSERVE] ⚠️ 이 관측은 생성에 영향을 주지 않습니다")
+        # One record for the whole banner; formatting is deferred until emitted
+        logger.info(
+            _OBSERVE_BANNER,
+            current_title,
+            most_similar_record.title, most_similar_record.story_id,
+            highest_similarity * 100,
+            canonical_match_count,
+            signal
+        )
 
         return {
             "closest_story_id": most_similar_record.story_id,
@@ -147,13 +322,15 @@ def add_to_generation_memory(
     template_id: Optional[str],
     title: str,
     semantic_summary: str,
-    canonical_keys: Dict[str, str]
+    canonical_keys: Dict[str, str],
+    story_text: Optional[str] = None
 ) -> None:
     """
     Phase 2B: Add generated story to memory.
 
     This memory is deleted on process termination.
-    Not saved to disk.
+    Not saved to disk. Holds at most GEN_MEMORY_SIZE records; the oldest
+    record is dropped when full.
 
     Args:
         story_id: Unique story ID
@@ -161,6 +338,8 @@ def add_to_generation_memory(
         title: Story title
         semantic_summary: Semantic summary
         canonical_keys: Canonical keys
+        story_text: Full story text; when given, an identical later story
+            can reuse this summary (see find_summary_by_content)
     """
     global _generation_memory
 
@@ -170,11 +349,12 @@ def add_to_generation_memory(
         title=title,
         semantic_summary=semantic_summary,
         canonical_keys=canonical_keys,
-        generated_at=datetime.now().isoformat()
+        generated_at=datetime.now().isoformat(),
+        content_hash=story_content_hash(story_text) if story_text is not None else None
     )
 
-    _generation_memory.append(record)
-    logger.info(f"[Phase2B][OBSERVE] 생성 메모리에 추가: {story_id} (총 {len(_generation_memory)}개)")
+    _append_to_memory(record)
+    logger.info("[Phase2B][OBSERVE] 생성 메모리에 추가: %s (총 %d개)", story_id, len(_generation_memory))
 
 
 # =============================================================================
@@ -187,19 +367,22 @@ def load_past_stories_into_memory(records: List[Any]) -> int:
 
     Converts records loaded from SQLite registry to Phase 2B memory structure.
     This connects Phase 2B (in-memory) and Phase 2C (persistent).
+    At most GEN_MEMORY_SIZE records are loaded.
 
     Args:
-        records: StoryRegistryRecord list (from story_registry.load_recent_accepted)
+        records: StoryRegistryRecord list, newest first
+            (from story_registry.load_recent_accepted)
 
     Returns:
         int: Number of records loaded
     """
     global _generation_memory
 
-    loaded = 0
-    for record in records:
-        # StoryRegistryRecord → GenerationRecord conversion
-        gen_record = GenerationRecord(
+    # Records arrive newest first: keep the most recent ones that fit and
+    # insert them oldest first so the deque evicts in chronological order
+    # (StoryRegistryRecord → GenerationRecord conversion)
+    gen_records = [
+        GenerationRecord(
             story_id=record.id,
             template_id=record.template_id,
             title=record.title or "Unknown",
@@ -207,10 +390,12 @@ def load_past_stories_into_memory(records: List[Any]) -> int:
             canonical_keys={},  # canonical_keys not stored in DB (outside Phase 2C scope)
             generated_at=record.created_at
         )
-        _generation_memory.append(gen_record)
-        loaded += 1
+        for record in reversed(records[:GEN_MEMORY_SIZE])
+    ]
+    _extend_memory(gen_records)
+    loaded = len(gen_records)
 
-    logger.info(f"[Phase2C][CONTROL] 과거 스토리 {loaded}개를 in-memory에 로드")
+    logger.info("[Phase2C][CONTROL] 과거 스토리 %d개를 in-memory에 로드", loaded)
     return loaded
 
 
@@ -253,6 +438,11 @@ def get_generation_memory_count() -> int:
 
 def clear_generation_memory() -> None:
     """Clear the generation memory. Useful for testing."""
-    global _generation_memory
-    _generation_memory = []
+    global _generation_memory, _generation_word_bits, _word_bit_index, _evictions_since_compaction
+    global _content_hash_index
+    _generation_memory = deque(maxlen=GEN_MEMORY_SIZE)
+    _generation_word_bits = deque(maxlen=GEN_MEMORY_SIZE)
+    _word_bit_index = {}
+    _evictions_since_compaction = 0
+    _content_hash_index = {}
     logger.info("[Phase2B][OBSERVE] 생성 메모리 초기화 완료")
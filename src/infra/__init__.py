@@ -18,6 +18,8 @@ from .data_paths import (
 
 from .logging_config import setup_logging
 
+from .json_io import read_json, write_bytes_atomic, write_json
+
 from .job_manager import (
     Job,
     JobStatus,
@@ -54,6 +56,10 @@ __all__ = [
     "ensure_data_directories",
     # logging
     "setup_logging",
+    # json_io
+    "read_json",
+    "write_bytes_atomic",
+    "write_json",
     # job_manager
     "Job",
     "JobStatus",
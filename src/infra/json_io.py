@@ -0,0 +1,136 @@
+"""
+JSON read/write helpers.
+
+Uses orjson when it is installed (faster parsing and serialization, works
+directly on UTF-8 bytes) and falls back to the standard library json module
+otherwise. Output is UTF-8 without ASCII escaping in both cases, and the
+fallback uses orjson's compact separators so both produce the same bytes.
+
+Files are written atomically: the content goes to a temporary file in the
+same directory, which then replaces the target, so readers never observe a
+partially written file.
+"""
+
+import json
+import os
+import secrets
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Temp files are created like open() would (0666 minus the current umask,
+# applied by the kernel), unlike mkstemp's 0600.
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _create_temp_file(path: Path) -> tuple[int, Path]:
+    """
+    Create a uniquely named temporary file next to path.
+
+    Returns:
+        tuple[int, Path]: (file descriptor, temporary file path)
+    """
+    while True:
+        tmp_path = path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp"
+        try:
+            return os.open(tmp_path, _TMP_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON document as UTF-8 bytes or str
+
+    Returns:
+        Any: Parsed value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize a value to UTF-8 encoded JSON.
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file in a single read.
+
+    Args:
+        path: File path
+
+    Returns:
+        Any: Parsed value
+    """
+    return loads(Path(path).read_bytes())
+
+
+def write_bytes_atomic(path: Union[str, Path], data: bytes) -> None:
+    """
+    Write bytes to a file atomically in a single write.
+
+    The data is not fsync'd: atomicity guards against torn files, not
+    against losing the last write on power failure, and generated content
+    can be regenerated after a crash. The temporary file is removed if
+    writing fails; an existing target is left untouched in that case.
+
+    Args:
+        path: File path
+        data: File content
+    """
+    path = Path(path)
+    fd, tmp_path = _create_temp_file(path)
+    try:
+        # Raw os.write on the descriptor: no buffered file object to flush
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_json(path: Union[str, Path], obj: Any, indent: bool = True) -> None:
+    """
+    Serialize a value and write it to a file atomically in a single write.
+
+    Args:
+        path: File path
+        obj: Value to serialize
+        indent: Pretty-print with 2-space indentation (default True)
+    """
+    write_bytes_atomic(path, dumps(obj, indent=indent))
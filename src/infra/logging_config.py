@@ -4,14 +4,40 @@ Logging configuration module.
 Phase 3B: Daily log rotation with process start time tracking.
 """
 
+import atexit
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import time
 from pathlib import Path
 from typing import Optional
 
 # Process start time is captured once and reused for all daily logs
 _PROCESS_START_TIME: Optional[str] = None
 
+# Log file write buffer (bytes); records are coalesced instead of flushed one by one
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+
+# Level applied by the last full setup_logging() call (None = not configured)
+_CONFIGURED_LEVEL: Optional[int] = None
+
+# Background thread writing queued records to the daily log file
+_QUEUE_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Drain pending records to the log file and stop the listener thread."""
+    global _QUEUE_LISTENER
+
+    if _QUEUE_LISTENER is not None:
+        _QUEUE_LISTENER.stop()
+        _QUEUE_LISTENER = None
+
+
+# Runs before logging.shutdown() (atexit is LIFO), so queued records are
+# written before the file handler is flushed and closed
+atexit.register(_stop_queue_listener)
+
 
 class DailyRotatingFileHandler(logging.FileHandler):
     """
@@ -21,9 +47,22 @@ class DailyRotatingFileHandler(logging.FileHandler):
     logs/horror_story_YYYYMMDD_<START_HHMMSS>.log
 
     START_HHMMSS is fixed at process start, only YYYYMMDD changes.
+
+    Writes go through a large file buffer instead of being flushed per
+    record; the buffer is flushed when a record at or above flush_level
+    is emitted, on rotation, and on close (logging.shutdown at exit).
+
+    The log file is opened on the first emitted record, so processes that
+    never log do not leave empty log files behind.
     """
 
-    def __init__(self, log_dir: str = "logs", encoding: str = "utf-8"):
+    def __init__(
+        self,
+        log_dir: str = "logs",
+        encoding: str = "utf-8",
+        buffer_size: int = LOG_FILE_BUFFER_SIZE,
+        flush_level: int = logging.ERROR
+    ):
         global _PROCESS_START_TIME
 
         self.log_dir = Path(log_dir)
@@ -31,37 +70,69 @@ class DailyRotatingFileHandler(logging.FileHandler):
 
         # Capture process start time once
         if _PROCESS_START_TIME is None:
-            _PROCESS_START_TIME = datetime.now().strftime("%H%M%S")
+            _PROCESS_START_TIME = time.strftime("%H%M%S")
 
         self._start_hhmmss = _PROCESS_START_TIME
         self._current_date: Optional[str] = None
         self._encoding = encoding
+        self._buffer_size = buffer_size
+        self.flush_level = flush_level
 
-        # Initialize with current date's log file
+        # Initialize with current date's log file (opened on first emit)
         initial_path = self._get_current_log_path()
-        super().__init__(initial_path, mode='a', encoding=encoding)
-        self._current_date = datetime.now().strftime("%Y%m%d")
+        super().__init__(initial_path, mode='a', encoding=encoding, delay=True)
+        self._current_date = time.strftime("%Y%m%d")
+        self._next_rollover = self._compute_next_rollover()
 
     def _get_current_log_path(self) -> str:
         """Get log file path for current date."""
-        date_str = datetime.now().strftime("%Y%m%d")
+        date_str = time.strftime("%Y%m%d")
         return str(self.log_dir / f"horror_story_{date_str}_{self._start_hhmmss}.log")
 
+    @staticmethod
+    def _compute_next_rollover() -> float:
+        """Return the epoch timestamp of the next local midnight."""
+        now = time.localtime()
+        return time.mktime((now.tm_year, now.tm_mon, now.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+
+    def _open(self):
+        """Open the current log file with the configured write buffer."""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self._buffer_size,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a record, rotating to new file if date changed."""
-        current_date = datetime.now().strftime("%Y%m%d")
-
-        # Check if we need to rotate (date changed)
-        if self._current_date != current_date:
-            # Close current file
-            self.close()
-
-            # Update to new file
-            self.baseFilename = self._get_current_log_path()
-            self._current_date = current_date
-            self.stream = self._open()
-
-        super().emit(record)
+        # Cheap float compare per record; the date string is only
+        # re-formatted once the next local midnight has passed
+        if time.time() >= self._next_rollover:
+            current_date = time.strftime("%Y%m%d")
+            self._next_rollover = self._compute_next_rollover()
+
+            # Check if we need to rotate (date changed)
+            if self._current_date != current_date:
+                # Close current file
+                self.close()
+
+                # Update to new file (opened below on write)
+                self.baseFilename = self._get_current_log_path()
+                self._current_date = current_date
+
+        # Buffered write: flush only for high-severity records
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
@@ -73,17 +144,38 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
 
     Format: logs/horror_story_YYYYMMDD_<START_HHMMSS>.log
 
+    Repeated calls (module import, load_environment, CLI entry points) reuse
+    the handlers installed by the first call instead of rebuilding them;
+    only the level is updated in place when it changed.
+
+    File writes happen on a QueueListener thread: the logger only enqueues
+    records through a QueueHandler, so disk I/O stays off the generation
+    path. Pending records are written at interpreter exit.
+
     Args:
         log_level (str): Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
 
     Returns:
         logging.Logger: Configured logger instance
     """
+    global _CONFIGURED_LEVEL, _QUEUE_LISTENER
+
     # Set logging level
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
 
     # Configure logger
     logger = logging.getLogger("horror_story_generator")
+
+    # Already configured: keep existing handlers (no new log file)
+    if logger.handlers and _CONFIGURED_LEVEL is not None:
+        if _CONFIGURED_LEVEL != numeric_level:
+            logger.setLevel(numeric_level)
+            for handler in logger.handlers:
+                handler.setLevel(numeric_level)
+            _CONFIGURED_LEVEL = numeric_level
+            logger.info(f"로깅 레벨 변경: {log_level}")
+        return logger
+
     logger.setLevel(numeric_level)
 
     # Prevent propagation to root logger (avoid duplicate logs)
@@ -102,11 +194,21 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
-    # Phase 3B: Daily rotation file handler
+    # Phase 3B: Daily rotation file handler, fed from a queue on a
+    # background thread (the queue handler's level gates what is written)
+    _stop_queue_listener()
     file_handler = DailyRotatingFileHandler(log_dir="logs", encoding='utf-8')
-    file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(numeric_level)
+    logger.addHandler(queue_handler)
+
+    _QUEUE_LISTENER = logging.handlers.QueueListener(log_queue, file_handler)
+    _QUEUE_LISTENER.start()
+
+    _CONFIGURED_LEVEL = numeric_level
 
     # Log the current log file path
     log_filename = file_handler.baseFilename
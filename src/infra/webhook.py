@@ -10,7 +10,6 @@ import logging
 import threading
 from datetime import datetime
 from typing import Any, Dict, Optional
-import httpx
 
 from src.infra.job_manager import Job, WebhookEvent, save_job
 
@@ -67,6 +66,8 @@ async def send_webhook_async(
     Returns:
         Tuple of (success: bool, error_message: Optional[str])
     """
+    import httpx  # deferred: only needed when a webhook is actually sent
+
     payload = build_webhook_payload(job)
     last_error: Optional[str] = None
 
@@ -151,6 +152,8 @@ def send_webhook_sync(
     Returns:
         Tuple of (success: bool, error_message: Optional[str])
     """
+    import httpx  # deferred: only needed when a webhook is actually sent
+
     payload = build_webhook_payload(job)
     last_error: Optional[str] = None
 
@@ -411,6 +414,8 @@ def _send_webhook_in_thread(
     This runs in a separate thread for fire-and-forget behavior.
     v1.4.4: Supports both standard and Discord webhook formats.
     """
+    import httpx  # deferred: only needed when a webhook is actually sent
+
     last_error: Optional[str] = None
     is_discord = is_discord_webhook_url(url)
 
@@ -16,6 +16,8 @@ from .config import (
 
 logger = logging.getLogger(__name__)
 
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)  # markdown code fences
+
 
 def extract_json_from_response(raw_response: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """
@@ -42,8 +44,7 @@ def extract_json_from_response(raw_response: str) -> Tuple[Optional[Dict[str, An
         pass
 
     # Try to extract JSON from markdown code block
-    code_block_pattern = r"```(?:json)?\s*\n?(.*?)\n?```"
-    matches = re.findall(code_block_pattern, text, re.DOTALL)
+    matches = _CODE_BLOCK_RE.findall(text)
     for match in matches:
         try:
             return json.loads(match.strip()), None
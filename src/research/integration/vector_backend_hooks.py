@@ -11,9 +11,12 @@ v1.4.0: Implemented using existing dedup infrastructure.
 
 import logging
 import os
-from typing import Dict, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
-import numpy as np
+# numpy is imported inside the functions that compute on vectors, so importing
+# the research package (pulled in by story generation) does not load it.
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -299,6 +302,8 @@ def compute_semantic_affinity(
         return 0.0
 
     try:
+        import numpy as np
+
         # Create template text from canonical dimensions
         template_parts = []
         for key, value in template_canonical.items():
@@ -376,6 +381,7 @@ def cluster_research_cards(
         return {}
 
     try:
+        import numpy as np
         from src.dedup.research.embedder import create_card_text_for_embedding
 
         # Generate embeddings for all cards
@@ -463,8 +469,10 @@ def cluster_research_cards(
         return {}
 
 
-def _kmeans_plusplus_init(X: np.ndarray, n_clusters: int) -> np.ndarray:
+def _kmeans_plusplus_init(X: "np.ndarray", n_clusters: int) -> "np.ndarray":
     """Initialize centroids using k-means++."""
+    import numpy as np
+
     n_samples = len(X)
     centroids = []
 
@@ -484,8 +492,10 @@ def _kmeans_plusplus_init(X: np.ndarray, n_clusters: int) -> np.ndarray:
     return np.array(centroids)
 
 
-def _compute_distances(X: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+def _compute_distances(X: "np.ndarray", centroids: "np.ndarray") -> "np.ndarray":
     """Compute distances between points and centroids."""
+    import numpy as np
+
     # Using squared Euclidean distance (equivalent to 1 - cosine for normalized vectors)
     # X: (n_samples, dim), centroids: (n_clusters, dim)
     # Result: (n_samples, n_clusters)
@@ -5,15 +5,149 @@ Handles all LLM API interactions for story generation.
 Supports multiple providers: Claude (Anthropic), Ollama.
 """
 
+import asyncio
+import functools
+import importlib.util
 import logging
-from typing import Any, Dict, Optional, Union
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-import anthropic
+# anthropic (httpx, pydantic, ...) is imported lazily where a client is built,
+# so importing the generator stays cheap for commands that never call the API.
+if TYPE_CHECKING:
+    import anthropic
 
 from .model_provider import get_provider, get_model_info, GenerationResult
+from .prompt_builder import split_system_prompt
 
 logger = logging.getLogger("horror_story_generator")
 
+# Optional aiohttp transport for AsyncAnthropic (pip install anthropic[aiohttp])
+AIOHTTP_AVAILABLE = importlib.util.find_spec("aiohttp") is not None
+
+# Optional HTTP/2 support for the shared sync client (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Client-side Anthropic rate limits for concurrent generation (0 disables).
+# Defaults to ~80% of tier-1 so bursts stay clear of 429 retry storms.
+ANTHROPIC_REQUESTS_PER_MINUTE = int(os.getenv("ANTHROPIC_REQUESTS_PER_MINUTE", "40"))
+ANTHROPIC_TOKENS_PER_MINUTE = int(os.getenv("ANTHROPIC_TOKENS_PER_MINUTE", "16000"))
+
+# Connection pool size of the shared sync client. Covers the parallel
+# generation workers plus the summary calls that overlap them.
+CLIENT_MAX_CONNECTIONS = 32
+
+
+# Usage fields describing prompt cache reads/writes (input_tokens excludes both)
+_CACHE_USAGE_FIELDS = ("cache_read_input_tokens", "cache_creation_input_tokens")
+
+
+def _message_to_result(message: Any) -> Dict[str, Any]:
+    """
+    Convert an Anthropic Message into the story result dict.
+
+    Shared by the sync and async call paths.
+
+    Args:
+        message: Anthropic Messages API response
+
+    Returns:
+        Dict[str, Any]: story_text and usage (None if usage is missing)
+    """
+    story_text = message.content[0].text
+
+    # Phase 1: Defensive usage extraction - handle missing usage gracefully
+    if hasattr(message, 'usage') and message.usage:
+        try:
+            usage = {
+                "input_tokens": message.usage.input_tokens,
+                "output_tokens": message.usage.output_tokens,
+                "total_tokens": message.usage.input_tokens + message.usage.output_tokens
+            }
+            # Prompt cache activity for the cached system prefix (see
+            # build_system_blocks); only recorded when the API reports it
+            for field in _CACHE_USAGE_FIELDS:
+                value = getattr(message.usage, field, None)
+                if isinstance(value, int):
+                    usage[field] = value
+            logger.info(f"소설 생성 완료 - 길이: {len(story_text)}자")
+            logger.info(f"토큰 사용량 - Input: {usage['input_tokens']}, Output: {usage['output_tokens']}, Total: {usage['total_tokens']}")
+            if "cache_read_input_tokens" in usage or "cache_creation_input_tokens" in usage:
+                logger.info(
+                    "프롬프트 캐시 - Read: %d, Write: %d",
+                    usage.get("cache_read_input_tokens", 0),
+                    usage.get("cache_creation_input_tokens", 0)
+                )
+        except (AttributeError, TypeError) as e:
+            logger.warning(f"토큰 사용량 추출 실패 (usage 구조 이상): {e}")
+            usage = None
+    else:
+        logger.warning("토큰 사용량 정보 없음 (message.usage missing)")
+        usage = None
+
+    return {
+        "story_text": story_text,
+        "usage": usage
+    }
+
+
+def build_system_blocks(system_prompt: str) -> List[Dict[str, Any]]:
+    """
+    Convert a system prompt into Messages API blocks with prompt caching.
+
+    The static prefix (see split_system_prompt) is marked with an
+    ephemeral cache_control breakpoint so repeated generations reuse it;
+    the per-session suffix is sent as a separate, uncached block.
+    Prefixes shorter than the model's minimum cacheable length are
+    simply processed without caching.
+
+    Args:
+        system_prompt (str): Full system prompt
+
+    Returns:
+        List[Dict[str, Any]]: Value for the `system` request parameter
+    """
+    static_part, dynamic_part = split_system_prompt(system_prompt)
+    blocks: List[Dict[str, Any]] = [
+        {"type": "text", "text": static_part, "cache_control": {"type": "ephemeral"}}
+    ]
+    if dynamic_part:
+        blocks.append({"type": "text", "text": dynamic_part})
+    return blocks
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(api_key: str) -> "anthropic.Anthropic":
+    """
+    Return a shared Anthropic client for the given API key.
+
+    The client owns an httpx connection pool, so reusing it keeps
+    connections alive across generations instead of repeating the TLS
+    handshake per call. The pool keeps up to CLIENT_MAX_CONNECTIONS
+    connections alive and uses HTTP/2 when h2 is installed.
+    The cache is unbounded: API keys per process are few, and an evicted
+    client would leak its open pool since nothing closes it.
+    Use get_client.cache_clear() to drop cached clients.
+
+    Args:
+        api_key (str): Anthropic API key
+
+    Returns:
+        anthropic.Anthropic: Cached client
+    """
+    import anthropic
+    import httpx
+
+    http_client = anthropic.DefaultHttpxClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=CLIENT_MAX_CONNECTIONS
+        )
+    )
+    return anthropic.Anthropic(api_key=api_key, http_client=http_client)
+
 
 def call_claude_api(
     system_prompt: str,
@@ -24,7 +158,9 @@ def call_claude_api(
     Call Claude API to generate a horror story.
 
     Uses Anthropic Messages API to send system and user prompts
-    and returns generated text with token usage.
+    and returns generated text with token usage. The response is
+    streamed, so long generations are received incrementally instead of
+    waiting on a single long-lived request.
 
     Args:
         system_prompt (str): System prompt (writer role and guidelines)
@@ -51,51 +187,319 @@ def call_claude_api(
         >>> print(f"Used {result['usage']['input_tokens']} input tokens")
     """
     logger.info("Claude API 호출 시작...")
-    client = anthropic.Anthropic(api_key=config["api_key"])
+    client = get_client(config["api_key"])
 
     try:
-        message = client.messages.create(
+        with client.messages.stream(
             model=config["model"],
             max_tokens=int(config["max_tokens"]),
             temperature=float(config["temperature"]),
-            system=system_prompt,
+            system=build_system_blocks(system_prompt),
             messages=[
                 {
                     "role": "user",
                     "content": user_prompt
                 }
             ]
+        ) as stream:
+            message = stream.get_final_message()
+
+        return _message_to_result(message)
+
+    except Exception as e:
+        logger.error(f"Claude API 호출 중 오류 발생: {str(e)}", exc_info=True)
+        raise Exception(f"Claude API 호출 중 오류 발생: {str(e)}")
+
+
+def create_async_client(config: Dict[str, Union[str, int, float]]) -> "anthropic.AsyncAnthropic":
+    """
+    Create an AsyncAnthropic client for concurrent generation.
+
+    Uses the aiohttp transport when available (anthropic[aiohttp]),
+    otherwise falls back to the default httpx transport.
+    The caller owns the client and should close it (async with).
+
+    Args:
+        config (Dict[str, Union[str, int, float]]): API configuration with api_key
+
+    Returns:
+        anthropic.AsyncAnthropic: Async client
+    """
+    import anthropic
+
+    if AIOHTTP_AVAILABLE:
+        from anthropic import DefaultAioHttpClient
+
+        return anthropic.AsyncAnthropic(
+            api_key=config["api_key"],
+            http_client=DefaultAioHttpClient()
+        )
+    return anthropic.AsyncAnthropic(api_key=config["api_key"])
+
+
+class AnthropicRateLimiter:
+    """
+    Token-bucket limiter for requests and tokens per minute.
+
+    Shared by all coroutines of one concurrent run. Both buckets start full
+    and refill continuously; acquire() waits until one request and the
+    estimated tokens are available, serving waiters in arrival order.
+    A limit of 0 disables that bucket.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed_minutes = (now - self._updated) / 60.0
+        self._updated = now
+        self._requests = min(
+            float(self.requests_per_minute),
+            self._requests + elapsed_minutes * self.requests_per_minute
+        )
+        self._tokens = min(
+            float(self.tokens_per_minute),
+            self._tokens + elapsed_minutes * self.tokens_per_minute
         )
 
-        story_text = message.content[0].text
+    def _wait_seconds(self, tokens: int) -> float:
+        """Seconds until one request and `tokens` tokens are available (0 if now)."""
+        wait = 0.0
+        if self.requests_per_minute and self._requests < 1:
+            wait = (1 - self._requests) * 60.0 / self.requests_per_minute
+        if self.tokens_per_minute and self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60.0 / self.tokens_per_minute)
+        return wait
+
+    async def acquire(self, estimated_tokens: int = 0) -> None:
+        """
+        Wait for capacity for one request of about `estimated_tokens` tokens.
+
+        Estimates larger than the per-minute budget are capped at it, so an
+        oversized request waits for a full bucket instead of forever.
+        """
+        tokens = min(estimated_tokens, self.tokens_per_minute)
+        async with self._lock:
+            self._refill()
+            wait = self._wait_seconds(tokens)
+            while wait > 0:
+                logger.debug("[RateLimit] %.1f초 대기 (분당 한도 보호)", wait)
+                await asyncio.sleep(wait)
+                self._refill()
+                wait = self._wait_seconds(tokens)
+            if self.requests_per_minute:
+                self._requests -= 1
+            if self.tokens_per_minute:
+                self._tokens -= tokens
+
+
+def estimate_request_tokens(prompt_chars: int, max_tokens: int) -> int:
+    """
+    Rough token cost of a request for rate limiting (~4 chars per input token).
+
+    Anthropic reserves output capacity from max_tokens when a request starts,
+    so the full output budget is counted.
+    """
+    return prompt_chars // 4 + max_tokens
+
+
+async def call_claude_api_async(
+    system_prompt: str,
+    user_prompt: str,
+    config: Dict[str, Union[str, int, float]],
+    client: "anthropic.AsyncAnthropic",
+    rate_limiter: Optional[AnthropicRateLimiter] = None
+) -> Dict[str, Any]:
+    """
+    Async variant of call_claude_api().
+
+    Lets callers overlap several Claude round-trips with asyncio.gather.
+
+    Args:
+        system_prompt (str): System prompt (writer role and guidelines)
+        user_prompt (str): User prompt (specific request)
+        config (Dict[str, Union[str, int, float]]): API configuration
+        client (anthropic.AsyncAnthropic): Shared async client (see create_async_client)
+        rate_limiter (Optional[AnthropicRateLimiter]): Shared limiter awaited before the call
+
+    Returns:
+        Dict[str, Any]: Generation result (story_text, usage)
 
-        # Phase 1: Defensive usage extraction - handle missing usage gracefully
-        if hasattr(message, 'usage') and message.usage:
-            try:
-                usage = {
-                    "input_tokens": message.usage.input_tokens,
-                    "output_tokens": message.usage.output_tokens,
-                    "total_tokens": message.usage.input_tokens + message.usage.output_tokens
+    Raises:
+        Exception: On API call failure
+    """
+    if rate_limiter is not None:
+        await rate_limiter.acquire(estimate_request_tokens(
+            len(system_prompt) + len(user_prompt), int(config["max_tokens"])
+        ))
+
+    logger.info("Claude API 비동기 호출 시작...")
+
+    try:
+        async with client.messages.stream(
+            model=config["model"],
+            max_tokens=int(config["max_tokens"]),
+            temperature=float(config["temperature"]),
+            system=build_system_blocks(system_prompt),
+            messages=[
+                {
+                    "role": "user",
+                    "content": user_prompt
                 }
-                logger.info(f"소설 생성 완료 - 길이: {len(story_text)}자")
-                logger.info(f"토큰 사용량 - Input: {usage['input_tokens']}, Output: {usage['output_tokens']}, Total: {usage['total_tokens']}")
-            except (AttributeError, TypeError) as e:
-                logger.warning(f"토큰 사용량 추출 실패 (usage 구조 이상): {e}")
-                usage = None
-        else:
-            logger.warning("토큰 사용량 정보 없음 (message.usage missing)")
-            usage = None
+            ]
+        ) as stream:
+            message = await stream.get_final_message()
 
-        return {
-            "story_text": story_text,
-            "usage": usage
-        }
+        return _message_to_result(message)
 
     except Exception as e:
-        logger.error(f"Claude API 호출 중 오류 발생: {str(e)}", exc_info=True)
+        logger.error(f"Claude API 비동기 호출 중 오류 발생: {str(e)}", exc_info=True)
         raise Exception(f"Claude API 호출 중 오류 발생: {str(e)}")
 
 
+# Message Batches API polling configuration
+BATCH_POLL_INITIAL_INTERVAL = 5.0   # seconds
+BATCH_POLL_MAX_INTERVAL = 60.0      # seconds
+BATCH_POLL_TIMEOUT = 24 * 60 * 60   # batches expire after 24h
+
+
+def call_claude_batch(
+    requests: List[Dict[str, str]],
+    config: Dict[str, Union[str, int, float]],
+    poll_interval: float = BATCH_POLL_INITIAL_INTERVAL,
+    max_poll_interval: float = BATCH_POLL_MAX_INTERVAL,
+    timeout: float = BATCH_POLL_TIMEOUT
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate multiple stories through the Anthropic Message Batches API.
+
+    Intended for offline/scheduled runs where nobody waits on a single
+    story: batched requests are billed at 50% of the synchronous price and
+    are processed in parallel on the server side. Interactive generation
+    should keep using call_claude_api().
+
+    Args:
+        requests (List[Dict[str, str]]): Requests to submit, each with
+            - custom_id: Unique ID used to match results back to requests
+            - system_prompt: System prompt
+            - user_prompt: User prompt
+        config (Dict[str, Union[str, int, float]]): API configuration
+            (api_key, model, max_tokens, temperature)
+        poll_interval (float): Initial polling interval in seconds
+        max_poll_interval (float): Upper bound for exponential backoff
+        timeout (float): Give up polling after this many seconds
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Results keyed by custom_id
+            - story_text (str): Generated text (succeeded requests)
+            - usage (Dict): Token usage info (succeeded requests)
+            - error (str): Failure reason (errored/canceled/expired requests)
+
+    Raises:
+        Exception: On batch submission failure or polling timeout
+    """
+    if not requests:
+        return {}
+
+    logger.info(f"[Batch] Message Batch 제출 시작 - {len(requests)}건")
+
+    batch_requests = [
+        {
+            "custom_id": req["custom_id"],
+            "params": {
+                "model": config["model"],
+                "max_tokens": int(config["max_tokens"]),
+                "temperature": float(config["temperature"]),
+                "system": build_system_blocks(req["system_prompt"]),
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": req["user_prompt"]
+                    }
+                ]
+            }
+        }
+        for req in requests
+    ]
+
+    try:
+        results: Dict[str, Dict[str, Any]] = {}
+        for custom_id, outcome in _run_message_batch(
+            batch_requests, config, poll_interval, max_poll_interval, timeout
+        ).items():
+            if isinstance(outcome, str):
+                results[custom_id] = {"error": outcome}
+            else:
+                results[custom_id] = _message_to_result(outcome)
+
+        succeeded = sum(1 for r in results.values() if "error" not in r)
+        logger.info(f"[Batch] 완료 - 성공: {succeeded}/{len(requests)}")
+        return results
+
+    except Exception as e:
+        logger.error(f"Claude Batch API 호출 중 오류 발생: {str(e)}", exc_info=True)
+        raise Exception(f"Claude Batch API 호출 중 오류 발생: {str(e)}")
+
+
+def _run_message_batch(
+    batch_requests: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    poll_interval: float,
+    max_poll_interval: float,
+    timeout: float
+) -> Dict[str, Any]:
+    """
+    Submit a Message Batch, poll until it ends and collect its results.
+
+    Args:
+        batch_requests: Batch entries ({"custom_id", "params"})
+        config: API configuration (api_key)
+        poll_interval: Initial polling interval in seconds
+        max_poll_interval: Upper bound for exponential backoff
+        timeout: Give up polling after this many seconds
+
+    Returns:
+        Dict[str, Any]: custom_id -> Message (succeeded) or failure reason (str)
+
+    Raises:
+        TimeoutError: If the batch does not end within timeout
+    """
+    client = get_client(config["api_key"])
+
+    batch = client.messages.batches.create(requests=batch_requests)
+    logger.info(f"[Batch] 제출 완료 - batch_id: {batch.id}")
+
+    # Poll with exponential backoff until processing has ended
+    deadline = time.monotonic() + timeout
+    interval = poll_interval
+    while batch.processing_status != "ended":
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"batch {batch.id} did not finish within {timeout}s")
+        time.sleep(interval)
+        interval = min(interval * 2, max_poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+        logger.debug(f"[Batch] 상태: {batch.processing_status}")
+
+    outcomes: Dict[str, Any] = {}
+    for entry in client.messages.batches.results(batch.id):
+        result_type = entry.result.type
+        if result_type != "succeeded":
+            error = getattr(entry.result, "error", None)
+            outcomes[entry.custom_id] = str(error) if error else result_type
+            logger.warning(f"[Batch] {entry.custom_id} 실패: {outcomes[entry.custom_id]}")
+            continue
+
+        outcomes[entry.custom_id] = entry.result.message
+
+    return outcomes
+
+
 def call_llm_api(
     system_prompt: str,
     user_prompt: str,
@@ -148,6 +552,43 @@ def call_llm_api(
         raise Exception(f"LLM generation failed: {e}")
 
 
+# Story characters sent to the summarizer / used as the fallback summary
+SUMMARY_INPUT_CHARS = 2000
+SUMMARY_FALLBACK_CHARS = 200
+
+SUMMARY_SYSTEM_PROMPT = "You are a story summarizer. Generate a 1-3 sentence summary focusing on: setting, protagonist situation, type of horror, and ending pattern. Be concise and factual."
+
+
+def _summary_request_params(
+    story_text: str,
+    title: str,
+    config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Messages API parameters for a Phase 2B semantic summary request."""
+    # Limit input. Slicing a story that already fits returns the same str
+    # object, so short stories are not copied before formatting.
+    story_preview = story_text[:SUMMARY_INPUT_CHARS]
+
+    # Use a fast, cheap call for summarization
+    return {
+        "model": config["model"],
+        "max_tokens": 200,
+        "temperature": 0.0,  # Deterministic for consistency
+        "system": SUMMARY_SYSTEM_PROMPT,
+        "messages": [
+            {
+                "role": "user",
+                "content": f"Summarize this horror story in 1-3 sentences (Korean):\n\nTitle: {title}\n\n{story_preview}"
+            }
+        ]
+    }
+
+
+def _fallback_summary(story_text: str) -> str:
+    """Phase 2B: Summary used when the summary request fails (story opening)."""
+    return story_text[:SUMMARY_FALLBACK_CHARS].strip()
+
+
 def generate_semantic_summary(
     story_text: str,
     title: str,
@@ -170,27 +611,121 @@ def generate_semantic_summary(
     logger.info("[Phase2B][OBSERVE] 의미적 요약 생성 시작")
 
     try:
-        client = anthropic.Anthropic(api_key=config["api_key"])
-
-        # Use a fast, cheap call for summarization
-        message = client.messages.create(
-            model=config["model"],
-            max_tokens=200,
-            temperature=0.0,  # Deterministic for consistency
-            system="You are a story summarizer. Generate a 1-3 sentence summary focusing on: setting, protagonist situation, type of horror, and ending pattern. Be concise and factual.",
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"Summarize this horror story in 1-3 sentences (Korean):\n\nTitle: {title}\n\n{story_text[:2000]}"  # Limit input
-                }
-            ]
-        )
+        client = get_client(config["api_key"])
+        message = client.messages.create(**_summary_request_params(story_text, title, config))
 
         summary = message.content[0].text.strip()
-        logger.info(f"[Phase2B][OBSERVE] 의미적 요약 생성 완료: {summary[:100]}...")
+        logger.info("[Phase2B][OBSERVE] 의미적 요약 생성 완료: %.100s...", summary)
         return summary
 
     except Exception as e:
-        logger.warning(f"[Phase2B][OBSERVE] 요약 생성 실패, 폴백 사용: {e}")
+        logger.warning("[Phase2B][OBSERVE] 요약 생성 실패, 폴백 사용: %s", e)
         # Fallback: use first 200 chars of story
-        return story_text[:200].strip()
+        return _fallback_summary(story_text)
+
+
+async def generate_semantic_summary_async(
+    story_text: str,
+    title: str,
+    config: Dict[str, Any],
+    client: "anthropic.AsyncAnthropic",
+    rate_limiter: Optional[AnthropicRateLimiter] = None
+) -> str:
+    """
+    Async version of generate_semantic_summary.
+
+    Lets the concurrent generation path overlap the summary request with
+    file writes and with other stories' requests.
+
+    Args:
+        story_text: Full story text
+        title: Story title
+        config: API configuration
+        client: Shared async client (see create_async_client)
+        rate_limiter: Shared limiter awaited before the call
+
+    Returns:
+        str: 1-3 sentence summary (first 200 chars of the story on failure)
+    """
+    logger.info("[Phase2B][OBSERVE] 의미적 요약 생성 시작")
+    params = _summary_request_params(story_text, title, config)
+
+    if rate_limiter is not None:
+        prompt_chars = len(SUMMARY_SYSTEM_PROMPT) + len(params["messages"][0]["content"])
+        await rate_limiter.acquire(estimate_request_tokens(prompt_chars, params["max_tokens"]))
+
+    try:
+        message = await client.messages.create(**params)
+
+        summary = message.content[0].text.strip()
+        logger.info("[Phase2B][OBSERVE] 의미적 요약 생성 완료: %.100s...", summary)
+        return summary
+
+    except Exception as e:
+        logger.warning("[Phase2B][OBSERVE] 요약 생성 실패, 폴백 사용: %s", e)
+        return _fallback_summary(story_text)
+
+
+def generate_semantic_summaries_batch(
+    stories: List[Dict[str, str]],
+    config: Dict[str, Any],
+    poll_interval: float = BATCH_POLL_INITIAL_INTERVAL,
+    max_poll_interval: float = BATCH_POLL_MAX_INTERVAL,
+    timeout: float = BATCH_POLL_TIMEOUT
+) -> Dict[str, str]:
+    """
+    Generate Phase 2B semantic summaries for many stories in one Message Batch.
+
+    For batch generation runs, where the stories themselves already came
+    from the Batches API: summaries are billed at 50% and no per-story
+    synchronous request is made. Interactive generation should keep using
+    generate_semantic_summary().
+
+    Args:
+        stories: Stories to summarize, each with
+            - custom_id: Unique ID used to match summaries back to stories
+            - story_text: Full story text
+            - title: Story title
+        config: API configuration
+        poll_interval: Initial polling interval in seconds
+        max_poll_interval: Upper bound for exponential backoff
+        timeout: Give up polling after this many seconds
+
+    Returns:
+        Dict[str, str]: Summaries keyed by custom_id. Failed requests fall
+            back to the first 200 chars of the story, like the sync version.
+
+    Raises:
+        Exception: On batch submission failure or polling timeout
+    """
+    if not stories:
+        return {}
+
+    logger.info("[Phase2B][OBSERVE] 의미적 요약 배치 제출 - %d건", len(stories))
+    batch_requests = [
+        {
+            "custom_id": story["custom_id"],
+            "params": _summary_request_params(story["story_text"], story["title"], config)
+        }
+        for story in stories
+    ]
+
+    try:
+        outcomes = _run_message_batch(
+            batch_requests, config, poll_interval, max_poll_interval, timeout
+        )
+    except Exception as e:
+        logger.error(f"요약 Batch API 호출 중 오류 발생: {str(e)}", exc_info=True)
+        raise Exception(f"요약 Batch API 호출 중 오류 발생: {str(e)}")
+
+    summaries: Dict[str, str] = {}
+    for story in stories:
+        outcome = outcomes.get(story["custom_id"])
+        if outcome is None or isinstance(outcome, str):
+            logger.warning("[Phase2B][OBSERVE] %s 요약 실패, 폴백 사용: %s", story["custom_id"], outcome or "missing result")
+            summaries[story["custom_id"]] = _fallback_summary(story["story_text"])
+        else:
+            summaries[story["custom_id"]] = outcome.content[0].text.strip()
+
+    logger.info("[Phase2B][OBSERVE] 의미적 요약 배치 완료 - %d건", len(summaries))
+    return summaries
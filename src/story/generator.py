@@ -7,22 +7,37 @@ Astro + GraphQL 블로그에 최적화된 마크다운 포맷으로 출력합니
 향후 API 서버로 확장 가능하도록 설계되었습니다.
 """
 
+import asyncio
+import copy
+import functools
+import gzip
 import json
+import logging
 import os
 import re
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dotenv import load_dotenv
+from typing import Dict, List, Optional, Any, Tuple
 
 # Extracted modules
 from src.infra.logging_config import setup_logging, DailyRotatingFileHandler
 from src.infra.data_paths import get_novel_output_dir  # v1.3.1: Centralized paths
-from .api_client import call_claude_api, call_llm_api, generate_semantic_summary
+from src.infra.json_io import dumps, read_json, write_bytes_atomic, write_json
+from .api_client import (
+    call_claude_api, call_claude_api_async, call_claude_batch, call_llm_api,
+    create_async_client, generate_semantic_summary, generate_semantic_summary_async,
+    generate_semantic_summaries_batch, AnthropicRateLimiter,
+    ANTHROPIC_REQUESTS_PER_MINUTE, ANTHROPIC_TOKENS_PER_MINUTE
+)
 from .model_provider import get_model_info
 from src.dedup.similarity import (
     GenerationRecord, observe_similarity, add_to_generation_memory,
-    load_past_stories_into_memory, get_similarity_signal, should_accept_story
+    load_past_stories_into_memory, get_similarity_signal, should_accept_story,
+    find_summary_by_content
 )
 from .template_loader import (
     load_template_skeletons, select_random_template,
@@ -87,11 +102,50 @@ RESEARCH_INJECT_REQUIRE = os.getenv("RESEARCH_INJECT_REQUIRE", "false").lower()
 RESEARCH_INJECT_EXCLUDE_DUP_LEVEL = os.getenv("RESEARCH_INJECT_EXCLUDE_DUP_LEVEL", "HIGH")
 
 
-# 초기 로거 생성 (환경 변수 로드 전 기본값)
-logger = setup_logging()
+# 마크다운 파싱용 정규식 (모듈 로드 시 1회 컴파일)
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)  # "# 제목"
+_TAG_HEADING_RE = re.compile(r'##\s*태그\s*\n')  # "## 태그" 섹션 제목 (섹션 끝은 str.find로 찾음)
+_TAG_ITEM_RE = re.compile(r'-\s*#?(\w+)')  # "- #태그명" 또는 "- 태그명"
+_H2_LINE_RE = re.compile(r'^##\s+.+$', re.MULTILINE)  # "## 소제목" 줄
+_NON_SPACE_RE = re.compile(r'\S')  # 설명 추출 시작점 (str.strip과 같은 공백 기준)
+
+
+# 로거 (핸들러는 load_environment()에서 setup_logging으로 구성)
+logger = logging.getLogger("horror_story_generator")
+
+
+@dataclass(frozen=True, slots=True)
+class GenerationConfig(Mapping):
+    """
+    load_environment()가 반환하는 생성 설정 스냅샷 (불변).
+
+    환경 변수는 생성 시점에 한 번만 읽고 타입 변환됩니다.
+    속성 접근(config.model)과 기존 dict 방식 접근
+    (config["model"], config.get("model"), **config)을 모두 지원합니다.
+    """
+    api_key: str
+    model: str
+    max_tokens: int
+    temperature: float
+    output_dir: str
+    log_level: str
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _GENERATION_CONFIG_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(_GENERATION_CONFIG_KEYS)
+
+    def __len__(self) -> int:
+        return len(_GENERATION_CONFIG_KEYS)
 
 
-def load_environment() -> Dict[str, Union[str, int, float]]:
+_GENERATION_CONFIG_KEYS = tuple(f.name for f in fields(GenerationConfig))
+
+
+def load_environment() -> GenerationConfig:
     """
     환경 변수를 로드하고 필요한 설정을 반환합니다.
 
@@ -99,7 +153,7 @@ def load_environment() -> Dict[str, Union[str, int, float]]:
     필수 환경 변수가 없을 경우 ValueError를 발생시킵니다.
 
     Returns:
-        Dict[str, Union[str, int, float]]: API 키 및 모델 설정 정보
+        GenerationConfig: API 키 및 모델 설정 정보 (불변, dict 방식 접근 가능)
             - api_key (str): Anthropic API 키
             - model (str): Claude 모델 이름
             - max_tokens (int): 최대 토큰 수
@@ -116,6 +170,8 @@ def load_environment() -> Dict[str, Union[str, int, float]]:
         'claude-sonnet-4-5-20250929'
     """
     global logger
+    from dotenv import load_dotenv  # 필요 시점에만 import (콜드 스타트 단축)
+
     load_dotenv()
 
     # 로깅 레벨 재설정
@@ -133,25 +189,34 @@ def load_environment() -> Dict[str, Union[str, int, float]]:
     if not output_dir:
         output_dir = str(get_novel_output_dir())
 
-    config = {
-        "api_key": api_key,
-        "model": os.getenv("CLAUDE_MODEL", "claude-sonnet-4-5-20250929"),
-        "max_tokens": int(os.getenv("MAX_TOKENS", "8192")),
-        "temperature": float(os.getenv("TEMPERATURE", "0.8")),
-        "output_dir": output_dir,
-        "log_level": log_level
-    }
+    config = GenerationConfig(
+        api_key=api_key,
+        model=os.getenv("CLAUDE_MODEL", "claude-sonnet-4-5-20250929"),
+        max_tokens=int(os.getenv("MAX_TOKENS", "8192")),
+        temperature=float(os.getenv("TEMPERATURE", "0.8")),
+        output_dir=output_dir,
+        log_level=log_level
+    )
 
-    logger.info(f"환경 변수 로드 완료 - 모델: {config['model']}")
+    logger.info(f"환경 변수 로드 완료 - 모델: {config.model}")
     return config
 
 
+@functools.lru_cache(maxsize=8)
+def _load_prompt_template_cached(abs_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """(절대 경로, 수정 시각) 기준으로 파싱된 템플릿을 캐시합니다. 반환값을 직접 수정하지 마세요."""
+    return read_json(abs_path)
+
+
 def load_prompt_template(template_path: str = "horror_story_prompt_template.json") -> Dict[str, Any]:
     """
     JSON 형식의 프롬프트 템플릿을 로드합니다.
 
     템플릿 파일에는 장르, 분위기, 캐릭터, 플롯 구조 등
     호러 소설 생성에 필요한 모든 설정이 포함됩니다.
+    파싱 결과는 파일 수정 시각(mtime) 기준으로 캐시되어 파일이
+    바뀐 경우에만 다시 읽으며, 호출자가 수정해도 캐시에 영향이
+    없도록 사본을 반환합니다.
 
     Args:
         template_path (str): 템플릿 파일 경로. 기본값은 "horror_story_prompt_template.json"
@@ -174,8 +239,8 @@ def load_prompt_template(template_path: str = "horror_story_prompt_template.json
         logger.error(f"프롬프트 템플릿 파일을 찾을 수 없습니다: {template_path}")
         raise FileNotFoundError(f"프롬프트 템플릿 파일을 찾을 수 없습니다: {template_path}")
 
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = json.load(f)
+    abs_path = os.path.abspath(template_path)
+    template = copy.deepcopy(_load_prompt_template_cached(abs_path, os.stat(abs_path).st_mtime_ns))
 
     logger.info(f"프롬프트 템플릿 로드 완료: {template_path}")
     return template
@@ -200,16 +265,35 @@ def extract_title_from_story(story_text: str) -> str:
         '녹색 복도'
     """
     # 마크다운 제목 패턴 찾기 (# 제목)
-    title_match = re.search(r'^#\s+(.+)$', story_text, re.MULTILINE)
+    return _title_from_match(_TITLE_RE.search(story_text))
+
+
+def _title_from_match(title_match: Optional[re.Match]) -> str:
+    """_TITLE_RE 매치 결과에서 제목을 꺼냅니다 (없으면 "무제")."""
     if title_match:
         title = title_match.group(1).strip()
-        logger.debug(f"제목 추출 성공: {title}")
+        logger.debug("제목 추출 성공: %s", title)
         return title
 
     logger.warning("제목을 찾을 수 없어 기본 제목 사용")
     return "무제"
 
 
+def _find_tag_section(story_text: str) -> Optional[str]:
+    """
+    "## 태그" 제목 다음부터 다음 ## 줄(없으면 본문 끝)까지의 섹션 내용을 돌려줍니다.
+
+    게으른 수량자 + 전방탐색 정규식 대신 제목만 정규식으로 찾고 섹션 끝은
+    str.find로 찾으므로, 섹션 길이와 무관하게 본문을 한 번만 훑습니다.
+    """
+    heading = _TAG_HEADING_RE.search(story_text)
+    if heading is None:
+        return None
+    start = heading.end()
+    end = story_text.find('\n##', start + 1)  # 섹션 내용은 최소 한 글자
+    return story_text[start:end if end >= 0 else len(story_text)]
+
+
 def extract_tags_from_story(story_text: str, template: Dict[str, Any]) -> List[str]:
     """
     소설과 템플릿에서 태그를 추출합니다.
@@ -231,10 +315,10 @@ def extract_tags_from_story(story_text: str, template: Dict[str, Any]) -> List[s
     """
     tags = ["호러", "horror"]
 
-    # 템플릿에서 장르 태그 추가
+    # 템플릿에서 장르 태그 추가 (중복은 아래 dict 기반 정리에서 한 번에 제거)
     config = template.get("story_config", {})
     genre = config.get("genre", "")
-    if genre and genre not in tags:
+    if genre:
         tags.append(genre)
 
     # 템플릿에서 공포 타입 태그 추가
@@ -244,25 +328,23 @@ def extract_tags_from_story(story_text: str, template: Dict[str, Any]) -> List[s
     if isinstance(fear_types, list):
         tags.extend(fear_types[:2])  # 최대 2개만 추가
 
-    # 소설 본문에서 태그 섹션 찾기 (## 태그)
-    tag_section_match = re.search(r'##\s*태그\s*\n([\s\S]+?)(?=\n##|\Z)', story_text, re.MULTILINE)
-    if tag_section_match:
-        tag_content = tag_section_match.group(1)
+    # 소설 본문에서 태그 섹션 찾기 (## 태그) - '태그'가 없으면 검색 생략
+    tag_content = _find_tag_section(story_text) if '태그' in story_text else None
+    if tag_content:
         # - #태그명 또는 - 태그명 형식 추출
-        found_tags = re.findall(r'-\s*#?(\w+)', tag_content)
+        found_tags = _TAG_ITEM_RE.findall(tag_content)
         tags.extend(found_tags[:5])  # 최대 5개만 추가
 
-    # 중복 제거 및 정리
-    unique_tags = []
-    seen = set()
+    # 중복 제거 및 정리 (대소문자 무시, 처음 나온 표기 유지 - dict는 삽입 순서 보존, 빈 태그 제외)
+    unique_tags: Dict[str, str] = {}
     for tag in tags:
-        tag_clean = tag.strip().lower()
-        if tag_clean not in seen:
-            seen.add(tag_clean)
-            unique_tags.append(tag.strip())
+        tag = tag.strip()
+        if tag:
+            unique_tags.setdefault(tag.lower(), tag)
 
-    logger.debug(f"태그 추출 완료: {unique_tags}")
-    return unique_tags[:10]  # 최대 10개
+    result = list(unique_tags.values())[:10]  # 최대 10개
+    logger.debug("태그 추출 완료: %s", result)
+    return result
 
 
 def generate_description(story_text: str) -> str:
@@ -280,31 +362,219 @@ def generate_description(story_text: str) -> str:
     Example:
         >>> desc = generate_description(story_text)
     """
-    # 첫 번째 # 제목 이후의 텍스트 추출
-    content_start = re.search(r'^#\s+.+$', story_text, re.MULTILINE)
-    if content_start:
-        content = story_text[content_start.end():].strip()
-    else:
-        content = story_text.strip()
+    return _description_after(story_text, _TITLE_RE.search(story_text))
 
-    # 첫 문단 또는 200자 추출
-    first_para = content.split('\n\n')[0] if content else ""
-    # ## 제목 제거
-    first_para = re.sub(r'^##\s+.+$', '', first_para, flags=re.MULTILINE).strip()
+
+def _description_after(story_text: str, content_start: Optional[re.Match]) -> str:
+    """_TITLE_RE 매치 이후 첫 문단으로 설명을 만듭니다 (매치가 없으면 본문 처음부터)."""
+    # 첫 번째 # 제목 이후 첫 비공백 문자부터 시작 (본문 전체를 strip 복사하지 않음)
+    body_start = _NON_SPACE_RE.search(story_text, content_start.end() if content_start else 0)
+    start = body_start.start() if body_start else len(story_text)
+
+    # 첫 문단 또는 200자 추출 (첫 문단 경계까지만 잘라냄)
+    para_end = story_text.find('\n\n', start)
+    first_para = story_text[start:para_end] if para_end >= 0 else story_text[start:]
+    # ## 제목 제거 (## 이 없으면 정규식 생략)
+    if '##' in first_para:
+        first_para = _H2_LINE_RE.sub('', first_para)
+    first_para = first_para.strip()
 
     description = first_para[:200].strip()
     if len(first_para) > 200:
         description += "..."
 
-    logger.debug(f"설명 생성 완료: {description[:50]}...")
+    logger.debug("설명 생성 완료: %.50s...", description)
     return description
 
 
+def parse_story_metadata(
+    story_text: str,
+    template: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    소설 본문에서 제목, 태그, 설명을 한 번에 추출합니다.
+
+    extract_title_from_story / extract_tags_from_story / generate_description과
+    같은 결과를 돌려주지만, 제목 검색 결과를 설명 추출에 재사용하므로
+    본문의 제목 스캔은 한 번만 일어납니다.
+
+    Args:
+        story_text (str): 생성된 소설 전체 텍스트
+        template (Optional[Dict[str, Any]]): 프롬프트 템플릿. None이면 기본 태그만 사용
+
+    Returns:
+        Dict[str, Any]: title, tags, description
+
+    Example:
+        >>> meta = parse_story_metadata(story_text, template)
+        >>> print(meta["title"], meta["tags"])
+    """
+    title_match = _TITLE_RE.search(story_text)
+    return {
+        "title": _title_from_match(title_match),
+        "tags": extract_tags_from_story(story_text, template) if template else ["호러", "horror"],
+        "description": _description_after(story_text, title_match),
+    }
+
+
+# Astro 블로그용 YAML frontmatter (model_fields는 metadata가 있을 때만 채워짐)
+_FRONTMATTER_TEMPLATE = """---
+title: "{title}"
+date: {date}
+description: "{description}"
+tags: {tags}
+genre: "호러"
+wordCount: {word_count}
+{model_fields}draft: false
+---
+
+"""
+
+_FRONTMATTER_MODEL_FIELDS = """model: "{model}"
+temperature: {temperature}
+"""
+
+
+@functools.lru_cache(maxsize=128)
+def _tags_json(tags: Tuple[str, ...]) -> str:
+    """
+    frontmatter용 태그 JSON 배열. 같은 템플릿의 소설은 태그가 거의 같으므로 캐시합니다.
+
+    기존 마크다운과 같은 바이트가 나오도록 json.dumps 기본 구분자(", ")를 유지합니다
+    (json_io.dumps는 orjson과 같은 압축 형식).
+    """
+    return json.dumps(list(tags), ensure_ascii=False)
+
+
+def _build_frontmatter(
+    story_text: str,
+    metadata: Optional[Dict[str, Any]] = None,
+    template: Optional[Dict[str, Any]] = None,
+    parsed: Optional[Dict[str, Any]] = None,
+    generated_at: Optional[datetime] = None
+) -> Tuple[str, str, List[str], str]:
+    """
+    소설 본문에서 제목/태그/설명을 추출하고 YAML frontmatter를 생성합니다.
+
+    parsed(parse_story_metadata() 결과)가 주어지면 본문을 다시 파싱하지 않습니다.
+    frontmatter의 date는 generated_at(없으면 현재 시각) 기준입니다.
+
+    Returns:
+        Tuple[str, str, List[str], str]: (frontmatter, title, tags, description)
+    """
+    if parsed is None:
+        parsed = parse_story_metadata(story_text, template)
+    title, tags, description = parsed["title"], parsed["tags"], parsed["description"]
+
+    # YAML frontmatter 생성 (한 번의 format으로 조립)
+    model_fields = ""
+    if metadata:
+        model_fields = _FRONTMATTER_MODEL_FIELDS.format(
+            model=metadata.get('model', 'unknown'),
+            temperature=metadata.get('config', {}).get('temperature', 0.8)
+        )
+
+    frontmatter = _FRONTMATTER_TEMPLATE.format(
+        title=title,
+        date=(generated_at or datetime.now()).strftime("%Y-%m-%d"),
+        description=description,
+        tags=_tags_json(tuple(tags)),
+        word_count=len(story_text),
+        model_fields=model_fields
+    )
+    return frontmatter, title, tags, description
+
+
+def _write_story_markdown(
+    story_text: str,
+    output_dir: str,
+    metadata: Optional[Dict[str, Any]] = None,
+    template: Optional[Dict[str, Any]] = None,
+    parsed: Optional[Dict[str, Any]] = None,
+    generated_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    save_story의 마크다운 저장 단계: 파일명을 선점하고 frontmatter + 본문을 씁니다.
+
+    metadata는 frontmatter(model, temperature)에만 사용하며 수정하지 않습니다.
+    parsed는 호출자가 이미 구한 parse_story_metadata() 결과입니다 (없으면 여기서 파싱).
+    파일명 타임스탬프와 frontmatter 날짜는 generated_at(없으면 현재 시각) 하나로 만듭니다.
+
+    Returns:
+        Dict[str, Any]: story_path, file_stem, title, tags, description
+    """
+    # 출력 디렉토리 생성
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    # 타임스탬프 기반 파일명 생성
+    # 배치/동시 생성에서 같은 초에 저장되는 경우 _1, _2 ... 접미사로 구분
+    if generated_at is None:
+        generated_at = datetime.now()
+    timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
+    file_stem = f"horror_story_{timestamp}"
+    suffix = 0
+    while True:
+        story_path = os.path.join(output_dir, f"{file_stem}.md")
+        try:
+            # 'x' 모드로 파일명을 선점하여 덮어쓰기 방지
+            open(story_path, 'x').close()
+            break
+        except FileExistsError:
+            suffix += 1
+            file_stem = f"horror_story_{timestamp}_{suffix}"
+
+    # 제목, 태그, 설명 추출 및 frontmatter 생성
+    frontmatter, title, tags, description = _build_frontmatter(
+        story_text, metadata, template, parsed, generated_at
+    )
+
+    # 마크다운 파일 저장: 임시 파일에 한 번에 쓴 뒤 선점한 파일을 원자적으로 교체
+    write_bytes_atomic(story_path, (frontmatter + story_text).encode('utf-8'))
+
+    logger.info(f"마크다운 파일 저장 완료: {story_path}")
+
+    return {
+        "story_path": story_path,
+        "file_stem": file_stem,
+        "title": title,
+        "tags": tags,
+        "description": description,
+    }
+
+
+def _write_story_metadata(
+    saved: Dict[str, Any],
+    output_dir: str,
+    metadata: Dict[str, Any]
+) -> None:
+    """
+    save_story의 메타데이터 저장 단계: 추출 정보를 추가해 _metadata.json을 씁니다.
+
+    Args:
+        saved (Dict[str, Any]): _write_story_markdown()의 반환값
+        output_dir (str): 출력 디렉토리 경로
+        metadata (Dict[str, Any]): 저장할 메타데이터 (title/tags/description이 추가됨)
+    """
+    metadata_filename = f"{saved['file_stem']}_metadata.json"
+    metadata_path = os.path.join(output_dir, metadata_filename)
+
+    # 메타데이터에 추출된 정보 추가
+    metadata["title"] = saved["title"]
+    metadata["tags"] = saved["tags"]
+    metadata["description"] = saved["description"]
+
+    write_json(metadata_path, metadata)
+
+    logger.info(f"메타데이터 파일 저장 완료: {metadata_path}")
+
+
 def save_story(
     story_text: str,
     output_dir: str,
     metadata: Optional[Dict[str, Any]] = None,
-    template: Optional[Dict[str, Any]] = None
+    template: Optional[Dict[str, Any]] = None,
+    parsed: Optional[Dict[str, Any]] = None,
+    generated_at: Optional[datetime] = None
 ) -> str:
     """
     생성된 소설을 Astro + GraphQL 블로그용 마크다운 파일로 저장합니다.
@@ -317,6 +587,10 @@ def save_story(
         output_dir (str): 출력 디렉토리 경로
         metadata (Optional[Dict[str, Any]]): 저장할 메타데이터
         template (Optional[Dict[str, Any]]): 프롬프트 템플릿 (태그 추출용)
+        parsed (Optional[Dict[str, Any]]): 이미 구한 parse_story_metadata() 결과.
+            주어지면 제목/태그/설명을 다시 추출하지 않음
+        generated_at (Optional[datetime]): 생성 시각. 파일명과 frontmatter 날짜에 사용
+            (None이면 현재 시각)
 
     Returns:
         str: 저장된 마크다운 파일 경로
@@ -328,116 +602,101 @@ def save_story(
     """
     logger.info("파일 저장 시작...")
 
-    # 출력 디렉토리 생성
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-
-    # 타임스탬프 기반 파일명 생성
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    story_filename = f"horror_story_{timestamp}.md"
-    story_path = os.path.join(output_dir, story_filename)
-
-    # 제목, 태그, 설명 추출
-    title = extract_title_from_story(story_text)
-    tags = extract_tags_from_story(story_text, template) if template else ["호러", "horror"]
-    description = generate_description(story_text)
-
-    # YAML frontmatter 생성
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    frontmatter = f"""---
-title: "{title}"
-date: {date_str}
-description: "{description}"
-tags: {json.dumps(tags, ensure_ascii=False)}
-genre: "호러"
-wordCount: {len(story_text)}
-"""
+    saved = _write_story_markdown(story_text, output_dir, metadata, template, parsed, generated_at)
 
+    # 메타데이터 JSON 파일 저장
     if metadata:
-        frontmatter += f"""model: "{metadata.get('model', 'unknown')}"
-temperature: {metadata.get('config', {}).get('temperature', 0.8)}
-"""
+        _write_story_metadata(saved, output_dir, metadata)
 
-    frontmatter += """draft: false
----
+    return saved["story_path"]
 
-"""
 
-    # 마크다운 파일 저장
-    with open(story_path, 'w', encoding='utf-8') as f:
-        f.write(frontmatter)
-        f.write(story_text)
+def save_stories_archive(stories: List[Dict[str, Any]], output_dir: str) -> str:
+    """
+    여러 편의 소설을 gzip 압축 JSONL 파일 하나로 저장합니다 (배치 모드용).
 
-    logger.info(f"마크다운 파일 저장 완료: {story_path}")
+    편마다 .md/.json 파일을 따로 쓰는 대신 한 번의 순차 쓰기로 모읍니다.
+    각 줄은 {"id", "markdown", "metadata"} 객체이며, markdown에는
+    save_story와 같은 frontmatter가 포함됩니다.
 
-    # 메타데이터 JSON 파일 저장
-    if metadata:
-        metadata_filename = f"horror_story_{timestamp}_metadata.json"
-        metadata_path = os.path.join(output_dir, metadata_filename)
+    Args:
+        stories (List[Dict[str, Any]]): 저장할 소설 목록
+            - id (str): 소설 식별자
+            - story_text (str): 소설 내용
+            - metadata (Optional[Dict]): 메타데이터 (title/tags/description이 추가됨)
+            - template (Optional[Dict]): 프롬프트 템플릿 (태그 추출용)
+        output_dir (str): 출력 디렉토리 경로
 
-        # 메타데이터에 추출된 정보 추가
-        metadata["title"] = title
-        metadata["tags"] = tags
-        metadata["description"] = description
+    Returns:
+        str: 저장된 아카이브 파일 경로
 
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+    Example:
+        >>> path = save_stories_archive(stories, "./output")
+        >>> print(path)
+        './output/horror_stories_20260102_150000.jsonl.gz'
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"메타데이터 파일 저장 완료: {metadata_path}")
+    # 모든 frontmatter 날짜와 아카이브 파일명이 같은 시각을 쓰도록 한 번만 구함
+    archived_at = datetime.now()
+    lines = []
+    for story in stories:
+        story_text = story["story_text"]
+        metadata = story.get("metadata")
+        frontmatter, title, tags, description = _build_frontmatter(
+            story_text, metadata, story.get("template"), generated_at=archived_at
+        )
+        if metadata:
+            metadata["title"] = title
+            metadata["tags"] = tags
+            metadata["description"] = description
+        lines.append(dumps({
+            "id": story["id"],
+            "markdown": frontmatter + story_text,
+            "metadata": metadata
+        }) + b"\n")
+
+    timestamp = archived_at.strftime("%Y%m%d_%H%M%S")
+    file_stem = f"horror_stories_{timestamp}"
+    suffix = 0
+    while True:
+        archive_path = os.path.join(output_dir, f"{file_stem}.jsonl.gz")
+        try:
+            # 'x' 모드로 기존 아카이브 덮어쓰기 방지
+            with gzip.open(archive_path, 'xb') as f:
+                f.writelines(lines)
+            break
+        except FileExistsError:
+            suffix += 1
+            file_stem = f"horror_stories_{timestamp}_{suffix}"
 
-    return story_path
+    logger.info(f"아카이브 저장 완료: {archive_path} ({len(lines)}편)")
+    return archive_path
 
 
-def generate_horror_story(
+def _prepare_generation(
+    config: Dict[str, Any],
     template_path: Optional[str] = None,
     custom_request: Optional[str] = None,
-    save_output: bool = True,
-    model_spec: Optional[str] = None,
     target_length: Optional[int] = None
 ) -> Dict[str, Any]:
     """
-    호러 소설 생성의 전체 파이프라인을 실행합니다.
+    API 호출 전 단계(템플릿 선택, 연구 컨텍스트 선택, 프롬프트 빌드)를 수행합니다.
 
-    환경 설정 로드부터 API 호출, 파일 저장까지 전체 프로세스를 관리합니다.
-    각 단계의 진행 상황을 로그로 기록합니다.
+    generate_horror_story와 배치 생성 경로가 공유합니다.
 
     Args:
-        template_path (Optional[str]): 프롬프트 템플릿 파일 경로. None이면 기본 심리 공포 프롬프트 사용
-        custom_request (Optional[str]): 사용자 커스텀 요청. None이면 기본 프롬프트 사용
-        save_output (bool): 결과를 파일로 저장할지 여부. 기본값 True
-        model_spec (Optional[str]): 모델 선택. None이면 기본 Claude 모델 사용.
-            형식: "ollama:llama3", "ollama:qwen", 또는 Claude 모델명
-        target_length (Optional[int]): 목표 스토리 길이 (자). None이면 기본값 (3000-4000자) 사용.
+        config (Dict[str, Any]): load_environment()가 반환한 설정
+        template_path (Optional[str]): 프롬프트 템플릿 파일 경로
+        custom_request (Optional[str]): 사용자 커스텀 요청
+        target_length (Optional[int]): 목표 스토리 길이 (자)
 
     Returns:
-        Dict[str, Any]: 생성 결과 및 메타데이터
-            - story (str): 생성된 소설 텍스트
-            - metadata (Dict): 생성 메타데이터
-            - file_path (str): 저장된 파일 경로 (save_output=True인 경우)
-
-    Raises:
-        ValueError: 환경 변수 설정 오류
-        FileNotFoundError: 템플릿 파일 없음 (template_path 지정 시)
-        Exception: API 호출 또는 파일 저장 실패
-
-    Example:
-        >>> result = generate_horror_story()  # 기본 심리 공포 프롬프트 사용
-        >>> print(result['story'][:100])
-        >>> print(result['file_path'])
-
-        >>> result = generate_horror_story(
-        ...     custom_request="1980년대 시골 마을 배경의 귀신 이야기",
-        ...     save_output=True,
-        ...     target_length=2000
-        ... )
+        Dict[str, Any]: 준비된 생성 요청
+            - template, skeleton, research_metadata
+            - system_prompt, user_prompt
+            - template_path, custom_request, target_length
     """
-    logger.info("=" * 80)
-    logger.info("호러 소설 생성기 시작")
-    logger.info("=" * 80)
-
-    # 1. 환경 변수 로드
-    config = load_environment()
-    logger.info(f"설정 - Max Tokens: {config['max_tokens']}, Temperature: {config['temperature']}")
-
     # 2. 프롬프트 템플릿 로드 (optional)
     template = None
     skeleton = None  # Phase 2A: template skeleton
@@ -449,7 +708,7 @@ def generate_horror_story(
         # Phase 2A: 템플릿 스켈레톤 무작위 선택
         skeleton = select_random_template()
         if skeleton:
-            logger.info(f"Phase 2A 템플릿 사용: {skeleton.get('template_id')} - {skeleton.get('template_name')}")
+            logger.info("Phase 2A 템플릿 사용: %s - %s", skeleton.get('template_id'), skeleton.get('template_name'))
         else:
             logger.info("기본 심리 공포 프롬프트 사용 (템플릿 없음)")
 
@@ -497,18 +756,47 @@ def generate_horror_story(
     user_prompt = build_user_prompt(custom_request, template)
     logger.info("프롬프트 생성 완료")
 
-    # 4. API 호출 (model_spec이 있으면 call_llm_api 사용)
-    if model_spec:
-        api_result = call_llm_api(system_prompt, user_prompt, config, model_spec)
-        actual_model = api_result.get("model", model_spec)
-        actual_provider = api_result.get("provider", "unknown")
-    else:
-        api_result = call_claude_api(system_prompt, user_prompt, config)
-        actual_model = config["model"]
-        actual_provider = "anthropic"
+    return {
+        "template": template,
+        "skeleton": skeleton,
+        "research_metadata": research_metadata,
+        "system_prompt": system_prompt,
+        "user_prompt": user_prompt,
+        "template_path": template_path,
+        "custom_request": custom_request,
+        "target_length": target_length,
+    }
 
-    story_text = api_result["story_text"]
-    usage = api_result["usage"]
+
+def _build_generation_result(
+    prepared: Dict[str, Any],
+    story_text: str,
+    usage: Optional[Dict[str, Any]],
+    config: Dict[str, Any],
+    actual_model: str,
+    actual_provider: str,
+    generated_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    API 호출 결과로 생성 결과(story, metadata)를 구성합니다.
+
+    Args:
+        prepared (Dict[str, Any]): _prepare_generation()의 반환값
+        story_text (str): 생성된 소설 텍스트
+        usage (Optional[Dict[str, Any]]): 토큰 사용량
+        config (Dict[str, Any]): load_environment()가 반환한 설정
+        actual_model (str): 실제 사용된 모델명
+        actual_provider (str): 실제 사용된 프로바이더
+        generated_at (Optional[datetime]): 생성 시각 (None이면 현재 시각)
+
+    Returns:
+        Dict[str, Any]: 생성 결과 (story, metadata)
+    """
+    skeleton = prepared["skeleton"]
+    research_metadata = prepared["research_metadata"]
+    template_path = prepared["template_path"]
+    custom_request = prepared["custom_request"]
+    target_length = prepared["target_length"]
 
     # 5. 결과 구성
     # Phase 2A: Include skeleton template info in metadata
@@ -531,7 +819,7 @@ def generate_horror_story(
     result = {
         "story": story_text,
         "metadata": {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": (generated_at or datetime.now()).isoformat(),
             "model": actual_model,
             "provider": actual_provider,
             "template_used": template_path,
@@ -550,6 +838,71 @@ def generate_horror_story(
         }
     }
 
+    return result
+
+
+# story_id 발급 상태: 같은 초에 발급된 ID는 _1, _2 ... 접미사로 구분
+# (파일명 접미사와는 별개의 카운터이므로 둘이 다를 수 있음)
+_STORY_ID_LOCK = threading.Lock()
+_last_story_second: Optional[str] = None
+_story_id_seq = 0
+
+
+def _make_story_id(generated_at: datetime) -> str:
+    """
+    generated_at 기준 타임스탬프 story_id를 발급합니다 (프로세스 내 고유).
+
+    레지스트리는 story_id로 INSERT OR REPLACE 하므로, 같은 초에 발급된 ID가
+    서로를 덮어쓰지 않도록 두 번째부터 _1, _2 ... 를 붙입니다.
+    Phase 2C에서 거절된 시도도 ID를 하나씩 소비하며, 마크다운 파일명의
+    접미사('x' 모드 생성 시 충돌로 결정)와는 일치하지 않을 수 있습니다.
+    """
+    global _last_story_second, _story_id_seq
+    second = generated_at.strftime("%Y%m%d_%H%M%S")
+    with _STORY_ID_LOCK:
+        if second != _last_story_second:
+            _last_story_second, _story_id_seq = second, 0
+            return second
+        _story_id_seq += 1
+        return f"{second}_{_story_id_seq}"
+
+
+def _cached_summary(story_text: str) -> Optional[str]:
+    """
+    생성 메모리에 같은 본문(대소문자/공백 정규화 후 SHA-256 일치)이 있으면 그 요약을 반환합니다.
+
+    재시도나 cron 재실행으로 같은 소설이 다시 나온 경우 요약 API 호출을 생략합니다.
+    """
+    summary = find_summary_by_content(story_text)
+    if summary is not None:
+        logger.info("[Phase2B][OBSERVE] 동일 본문이 메모리에 있음 - 기존 요약 재사용 (요약 API 호출 생략)")
+    return summary
+
+
+def _summarize_story(story_text: str, title: str, config: Dict[str, Any]) -> str:
+    """Phase 2B 의미적 요약: 동일 본문의 요약이 있으면 재사용하고, 없으면 요약 API를 호출합니다."""
+    summary = _cached_summary(story_text)
+    if summary is None:
+        summary = generate_semantic_summary(story_text, title, config)
+    return summary
+
+
+def _observe_generation(
+    prepared: Dict[str, Any],
+    result: Dict[str, Any],
+    title: str,
+    semantic_summary: str,
+    generated_at: Optional[datetime] = None
+) -> None:
+    """
+    Phase 2B 유사도 관측 후 생성 메모리에 추가하고 관측 결과를 metadata에 기록합니다.
+
+    생성 메모리(모듈 전역)를 다루므로 동시 생성 경로에서도 한 스레드에서만 호출합니다.
+    story_id는 generated_at(없으면 현재 시각) 기준 타임스탬프로 발급합니다
+    (_make_story_id 참고 - 같은 초의 파일명 접미사와는 다를 수 있음).
+    """
+    skeleton = prepared["skeleton"]
+
     # ==========================================================================
     # Phase 2B: Generation Memory & Similarity Observation (AFTER generation)
     # ==========================================================================
@@ -557,20 +910,14 @@ def generate_horror_story(
     # Memory resets on process restart - no disk persistence
     # ==========================================================================
 
-    # Extract title for observation
-    title = extract_title_from_story(story_text)
-
-    # Generate story ID (timestamp-based, consistent with file naming)
-    story_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Generate story ID (timestamp-based, same second as the file name timestamp)
+    story_id = _make_story_id(generated_at or datetime.now())
 
     # Extract canonical keys from skeleton (if available)
     canonical_keys = {}
     if skeleton and skeleton.get("canonical_core"):
         canonical_keys = skeleton.get("canonical_core", {})
 
-    # Generate semantic summary (AFTER generation, for observation only)
-    semantic_summary = generate_semantic_summary(story_text, title, config)
-
     # Observe similarity against previous generations (LOGGING ONLY)
     similarity_observation = observe_similarity(
         current_summary=semantic_summary,
@@ -584,16 +931,23 @@ def generate_horror_story(
         template_id=skeleton.get("template_id") if skeleton else None,
         title=title,
         semantic_summary=semantic_summary,
-        canonical_keys=canonical_keys
+        canonical_keys=canonical_keys,
+        story_text=result["story"]
     )
 
     # Optionally include observation in metadata (non-intrusive)
     if similarity_observation:
         result["metadata"]["similarity_observation"] = similarity_observation
 
-    # ==========================================================================
-    # End Phase 2B
-    # ==========================================================================
+
+def _extract_story_canonical(
+    result: Dict[str, Any],
+    config: Dict[str, Any],
+    model_spec: Optional[str] = None
+) -> None:
+    """Story CK를 추출해 템플릿 canonical_core와 비교하고 metadata에 기록합니다."""
+    story_text = result["story"]
+    skeleton_info = result["metadata"]["skeleton_template"]
 
     # ==========================================================================
     # Story Canonical Key Extraction (Issue #19) & Enforcement (Issue #20)
@@ -632,20 +986,162 @@ def generate_horror_story(
         except Exception as e:
             logger.warning(f"[StoryCK] Extraction failed: {e}")
 
-    # ==========================================================================
-    # End Story Canonical Key Extraction
-    # ==========================================================================
+
+def _finalize_generation(
+    prepared: Dict[str, Any],
+    story_text: str,
+    usage: Optional[Dict[str, Any]],
+    config: Dict[str, Any],
+    actual_model: str,
+    actual_provider: str,
+    model_spec: Optional[str] = None,
+    save_output: bool = True,
+    semantic_summary: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    API 호출 이후 단계(결과 구성, Phase 2B 관측, Story CK 추출, 파일 저장)를 수행합니다.
+
+    generate_horror_story와 배치 생성 경로가 공유합니다.
+
+    Args:
+        prepared (Dict[str, Any]): _prepare_generation()의 반환값
+        story_text (str): 생성된 소설 텍스트
+        usage (Optional[Dict[str, Any]]): 토큰 사용량
+        config (Dict[str, Any]): load_environment()가 반환한 설정
+        actual_model (str): 실제 사용된 모델명
+        actual_provider (str): 실제 사용된 프로바이더
+        model_spec (Optional[str]): 모델 선택 (Story CK 추출에 전달)
+        save_output (bool): 결과를 파일로 저장할지 여부
+        semantic_summary (Optional[str]): 미리 생성된 의미적 요약 (배치 요약 등).
+            None이면 generate_semantic_summary로 생성 (마크다운 저장과 동시에 진행)
+
+    Returns:
+        Dict[str, Any]: 생성 결과 (story, metadata, file_path)
+    """
+    # 결과 metadata, 파일명, frontmatter, story_id가 같은 시각을 쓰도록 한 번만 구함
+    generated_at = datetime.now()
+    result = _build_generation_result(
+        prepared, story_text, usage, config, actual_model, actual_provider, generated_at
+    )
+
+    # 제목/태그/설명은 한 번만 파싱해 요약 요청과 마크다운 저장에 함께 사용
+    parsed = parse_story_metadata(story_text, prepared["template"])
+    title = parsed["title"]
+
+    # 요약 API 호출은 백그라운드 스레드에서 진행하고, 그동안 마크다운을 저장
+    # (마크다운은 요약/관측 결과를 쓰지 않음 - 메타데이터 JSON만 관측 이후에 저장)
+    if semantic_summary is None:
+        semantic_summary = _cached_summary(story_text)
+
+    with ThreadPoolExecutor(max_workers=1) as summary_pool:
+        summary_future = None
+        if semantic_summary is None:
+            summary_future = summary_pool.submit(generate_semantic_summary, story_text, title, config)
+
+        saved = None
+        if save_output:
+            saved = _write_story_markdown(
+                story_text, config["output_dir"], result["metadata"], prepared["template"],
+                parsed, generated_at
+            )
+
+        if summary_future is not None:
+            semantic_summary = summary_future.result()
+
+    _observe_generation(prepared, result, title, semantic_summary, generated_at)
+    _extract_story_canonical(result, config, model_spec)
 
     # 6. 파일 저장
-    if save_output:
-        file_path = save_story(
-            story_text,
-            config["output_dir"],
-            result["metadata"],
-            template
-        )
-        result["file_path"] = file_path
-        logger.info(f"저장 완료: {file_path}")
+    if saved:
+        _write_story_metadata(saved, config["output_dir"], result["metadata"])
+        result["file_path"] = saved["story_path"]
+        logger.info(f"저장 완료: {saved['story_path']}")
+
+    return result
+
+
+def generate_horror_story(
+    template_path: Optional[str] = None,
+    custom_request: Optional[str] = None,
+    save_output: bool = True,
+    model_spec: Optional[str] = None,
+    target_length: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    호러 소설 생성의 전체 파이프라인을 실행합니다.
+
+    환경 설정 로드부터 API 호출, 파일 저장까지 전체 프로세스를 관리합니다.
+    각 단계의 진행 상황을 로그로 기록합니다.
+
+    Args:
+        template_path (Optional[str]): 프롬프트 템플릿 파일 경로. None이면 기본 심리 공포 프롬프트 사용
+        custom_request (Optional[str]): 사용자 커스텀 요청. None이면 기본 프롬프트 사용
+        save_output (bool): 결과를 파일로 저장할지 여부. 기본값 True
+        model_spec (Optional[str]): 모델 선택. None이면 기본 Claude 모델 사용.
+            형식: "ollama:llama3", "ollama:qwen", 또는 Claude 모델명
+        target_length (Optional[int]): 목표 스토리 길이 (자). None이면 기본값 (3000-4000자) 사용.
+
+    Returns:
+        Dict[str, Any]: 생성 결과 및 메타데이터
+            - story (str): 생성된 소설 텍스트
+            - metadata (Dict): 생성 메타데이터
+            - file_path (str): 저장된 파일 경로 (save_output=True인 경우)
+
+    Raises:
+        ValueError: 환경 변수 설정 오류
+        FileNotFoundError: 템플릿 파일 없음 (template_path 지정 시)
+        Exception: API 호출 또는 파일 저장 실패
+
+    Example:
+        >>> result = generate_horror_story()  # 기본 심리 공포 프롬프트 사용
+        >>> print(result['story'][:100])
+        >>> print(result['file_path'])
+
+        >>> result = generate_horror_story(
+        ...     custom_request="1980년대 시골 마을 배경의 귀신 이야기",
+        ...     save_output=True,
+        ...     target_length=2000
+        ... )
+    """
+    logger.info("=" * 80)
+    logger.info("호러 소설 생성기 시작")
+    logger.info("=" * 80)
+
+    # 1. 환경 변수 로드
+    config = load_environment()
+    logger.info(f"설정 - Max Tokens: {config['max_tokens']}, Temperature: {config['temperature']}")
+
+    # 2~3. 템플릿 선택 및 프롬프트 빌드
+    prepared = _prepare_generation(
+        config,
+        template_path=template_path,
+        custom_request=custom_request,
+        target_length=target_length
+    )
+
+    # 4. API 호출 (model_spec이 있으면 call_llm_api 사용)
+    system_prompt = prepared["system_prompt"]
+    user_prompt = prepared["user_prompt"]
+    if model_spec:
+        api_result = call_llm_api(system_prompt, user_prompt, config, model_spec)
+        actual_model = api_result.get("model", model_spec)
+        actual_provider = api_result.get("provider", "unknown")
+    else:
+        api_result = call_claude_api(system_prompt, user_prompt, config)
+        actual_model = config["model"]
+        actual_provider = "anthropic"
+
+    # 5~6. 결과 구성, 관측, 파일 저장
+    result = _finalize_generation(
+        prepared,
+        api_result["story_text"],
+        api_result["usage"],
+        config,
+        actual_model=actual_model,
+        actual_provider=actual_provider,
+        model_spec=model_spec,
+        save_output=save_output
+    )
 
     logger.info("=" * 80)
     logger.info("호러 소설 생성 완료")
@@ -654,10 +1150,361 @@ def generate_horror_story(
     return result
 
 
+BATCH_OUTPUT_MODES = ("files", "jsonl_gz")
+
+
+def generate_stories_batch(
+    count: int,
+    save_output: bool = True,
+    target_length: Optional[int] = None,
+    output_mode: str = "files",
+    batch_summaries: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Message Batches API로 여러 편의 호러 소설을 한 번에 생성합니다.
+
+    사용자가 결과를 기다리지 않는 오프라인/스케줄 실행용 경로입니다.
+    모든 요청을 하나의 배치로 제출하므로 토큰 비용이 50% 절감됩니다.
+    대화형 단일 생성은 generate_horror_story를 사용합니다.
+
+    Args:
+        count (int): 생성할 소설 수
+        save_output (bool): 결과를 파일로 저장할지 여부. 기본값 True
+        target_length (Optional[int]): 목표 스토리 길이 (자)
+        output_mode (str): 저장 방식
+            - "files": 편마다 .md + _metadata.json (기본값)
+            - "jsonl_gz": 전체를 gzip 압축 JSONL 파일 하나로 저장
+              (save_stories_archive 참고). 각 결과의 file_path는 아카이브 경로
+        batch_summaries (bool): Phase 2B 의미적 요약도 Message Batch 하나로 생성할지 여부.
+            기본값 True. False이거나 요약 배치가 실패하면 편마다 동기 요청으로 생성
+
+    Returns:
+        List[Dict[str, Any]]: 성공한 생성 결과 목록 (요청 순서 유지).
+            실패한 요청은 로그만 남기고 제외됩니다.
+
+    Raises:
+        ValueError: 환경 변수 설정 오류 또는 알 수 없는 output_mode
+        Exception: 배치 제출 또는 폴링 실패
+    """
+    if output_mode not in BATCH_OUTPUT_MODES:
+        raise ValueError(f"알 수 없는 output_mode: {output_mode} (지원: {', '.join(BATCH_OUTPUT_MODES)})")
+
+    logger.info("=" * 80)
+    logger.info(f"[Batch] 호러 소설 배치 생성 시작 - {count}편")
+    logger.info("=" * 80)
+
+    config = load_environment()
+
+    prepared_by_id: Dict[str, Dict[str, Any]] = {}
+    batch_requests = []
+    for i in range(count):
+        prepared = _prepare_generation(config, target_length=target_length)
+        skeleton = prepared["skeleton"]
+        template_id = skeleton.get("template_id") if skeleton else "default"
+        custom_id = f"story-{template_id}-{i}"
+        prepared_by_id[custom_id] = prepared
+        batch_requests.append({
+            "custom_id": custom_id,
+            "system_prompt": prepared["system_prompt"],
+            "user_prompt": prepared["user_prompt"],
+        })
+
+    batch_results = call_claude_batch(batch_requests, config)
+    archive = output_mode == "jsonl_gz"
+
+    # Phase 2B 요약도 배치로 생성 (편마다 동기 요약 요청 대신)
+    summaries: Dict[str, str] = {}
+    if batch_summaries:
+        summary_requests = [
+            {
+                "custom_id": custom_id,
+                "story_text": api_result["story_text"],
+                "title": extract_title_from_story(api_result["story_text"]),
+            }
+            for custom_id, api_result in batch_results.items()
+            if custom_id in prepared_by_id and "error" not in api_result
+            # 메모리에 같은 본문이 있으면 _finalize_generation에서 기존 요약을 재사용
+            and find_summary_by_content(api_result["story_text"]) is None
+        ]
+        try:
+            summaries = generate_semantic_summaries_batch(summary_requests, config)
+        except Exception as e:
+            logger.warning(f"[Batch] 요약 배치 실패, 편마다 동기 요약으로 대체: {e}")
+
+    results = []
+    archive_entries = []
+    for custom_id, prepared in prepared_by_id.items():
+        api_result = batch_results.get(custom_id)
+        if not api_result or "error" in api_result:
+            reason = api_result.get("error") if api_result else "missing result"
+            logger.warning(f"[Batch] {custom_id} 건너뜀: {reason}")
+            continue
+
+        result = _finalize_generation(
+            prepared,
+            api_result["story_text"],
+            api_result["usage"],
+            config,
+            actual_model=config["model"],
+            actual_provider="anthropic",
+            save_output=save_output and not archive,
+            semantic_summary=summaries.get(custom_id)
+        )
+        result["metadata"]["batch_custom_id"] = custom_id
+        results.append(result)
+        archive_entries.append({
+            "id": custom_id,
+            "story_text": result["story"],
+            "metadata": result["metadata"],
+            "template": prepared["template"],
+        })
+
+    if save_output and archive and archive_entries:
+        archive_path = save_stories_archive(archive_entries, config["output_dir"])
+        for result in results:
+            result["file_path"] = archive_path
+
+    logger.info("=" * 80)
+    logger.info(f"[Batch] 배치 생성 완료 - 성공: {len(results)}/{count}")
+    logger.info("=" * 80)
+
+    return results
+
+
+async def _generate_story_async(
+    client: Any,
+    semaphore: asyncio.Semaphore,
+    config: Dict[str, Any],
+    save_output: bool = True,
+    target_length: Optional[int] = None,
+    rate_limiter: Optional[AnthropicRateLimiter] = None
+) -> Dict[str, Any]:
+    """
+    generate_horror_story의 비동기 버전 (동시 생성용 내부 헬퍼).
+
+    API 호출(소설, 요약)만 semaphore로 동시성을 제한하고, rate_limiter가
+    있으면 호출 전에 분당 요청/토큰 한도를 기다립니다.
+    요약 요청과 마크다운 파일 쓰기를 동시에 진행하고, 블로킹 작업
+    (파일 쓰기, Story CK 추출)은 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    생성 메모리를 다루는 Phase 2B 관측은 이벤트 루프 스레드에서 실행합니다.
+    """
+    prepared = _prepare_generation(config, target_length=target_length)
+
+    async with semaphore:
+        api_result = await call_claude_api_async(
+            prepared["system_prompt"],
+            prepared["user_prompt"],
+            config,
+            client,
+            rate_limiter=rate_limiter
+        )
+
+    story_text = api_result["story_text"]
+    generated_at = datetime.now()
+    result = _build_generation_result(
+        prepared, story_text, api_result["usage"], config,
+        actual_model=config["model"], actual_provider="anthropic", generated_at=generated_at
+    )
+    parsed = parse_story_metadata(story_text, prepared["template"])
+    title = parsed["title"]
+
+    cached_summary = _cached_summary(story_text)
+
+    async def summarize() -> str:
+        if cached_summary is not None:
+            return cached_summary
+        async with semaphore:
+            return await generate_semantic_summary_async(
+                story_text, title, config, client, rate_limiter=rate_limiter
+            )
+
+    # 요약 API 호출과 마크다운 저장을 겹쳐서 실행
+    saved = None
+    if save_output:
+        semantic_summary, saved = await asyncio.gather(
+            summarize(),
+            asyncio.to_thread(
+                _write_story_markdown,
+                story_text, config["output_dir"], result["metadata"], prepared["template"],
+                parsed, generated_at
+            )
+        )
+    else:
+        semantic_summary = await summarize()
+
+    _observe_generation(prepared, result, title, semantic_summary, generated_at)
+    await asyncio.to_thread(_extract_story_canonical, result, config)
+
+    if saved:
+        await asyncio.to_thread(_write_story_metadata, saved, config["output_dir"], result["metadata"])
+        result["file_path"] = saved["story_path"]
+        logger.info(f"저장 완료: {saved['story_path']}")
+
+    return result
+
+
+async def generate_stories_concurrent(
+    count: int,
+    concurrency: int = 8,
+    save_output: bool = True,
+    target_length: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    AsyncAnthropic으로 여러 편의 호러 소설을 동시에 생성합니다.
+
+    Claude 응답 대기 시간이 생성 시간의 대부분이므로 N편의 요청을
+    겹쳐서 보내면 전체 소요 시간이 N·t에서 약 t로 줄어듭니다.
+    동시 요청 수는 concurrency로 제한하고, 분당 요청/토큰 수는
+    ANTHROPIC_REQUESTS_PER_MINUTE / ANTHROPIC_TOKENS_PER_MINUTE 기반
+    토큰 버킷(AnthropicRateLimiter)으로 제한해 429 재시도 폭주를 막습니다.
+
+    Args:
+        count (int): 생성할 소설 수
+        concurrency (int): 동시에 진행할 최대 API 요청 수. 기본값 8
+        save_output (bool): 결과를 파일로 저장할지 여부. 기본값 True
+        target_length (Optional[int]): 목표 스토리 길이 (자)
+
+    Returns:
+        List[Dict[str, Any]]: 성공한 생성 결과 목록.
+            실패한 요청은 로그만 남기고 제외됩니다.
+
+    Raises:
+        ValueError: 환경 변수 설정 오류
+
+    Example:
+        >>> results = asyncio.run(generate_stories_concurrent(5, concurrency=4))
+    """
+    logger.info("=" * 80)
+    logger.info(f"[Async] 호러 소설 동시 생성 시작 - {count}편 (동시성: {concurrency})")
+    logger.info("=" * 80)
+
+    config = load_environment()
+    semaphore = asyncio.Semaphore(concurrency)
+    rate_limiter = AnthropicRateLimiter(ANTHROPIC_REQUESTS_PER_MINUTE, ANTHROPIC_TOKENS_PER_MINUTE)
+
+    async with create_async_client(config) as client:
+        outcomes = await asyncio.gather(
+            *(
+                _generate_story_async(
+                    client, semaphore, config, save_output, target_length, rate_limiter
+                )
+                for _ in range(count)
+            ),
+            return_exceptions=True
+        )
+
+    results = []
+    for i, outcome in enumerate(outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning(f"[Async] {i}번째 생성 실패: {outcome}")
+            continue
+        results.append(outcome)
+
+    logger.info("=" * 80)
+    logger.info(f"[Async] 동시 생성 완료 - 성공: {len(results)}/{count}")
+    logger.info("=" * 80)
+
+    return results
+
+
+def generate_stories_parallel(
+    count: int,
+    max_workers: int = 8,
+    save_output: bool = True,
+    target_length: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    동기 Anthropic 클라이언트와 스레드 풀로 여러 편의 호러 소설을 동시에 생성합니다.
+
+    네트워크 대기 중에는 GIL이 해제되므로 API 호출만 스레드 풀에서 겹쳐
+    실행하면 asyncio 없이도 generate_stories_concurrent와 같은 효과를 얻습니다.
+    템플릿 선택과 후처리(요약, 유사도 관측, 저장)는 전역 상태를 다루므로
+    호출 스레드에서 순차 실행하며, 먼저 끝난 생성부터 후처리합니다.
+    429 응답은 Anthropic SDK의 내장 재시도(Retry-After 준수)로 처리됩니다.
+
+    Args:
+        count (int): 생성할 소설 수
+        max_workers (int): 동시에 진행할 최대 API 요청 수. 기본값 8
+        save_output (bool): 결과를 파일로 저장할지 여부. 기본값 True
+        target_length (Optional[int]): 목표 스토리 길이 (자)
+
+    Returns:
+        List[Dict[str, Any]]: 성공한 생성 결과 목록 (요청 순서 유지).
+            실패한 요청은 로그만 남기고 제외됩니다.
+
+    Raises:
+        ValueError: 환경 변수 설정 오류
+
+    Example:
+        >>> results = generate_stories_parallel(5, max_workers=4)
+    """
+    logger.info("=" * 80)
+    logger.info(f"[Parallel] 호러 소설 병렬 생성 시작 - {count}편 (워커: {max_workers})")
+    logger.info("=" * 80)
+
+    config = load_environment()
+    prepared_list = [
+        _prepare_generation(config, target_length=target_length)
+        for _ in range(count)
+    ]
+
+    finalized: Dict[int, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                call_claude_api,
+                prepared["system_prompt"],
+                prepared["user_prompt"],
+                config
+            ): i
+            for i, prepared in enumerate(prepared_list)
+        }
+
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                api_result = future.result()
+                finalized[i] = _finalize_generation(
+                    prepared_list[i],
+                    api_result["story_text"],
+                    api_result["usage"],
+                    config,
+                    actual_model=config["model"],
+                    actual_provider="anthropic",
+                    save_output=save_output
+                )
+            except Exception as e:
+                logger.warning(f"[Parallel] {i}번째 생성 실패: {e}")
+
+    results = [finalized[i] for i in sorted(finalized)]
+
+    logger.info("=" * 80)
+    logger.info(f"[Parallel] 병렬 생성 완료 - 성공: {len(results)}/{count}")
+    logger.info("=" * 80)
+
+    return results
+
+
 # =============================================================================
 # Phase 2C: Controlled Generation with HIGH-only Dedup
 # =============================================================================
 
+# Multi-line banners, each emitted as a single log record
+_DEDUP_CONTROL_START_BANNER = "\n".join([
+    "[Phase2C][CONTROL] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+    "[Phase2C][CONTROL] 중복 제어 생성 시작",
+    "[Phase2C][CONTROL] 정책: HIGH만 거부, LOW/MEDIUM 수락",
+    "[Phase2C][CONTROL] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+])
+_DEDUP_CONTROL_SKIP_BANNER = "\n".join([
+    "[Phase2C][CONTROL] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+    "[Phase2C][CONTROL] 모든 시도 실패 - SKIP",
+    "[Phase2C][CONTROL] 파일 저장 안함, 루프 계속",
+    "[DedupSignal] Decision=SKIP, Reason=AllAttemptsExhausted",
+    "[Phase2C][CONTROL] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+])
+
+
 def generate_with_dedup_control(
     registry: Any,  # StoryRegistry instance
     max_attempts: int = 3,
@@ -684,10 +1531,7 @@ def generate_with_dedup_control(
     Returns:
         Optional[Dict]: 수락된 스토리 결과, SKIP 시 None
     """
-    logger.info("[Phase2C][CONTROL] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    logger.info("[Phase2C][CONTROL] 중복 제어 생성 시작")
-    logger.info("[Phase2C][CONTROL] 정책: HIGH만 거부, LOW/MEDIUM 수락")
-    logger.info("[Phase2C][CONTROL] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    logger.info(_DEDUP_CONTROL_START_BANNER)
 
     config = load_environment()
     used_template_ids: set = set()
@@ -706,8 +1550,11 @@ def generate_with_dedup_control(
             # Attempt 2: Forced template change
             skeleton = select_random_template(exclude_template_ids=used_template_ids, registry=registry)
 
+        # Skeleton fields used throughout this attempt
         template_id = skeleton.get("template_id") if skeleton else None
         template_name = skeleton.get("template_name") if skeleton else None
+        canonical_core = skeleton.get("canonical_core") if skeleton else None
+        canonical_keys = canonical_core or {}
         if template_id:
             used_template_ids.add(template_id)
 
@@ -743,7 +1590,6 @@ def generate_with_dedup_control(
         # ==========================================================================
         story_dedup_result = None
         if STORY_DEDUP_AVAILABLE and ENABLE_STORY_DEDUP:
-            canonical_core = skeleton.get("canonical_core") if skeleton else None
             research_used = research_metadata.get("research_used", [])
 
             try:
@@ -788,20 +1634,19 @@ def generate_with_dedup_control(
         story_text = api_result["story_text"]
         usage = api_result["usage"]
 
-        # Extract metadata
-        title = extract_title_from_story(story_text)
-        story_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        canonical_keys = {}
-        if skeleton and skeleton.get("canonical_core"):
-            canonical_keys = skeleton.get("canonical_core", {})
+        # Extract metadata (parsed once, reused by save_story)
+        parsed = parse_story_metadata(story_text)
+        title = parsed["title"]
+        generated_at = datetime.now()
+        story_id = _make_story_id(generated_at)
 
         # Phase 2B: Generate summary and observe similarity
-        semantic_summary = generate_semantic_summary(story_text, title, config)
+        semantic_summary = _summarize_story(story_text, title, config)
         similarity_observation = observe_similarity(
             current_summary=semantic_summary,
             current_title=title,
-            canonical_keys=canonical_keys
+            canonical_keys=canonical_keys,
+            stop_at_high=True
         )
 
         # Phase 2C: Determine signal and decision
@@ -820,7 +1665,8 @@ def generate_with_dedup_control(
                 template_id=template_id,
                 title=title,
                 semantic_summary=semantic_summary,
-                canonical_keys=canonical_keys
+                canonical_keys=canonical_keys,
+                story_text=story_text
             )
 
             # Build result
@@ -829,7 +1675,7 @@ def generate_with_dedup_control(
                 skeleton_info = {
                     "template_id": template_id,
                     "template_name": template_name,
-                    "canonical_core": skeleton.get("canonical_core")
+                    "canonical_core": canonical_core
                 }
 
             # Compute story signature for traceability
@@ -851,7 +1697,7 @@ def generate_with_dedup_control(
             result = {
                 "story": story_text,
                 "metadata": {
-                    "generated_at": datetime.now().isoformat(),
+                    "generated_at": generated_at.isoformat(),
                     "model": actual_model,
                     "provider": actual_provider,
                     "template_used": None,
@@ -939,7 +1785,9 @@ def generate_with_dedup_control(
                     story_text,
                     config["output_dir"],
                     result["metadata"],
-                    None  # template
+                    None,  # template
+                    parsed=parsed,
+                    generated_at=generated_at
                 )
                 result["file_path"] = file_path
                 logger.info(f"[Phase2C][CONTROL] 저장 완료: {file_path}")
@@ -979,11 +1827,7 @@ def generate_with_dedup_control(
             continue
 
     # All attempts exhausted - SKIP
-    logger.info("[Phase2C][CONTROL] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    logger.info("[Phase2C][CONTROL] 모든 시도 실패 - SKIP")
-    logger.info("[Phase2C][CONTROL] 파일 저장 안함, 루프 계속")
-    logger.info("[DedupSignal] Decision=SKIP, Reason=AllAttemptsExhausted")
-    logger.info("[Phase2C][CONTROL] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    logger.info(_DEDUP_CONTROL_SKIP_BANNER)
 
     # Record skip in registry
     registry.add_story(
@@ -1149,16 +1993,18 @@ def generate_with_topic(
     story_text = api_result["story_text"]
     usage = api_result["usage"]
 
-    # Extract metadata
-    title = extract_title_from_story(story_text)
-    story_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Extract metadata (parsed once, reused by save_story)
+    parsed = parse_story_metadata(story_text)
+    title = parsed["title"]
+    generated_at = datetime.now()
+    story_id = _make_story_id(generated_at)
 
     canonical_keys = {}
     if skeleton and skeleton.get("canonical_core"):
         canonical_keys = skeleton.get("canonical_core", {})
 
     # Generate summary and observe similarity
-    semantic_summary = generate_semantic_summary(story_text, title, config)
+    semantic_summary = _summarize_story(story_text, title, config)
 
     # Build skeleton info
     skeleton_info = None
@@ -1190,7 +2036,7 @@ def generate_with_topic(
         "story": story_text,
         "metadata": {
             "story_id": story_id,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": generated_at.isoformat(),
             "model": actual_model,
             "provider": actual_provider,
             "topic": topic,
@@ -1248,7 +2094,9 @@ def generate_with_topic(
             story_text,
             config["output_dir"],
             result["metadata"],
-            None
+            None,
+            parsed=parsed,
+            generated_at=generated_at
         )
         result["file_path"] = file_path
         logger.info(f"[TopicGen] Saved: {file_path}")
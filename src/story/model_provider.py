@@ -127,17 +127,17 @@ class ClaudeProvider(ModelProvider):
         config: Dict[str, Any]
     ) -> GenerationResult:
         """Generate using Claude API."""
-        import anthropic
+        from .api_client import build_system_blocks, get_client
 
         logger.info(f"[ClaudeProvider] Generating with {self.model_name}")
-        client = anthropic.Anthropic(api_key=config["api_key"])
+        client = get_client(config["api_key"])
 
         try:
             message = client.messages.create(
                 model=self.model_name,
                 max_tokens=int(config.get("max_tokens", 8192)),
                 temperature=float(config.get("temperature", 0.8)),
-                system=system_prompt,
+                system=build_system_blocks(system_prompt),
                 messages=[{"role": "user", "content": user_prompt}]
             )
 
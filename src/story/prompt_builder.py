@@ -8,12 +8,21 @@ Phase B+: Supports both Research Context and Story Seed injection.
 Both are READ-ONLY inspirational contexts - they guide but never block generation.
 """
 
+import functools
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Closing section shared by every system prompt. Everything up to and
+# including it depends only on the template/target length, so it forms
+# the cacheable prefix (see split_system_prompt).
+OUTPUT_LANGUAGE_SECTION = """## OUTPUT LANGUAGE
+**Write the entire story in Korean.**
+Use natural, modern Korean prose suitable for literary horror fiction.
+"""
+
 
 def _format_research_context(context: Dict[str, Any]) -> str:
     """
@@ -120,6 +129,47 @@ def _format_seed_context(context: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=64)
+def _render_skeleton_suffix(
+    template_name: str,
+    setting: str,
+    primary_fear: str,
+    antagonist: str,
+    mechanism: str,
+    twist: str,
+    act_1: str,
+    act_2: str,
+    act_3: str
+) -> str:
+    """
+    Render the Phase 2A story direction section for a template skeleton.
+
+    Memoized: the same skeleton is selected many times per process, so the
+    section is formatted once per distinct set of values.
+
+    Returns:
+        Formatted string section appended to the system prompt
+    """
+    return f"""
+
+## THIS SESSION'S STORY DIRECTION (Template: {template_name})
+
+### Thematic Framework
+- Setting Type: {setting}
+- Primary Fear: {primary_fear}
+- Antagonist Type: {antagonist}
+- Horror Mechanism: {mechanism}
+- Twist Pattern: {twist}
+
+### Narrative Arc
+- **Act 1 (Setup):** {act_1}
+- **Act 2 (Escalation):** {act_2}
+- **Act 3 (Resolution):** {act_3}
+
+Use this framework to guide the story's direction while maintaining creative freedom in specific details.
+"""
+
+
 def build_system_prompt(
     template: Optional[Dict[str, Any]] = None,
     skeleton: Optional[Dict[str, Any]] = None,
@@ -159,7 +209,7 @@ def build_system_prompt(
     # Determine length instruction based on target_length parameter
     if target_length is not None:
         length_instruction = f"Approximately {target_length:,} characters (±10%, Korean text). Do not mention character counts in the output."
-        logger.debug(f"[TargetLength] Custom target: {target_length} chars")
+        logger.debug("[TargetLength] Custom target: %s chars", target_length)
     else:
         length_instruction = "3,000–4,000 characters (Korean text)"
 
@@ -222,45 +272,35 @@ Before writing the final sentence, verify:
 
 Leave readers with lingering unease that "it's not over yet" even after they close the book.
 
-## OUTPUT LANGUAGE
-**Write the entire story in Korean.**
-Use natural, modern Korean prose suitable for literary horror fiction.
-"""
+{OUTPUT_LANGUAGE_SECTION}"""
         # Phase 2A: 스켈레톤 템플릿이 있으면 구조 추가
         if skeleton:
             canonical = skeleton.get("canonical_core", {})
             story_skel = skeleton.get("story_skeleton", {})
             template_name = skeleton.get("template_name", "Unknown")
 
-            system_prompt += f"""
-
-## THIS SESSION'S STORY DIRECTION (Template: {template_name})
-
-### Thematic Framework
-- Setting Type: {canonical.get('setting', 'unspecified')}
-- Primary Fear: {canonical.get('primary_fear', 'unspecified')}
-- Antagonist Type: {canonical.get('antagonist', 'unspecified')}
-- Horror Mechanism: {canonical.get('mechanism', 'unspecified')}
-- Twist Pattern: {canonical.get('twist', 'unspecified')}
-
-### Narrative Arc
-- **Act 1 (Setup):** {story_skel.get('act_1', 'Establish normalcy and subtle wrongness')}
-- **Act 2 (Escalation):** {story_skel.get('act_2', 'Build tension through accumulating anomalies')}
-- **Act 3 (Resolution):** {story_skel.get('act_3', 'Deliver unresolved horror with cyclical implication')}
-
-Use this framework to guide the story's direction while maintaining creative freedom in specific details.
-"""
-            logger.debug(f"스켈레톤 템플릿 적용: {template_name}")
+            system_prompt += _render_skeleton_suffix(
+                str(template_name),
+                str(canonical.get('setting', 'unspecified')),
+                str(canonical.get('primary_fear', 'unspecified')),
+                str(canonical.get('antagonist', 'unspecified')),
+                str(canonical.get('mechanism', 'unspecified')),
+                str(canonical.get('twist', 'unspecified')),
+                str(story_skel.get('act_1', 'Establish normalcy and subtle wrongness')),
+                str(story_skel.get('act_2', 'Build tension through accumulating anomalies')),
+                str(story_skel.get('act_3', 'Deliver unresolved horror with cyclical implication')),
+            )
+            logger.debug("스켈레톤 템플릿 적용: %s", template_name)
 
         # Phase A: Research context injection
         if research_context:
             system_prompt += _format_research_context(research_context)
-            logger.debug(f"[ResearchInject] Context injected: {len(research_context.get('key_concepts', []))} concepts")
+            logger.debug("[ResearchInject] Context injected: %d concepts", len(research_context.get('key_concepts', [])))
 
         # Phase B+: Story seed context injection
         if seed_context:
             system_prompt += _format_seed_context(seed_context)
-            logger.debug(f"[SeedInject] Context injected: {len(seed_context.get('key_themes', []))} themes")
+            logger.debug("[SeedInject] Context injected: %d themes", len(seed_context.get('key_themes', [])))
 
         logger.debug("기본 심리 공포 프롬프트 사용")
         return system_prompt
@@ -326,15 +366,33 @@ Follow the guidelines below to craft your horror story:
 Keep readers on edge until the very last sentence.
 Leave a haunting aftertaste that lingers long after the story ends.
 
-## OUTPUT LANGUAGE
-**Write the entire story in Korean.**
-Use natural, modern Korean prose suitable for literary horror fiction.
-"""
+""" + OUTPUT_LANGUAGE_SECTION
 
     logger.debug("시스템 프롬프트 생성 완료")
     return system_prompt
 
 
+def split_system_prompt(system_prompt: str) -> Tuple[str, str]:
+    """
+    Split a system prompt into its static prefix and per-session suffix.
+
+    The prefix ends with OUTPUT_LANGUAGE_SECTION; the suffix holds the
+    skeleton direction, research context and seed context appended by
+    build_system_prompt(). Prompts without the section are all prefix.
+
+    Args:
+        system_prompt: Prompt returned by build_system_prompt()
+
+    Returns:
+        (static_part, dynamic_part); static_part + dynamic_part == system_prompt
+    """
+    end = system_prompt.find(OUTPUT_LANGUAGE_SECTION)
+    if end < 0:
+        return system_prompt, ""
+    end += len(OUTPUT_LANGUAGE_SECTION)
+    return system_prompt[:end], system_prompt[end:]
+
+
 def build_user_prompt(custom_request: Optional[str] = None, template: Optional[Dict[str, Any]] = None) -> str:
     """
     사용자 요청을 기반으로 user 프롬프트를 생성합니다.
@@ -356,7 +414,7 @@ def build_user_prompt(custom_request: Optional[str] = None, template: Optional[D
         # Ensure custom_request is a string for proper handling
         if not isinstance(custom_request, str):
             custom_request = str(custom_request)
-        logger.debug(f"커스텀 요청 프롬프트 사용: {custom_request[:50]}...")
+        logger.debug("커스텀 요청 프롬프트 사용: %.50s...", custom_request)
         return custom_request
 
     # 기본 요청
@@ -29,6 +29,10 @@ from src.infra.data_paths import get_seeds_root
 
 logger = logging.getLogger("horror_story_generator")
 
+_THINK_TAG_RE = re.compile(r"<think>.*?</think>", re.DOTALL)  # model reasoning blocks
+_FLAT_JSON_RE = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", re.DOTALL)  # object with one nesting level
+_ANY_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)  # outermost braces
+
 # Ollama settings
 OLLAMA_BASE_URL = "http://localhost:11434"
 OLLAMA_GENERATE_ENDPOINT = "/api/generate"
@@ -241,7 +245,7 @@ def parse_seed_json(response_text: str) -> Optional[dict]:
     Handles thinking tags and extracts JSON object.
     """
     # Remove thinking tags if present
-    text = re.sub(r"<think>.*?</think>", "", response_text, flags=re.DOTALL)
+    text = _THINK_TAG_RE.sub("", response_text)
     text = text.strip()
 
     # Try direct JSON parse
@@ -251,7 +255,7 @@ def parse_seed_json(response_text: str) -> Optional[dict]:
         pass
 
     # Try to find JSON object in text
-    json_match = re.search(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", text, re.DOTALL)
+    json_match = _FLAT_JSON_RE.search(text)
     if json_match:
         try:
             return json.loads(json_match.group())
@@ -259,7 +263,7 @@ def parse_seed_json(response_text: str) -> Optional[dict]:
             pass
 
     # Try to find JSON with arrays
-    json_match = re.search(r"\{.*\}", text, re.DOTALL)
+    json_match = _ANY_JSON_RE.search(text)
     if json_match:
         try:
             return json.loads(json_match.group())
@@ -5,11 +5,14 @@ Phase 2A: Template skeleton loading and back-to-back prevention.
 Phase 3B: Weighted template selection based on registry history.
 """
 
-import json
+import bisect
+import functools
 import logging
 import random
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.infra.json_io import read_json
 
 logger = logging.getLogger("horror_story_generator")
 
@@ -17,9 +20,15 @@ logger = logging.getLogger("horror_story_generator")
 # Path updated after STEP 4-A restructuring (phase1_foundation → assets)
 TEMPLATE_SKELETONS_PATH = Path(__file__).parent.parent.parent / "assets" / "templates" / "template_skeletons_v1.json"
 
+# Template selection RNG, separate from the global random module state
+_rng = random.Random()
+
 # Phase 2A: In-memory state for back-to-back prevention (process-scoped only, not persisted)
 _last_template_id: Optional[str] = None
 
+# Cached (skeleton list, template_id -> index) pair for O(1) back-to-back prevention
+_template_index: Optional[Tuple[List[Dict[str, Any]], Dict[str, int]]] = None
+
 
 # =============================================================================
 # Phase 3B-B1: Pre-generation Weighted Template Selection
@@ -46,11 +55,31 @@ PHASE3B_WEIGHT_PENALTIES = {
     8: 0.05,   # ≥8 → -95% weight (never 0)
 }
 
+# Thresholds in ascending order and their multipliers, sorted once
+_PENALTY_THRESHOLDS: Tuple[int, ...] = tuple(sorted(PHASE3B_WEIGHT_PENALTIES))
+_PENALTY_MULTS: Tuple[float, ...] = tuple(PHASE3B_WEIGHT_PENALTIES[t] for t in _PENALTY_THRESHOLDS)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_template_skeletons_cached(path: str, mtime_ns: int) -> List[Dict[str, Any]]:
+    """Parse the skeleton file; keyed on mtime so an edited file is re-read."""
+    skeletons = read_json(path)
+
+    logger.debug("템플릿 스켈레톤 %d개 로드 완료", len(skeletons))
+    return skeletons
+
 
 def load_template_skeletons() -> List[Dict[str, Any]]:
     """
     Load template skeletons defined in Phase 1.
 
+    The parsed file is cached and only re-read when its modification
+    time changes, so select_random_template() costs one stat() per
+    generation instead of a full JSON parse, while edits to the file
+    are still picked up by a long-running process.
+    Callers must treat the returned list as read-only.
+    Use load_template_skeletons.cache_clear() to force a reload.
+
     Returns:
         List[Dict[str, Any]]: List of 15 template skeletons
 
@@ -61,11 +90,29 @@ def load_template_skeletons() -> List[Dict[str, Any]]:
         logger.warning(f"템플릿 스켈레톤 파일 없음: {TEMPLATE_SKELETONS_PATH}")
         return []
 
-    with open(TEMPLATE_SKELETONS_PATH, 'r', encoding='utf-8') as f:
-        skeletons = json.load(f)
+    return _load_template_skeletons_cached(
+        str(TEMPLATE_SKELETONS_PATH),
+        TEMPLATE_SKELETONS_PATH.stat().st_mtime_ns,
+    )
+
 
-    logger.debug(f"템플릿 스켈레톤 {len(skeletons)}개 로드 완료")
-    return skeletons
+load_template_skeletons.cache_clear = _load_template_skeletons_cached.cache_clear
+
+
+def _template_positions(skeletons: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Return a template_id -> list index map for the given skeleton list.
+
+    Rebuilt only when a different list object is passed (i.e. after
+    load_template_skeletons() re-reads the file), so lookups are O(1) per call.
+    """
+    global _template_index
+
+    if _template_index is None or _template_index[0] is not skeletons:
+        positions = {s.get('template_id'): i for i, s in enumerate(skeletons)}
+        _template_index = (skeletons, positions)
+
+    return _template_index[1]
 
 
 def count_cluster_occurrences_in_registry(
@@ -99,6 +146,12 @@ def count_cluster_occurrences_in_registry(
     return count
 
 
+def _cluster_penalty(cluster_count: int) -> float:
+    """Return the weight multiplier for the highest threshold reached."""
+    idx = bisect.bisect_right(_PENALTY_THRESHOLDS, cluster_count) - 1
+    return _PENALTY_MULTS[idx] if idx >= 0 else 1.0
+
+
 def compute_template_weights(
     skeletons: List[Dict[str, Any]],
     cluster_count: int
@@ -116,21 +169,14 @@ def compute_template_weights(
     Returns:
         List[float]: Weight for each template (same order as input)
     """
-    # Determine penalty multiplier based on count thresholds
-    penalty_multiplier = 1.0
-    for threshold in sorted(PHASE3B_WEIGHT_PENALTIES.keys()):
-        if cluster_count >= threshold:
-            penalty_multiplier = PHASE3B_WEIGHT_PENALTIES[threshold]
-
-    weights = []
-    for skeleton in skeletons:
-        template_id = skeleton.get("template_id", "")
-        if template_id in SYSTEMIC_INEVITABILITY_CLUSTER:
-            weights.append(penalty_multiplier)
-        else:
-            weights.append(1.0)
+    penalty_multiplier = _cluster_penalty(cluster_count)
+    if penalty_multiplier == 1.0:
+        return [1.0] * len(skeletons)
 
-    return weights
+    return [
+        penalty_multiplier if skeleton.get("template_id", "") in SYSTEMIC_INEVITABILITY_CLUSTER else 1.0
+        for skeleton in skeletons
+    ]
 
 
 def select_random_template(
@@ -163,27 +209,41 @@ def select_random_template(
         logger.info("사용 가능한 템플릿 없음 - 기본 프롬프트 사용")
         return None
 
-    # Start with all templates
-    candidates = skeletons
-
-    # Back-to-back prevention: exclude last used template if possible
-    if _last_template_id and len(candidates) > 1:
-        candidates = [s for s in candidates if s.get('template_id') != _last_template_id]
-
-    # Phase 2C: Additional exclusion for forced template change
-    if exclude_template_ids and len(candidates) > 1:
-        filtered = [s for s in candidates if s.get('template_id') not in exclude_template_ids]
-        if filtered:  # Only apply if we still have candidates
-            candidates = filtered
-            logger.info(f"[Phase2C][CONTROL] 템플릿 강제 제외: {exclude_template_ids}")
-
-    # Phase 3B-B1: Weighted selection based on registry history
+    # Phase 3B-B1: Registry history decides whether weighting is needed
+    cluster_count = 0
     if registry is not None:
         cluster_count = count_cluster_occurrences_in_registry(registry)
         logger.info(f"[Phase3B][PRE] Systemic cluster count (last {PHASE3B_LOOKBACK_WINDOW}): {cluster_count}")
 
+    if not exclude_template_ids and cluster_count < 4:
+        # Fast path: uniform selection (Phase 2A behavior).
+        # Back-to-back prevention by index arithmetic instead of filtering:
+        # draw from N-1 slots and shift past the last used index.
+        positions = _template_positions(skeletons)
+        last_index = positions.get(_last_template_id) if _last_template_id else None
+        if last_index is None or len(skeletons) == 1:
+            index = _rng.randrange(len(skeletons))
+        else:
+            index = _rng.randrange(len(skeletons) - 1)
+            index += index >= last_index
+        selected = skeletons[index]
+    else:
+        # Start with all templates
+        candidates = skeletons
+
+        # Back-to-back prevention: exclude last used template if possible
+        if _last_template_id and len(candidates) > 1:
+            candidates = [s for s in candidates if s.get('template_id') != _last_template_id]
+
+        # Phase 2C: Additional exclusion for forced template change
+        if exclude_template_ids and len(candidates) > 1:
+            filtered = [s for s in candidates if s.get('template_id') not in exclude_template_ids]
+            if filtered:  # Only apply if we still have candidates
+                candidates = filtered
+                logger.info(f"[Phase2C][CONTROL] 템플릿 강제 제외: {exclude_template_ids}")
+
         if cluster_count >= 4:
-            # Compute weights for candidates
+            # Phase 3B-B1: Compute weights for candidates
             weights = compute_template_weights(candidates, cluster_count)
 
             # Log penalty application
@@ -192,13 +252,10 @@ def select_random_template(
                 logger.info(f"[Phase3B][PRE] Applying weight penalty: -{penalty_pct}%")
 
             # Use weighted random selection
-            selected = random.choices(candidates, weights=weights, k=1)[0]
+            selected = _rng.choices(candidates, weights=weights, k=1)[0]
         else:
             # No penalty needed, use uniform selection
-            selected = random.choice(candidates)
-    else:
-        # No registry, use uniform selection (Phase 2A behavior)
-        selected = random.choice(candidates)
+            selected = _rng.choice(candidates)
 
     _last_template_id = selected.get('template_id')
 
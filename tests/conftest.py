@@ -41,3 +41,18 @@ def reset_auth_module():
         importlib.reload(auth_module)
     except ImportError:
         pass
+
+
+@pytest.fixture(autouse=True)
+def reset_anthropic_client_cache():
+    """
+    Drop cached Anthropic clients around each test.
+
+    Tests patch anthropic.Anthropic per test, so a client cached by
+    get_client() must not leak from one test into the next.
+    """
+    from src.story.api_client import get_client
+
+    get_client.cache_clear()
+    yield
+    get_client.cache_clear()
@@ -2,11 +2,127 @@
 Tests for api_client module.
 """
 
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 import pytest
 
-from src.story.api_client import call_claude_api, generate_semantic_summary
+from src.story.api_client import (
+    call_claude_api,
+    call_claude_api_async,
+    call_claude_batch,
+    generate_semantic_summary,
+    generate_semantic_summary_async,
+    generate_semantic_summaries_batch,
+    get_client,
+    build_system_blocks,
+    CLIENT_MAX_CONNECTIONS,
+    SUMMARY_INPUT_CHARS,
+    AnthropicRateLimiter,
+    estimate_request_tokens,
+)
+from src.story.prompt_builder import OUTPUT_LANGUAGE_SECTION
+
+
+def _stream_returns(mock_client, message):
+    """Make mock_client.messages.stream(...) yield a stream whose final message is `message`."""
+    stream = mock_client.messages.stream.return_value.__enter__.return_value
+    stream.get_final_message.return_value = message
+    return stream
+
+
+def _async_stream_returns(mock_client, message):
+    """Async counterpart of _stream_returns for AsyncAnthropic clients."""
+    stream = MagicMock()
+    stream.get_final_message = AsyncMock(return_value=message)
+    manager = MagicMock()
+    manager.__aenter__ = AsyncMock(return_value=stream)
+    manager.__aexit__ = AsyncMock(return_value=False)
+    mock_client.messages.stream = Mock(return_value=manager)
+    return stream
+
+
+class TestBuildSystemBlocks:
+    """Tests for build_system_blocks function."""
+
+    def test_static_prefix_is_cached(self):
+        """Test that only the static prefix carries the cache breakpoint."""
+        static = "Core principles\n\n" + OUTPUT_LANGUAGE_SECTION
+        dynamic = "\n\n## THIS SESSION'S STORY DIRECTION"
+
+        blocks = build_system_blocks(static + dynamic)
+
+        assert blocks == [
+            {"type": "text", "text": static, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": dynamic},
+        ]
+
+    def test_prompt_without_suffix_is_single_block(self):
+        """Test that a prompt with nothing after the prefix yields one block."""
+        blocks = build_system_blocks("System prompt")
+
+        assert blocks == [
+            {"type": "text", "text": "System prompt", "cache_control": {"type": "ephemeral"}}
+        ]
+
+
+class TestGetClient:
+    """Tests for get_client function."""
+
+    def test_reuses_client_per_api_key(self):
+        """Test that the same client is returned for repeated calls."""
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            mock_anthropic.side_effect = lambda **kwargs: Mock()
+
+            first = get_client("key-a")
+            second = get_client("key-a")
+            other = get_client("key-b")
+
+        assert first is second
+        assert other is not first
+        assert mock_anthropic.call_count == 2
+
+    def test_clients_are_never_evicted(self):
+        """Test that many API keys do not evict (and leak) earlier clients."""
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            mock_anthropic.side_effect = lambda **kwargs: Mock()
+
+            first = get_client("key-0")
+            for i in range(1, 10):
+                get_client(f"key-{i}")
+
+            assert get_client("key-0") is first
+        assert get_client.cache_info().maxsize is None
+
+    def test_api_calls_share_client(self):
+        """Test that consecutive API calls construct only one client."""
+        mock_message = Mock()
+        mock_message.content = [Mock(text="Story")]
+        mock_message.usage = Mock(input_tokens=1, output_tokens=1)
+        config = {"api_key": "k", "model": "m", "max_tokens": 10, "temperature": 0.5}
+
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            _stream_returns(mock_anthropic.return_value, mock_message)
+            call_claude_api("s", "u", config)
+            call_claude_api("s", "u", config)
+
+        mock_anthropic.assert_called_once()
+        assert mock_anthropic.call_args.kwargs["api_key"] == "k"
+
+    def test_client_uses_shared_connection_pool(self):
+        """Test that the client is built on an explicitly sized httpx pool."""
+        import httpx
+
+        with patch("anthropic.Anthropic") as mock_anthropic, \
+                patch("httpx.Limits", wraps=httpx.Limits) as mock_limits:
+            get_client("key-a")
+
+        http_client = mock_anthropic.call_args.kwargs["http_client"]
+        assert isinstance(http_client, httpx.Client)
+        mock_limits.assert_called_once_with(
+            max_connections=CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=CLIENT_MAX_CONNECTIONS
+        )
+        http_client.close()
 
 
 class TestCallClaudeApi:
@@ -18,9 +134,9 @@ class TestCallClaudeApi:
         mock_message.content = [Mock(text="Generated story text")]
         mock_message.usage = Mock(input_tokens=100, output_tokens=500)
 
-        with patch("src.story.api_client.anthropic.Anthropic") as mock_anthropic:
-            mock_client = Mock()
-            mock_client.messages.create.return_value = mock_message
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            mock_client = MagicMock()
+            _stream_returns(mock_client, mock_message)
             mock_anthropic.return_value = mock_client
 
             config = {
@@ -40,6 +156,32 @@ class TestCallClaudeApi:
             assert result["usage"]["input_tokens"] == 100
             assert result["usage"]["output_tokens"] == 500
             assert result["usage"]["total_tokens"] == 600
+            assert mock_client.messages.stream.call_args.kwargs["system"] == build_system_blocks("System prompt")
+            mock_client.messages.create.assert_not_called()
+
+    def test_api_call_records_prompt_cache_usage(self):
+        """Test that prompt cache read/write token counts are kept in usage."""
+        mock_message = Mock()
+        mock_message.content = [Mock(text="Generated story text")]
+        mock_message.usage = Mock(
+            input_tokens=20, output_tokens=500,
+            cache_read_input_tokens=1800, cache_creation_input_tokens=0
+        )
+
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            mock_client = MagicMock()
+            _stream_returns(mock_client, mock_message)
+            mock_anthropic.return_value = mock_client
+
+            result = call_claude_api(
+                system_prompt="System prompt",
+                user_prompt="User prompt",
+                config={"api_key": "test-key", "model": "claude-test", "max_tokens": 8192, "temperature": 0.8}
+            )
+
+        assert result["usage"]["cache_read_input_tokens"] == 1800
+        assert result["usage"]["cache_creation_input_tokens"] == 0
+        assert result["usage"]["total_tokens"] == 520
 
     def test_api_call_without_usage(self):
         """Test API call when usage info is missing."""
@@ -47,9 +189,9 @@ class TestCallClaudeApi:
         mock_message.content = [Mock(text="Generated story text")]
         mock_message.usage = None
 
-        with patch("src.story.api_client.anthropic.Anthropic") as mock_anthropic:
-            mock_client = Mock()
-            mock_client.messages.create.return_value = mock_message
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            mock_client = MagicMock()
+            _stream_returns(mock_client, mock_message)
             mock_anthropic.return_value = mock_client
 
             config = {
@@ -70,9 +212,9 @@ class TestCallClaudeApi:
 
     def test_api_call_error(self):
         """Test API call error handling."""
-        with patch("src.story.api_client.anthropic.Anthropic") as mock_anthropic:
-            mock_client = Mock()
-            mock_client.messages.create.side_effect = Exception("API Error")
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            mock_client = MagicMock()
+            mock_client.messages.stream.side_effect = Exception("API Error")
             mock_anthropic.return_value = mock_client
 
             config = {
@@ -92,6 +234,233 @@ class TestCallClaudeApi:
             assert "API Error" in str(exc_info.value)
 
 
+class TestCallClaudeApiAsync:
+    """Tests for call_claude_api_async function."""
+
+    config = {
+        "api_key": "test-key",
+        "model": "claude-test",
+        "max_tokens": 8192,
+        "temperature": 0.8
+    }
+
+    async def test_successful_async_call(self):
+        """Test successful async API call."""
+        mock_message = Mock()
+        mock_message.content = [Mock(text="Async story")]
+        mock_message.usage = Mock(input_tokens=10, output_tokens=40)
+
+        mock_client = Mock()
+        _async_stream_returns(mock_client, mock_message)
+
+        result = await call_claude_api_async("System", "User", self.config, mock_client)
+
+        assert result["story_text"] == "Async story"
+        assert result["usage"]["total_tokens"] == 50
+        assert mock_client.messages.stream.call_args.kwargs["system"] == build_system_blocks("System")
+        mock_client.messages.create.assert_not_called()
+
+    async def test_async_call_error(self):
+        """Test async API call error handling."""
+        mock_client = Mock()
+        mock_client.messages.stream = Mock(side_effect=Exception("API Error"))
+
+        with pytest.raises(Exception) as exc_info:
+            await call_claude_api_async("System", "User", self.config, mock_client)
+
+        assert "API Error" in str(exc_info.value)
+
+
+class _FakeClock:
+    """Monotonic clock advanced by the patched asyncio.sleep."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestAnthropicRateLimiter:
+    """Tests for AnthropicRateLimiter."""
+
+    async def test_waits_for_request_refill(self):
+        """Test that acquiring past the request budget waits for one refill."""
+        clock = _FakeClock()
+        with patch("src.story.api_client.time.monotonic", clock.monotonic), \
+             patch("src.story.api_client.asyncio.sleep", clock.sleep):
+            limiter = AnthropicRateLimiter(requests_per_minute=2, tokens_per_minute=0)
+            await limiter.acquire()
+            await limiter.acquire()
+            assert clock.sleeps == []
+
+            await limiter.acquire()
+
+        assert clock.sleeps == [pytest.approx(30.0)]
+
+    async def test_waits_for_token_refill(self):
+        """Test that the token bucket delays a request until enough tokens refill."""
+        clock = _FakeClock()
+        with patch("src.story.api_client.time.monotonic", clock.monotonic), \
+             patch("src.story.api_client.asyncio.sleep", clock.sleep):
+            limiter = AnthropicRateLimiter(requests_per_minute=0, tokens_per_minute=6000)
+            await limiter.acquire(5000)
+            await limiter.acquire(3000)
+
+        # 1000 tokens left, 2000 more needed at 100 tokens/s
+        assert clock.sleeps == [pytest.approx(20.0)]
+
+    async def test_oversized_estimate_capped_at_budget(self):
+        """Test that an estimate above the budget waits for a full bucket, not forever."""
+        clock = _FakeClock()
+        with patch("src.story.api_client.time.monotonic", clock.monotonic), \
+             patch("src.story.api_client.asyncio.sleep", clock.sleep):
+            limiter = AnthropicRateLimiter(requests_per_minute=0, tokens_per_minute=1000)
+            await limiter.acquire(5000)
+            await limiter.acquire(5000)
+
+        assert clock.sleeps == [pytest.approx(60.0)]
+
+    async def test_async_call_acquires_estimated_tokens(self):
+        """Test that call_claude_api_async waits on the limiter with its estimate."""
+        mock_message = Mock()
+        mock_message.content = [Mock(text="Story")]
+        mock_message.usage = Mock(input_tokens=1, output_tokens=1)
+        mock_client = Mock()
+        _async_stream_returns(mock_client, mock_message)
+        limiter = Mock(acquire=AsyncMock())
+        config = {"api_key": "k", "model": "m", "max_tokens": 100, "temperature": 0.5}
+
+        await call_claude_api_async("S" * 40, "U" * 40, config, mock_client, rate_limiter=limiter)
+
+        limiter.acquire.assert_awaited_once_with(estimate_request_tokens(80, 100))
+        assert estimate_request_tokens(80, 100) == 120
+
+
+def _batch_entry(custom_id, text=None, result_type="succeeded"):
+    """Build a mock Message Batch result entry."""
+    entry = Mock()
+    entry.custom_id = custom_id
+    entry.result.type = result_type
+    if text is not None:
+        entry.result.message.content = [Mock(text=text)]
+        entry.result.message.usage = Mock(input_tokens=10, output_tokens=20)
+    else:
+        entry.result.error = "overloaded"
+    return entry
+
+
+class TestCallClaudeBatch:
+    """Tests for call_claude_batch function."""
+
+    config = {
+        "api_key": "test-key",
+        "model": "claude-test",
+        "max_tokens": 8192,
+        "temperature": 0.8
+    }
+
+    def test_empty_requests(self):
+        """Test that no batch is submitted for an empty request list."""
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            assert call_claude_batch([], self.config) == {}
+            mock_anthropic.assert_not_called()
+
+    def test_submits_polls_and_matches_results(self):
+        """Test batch submission, polling until ended, and custom_id matching."""
+        with patch("anthropic.Anthropic") as mock_anthropic, \
+             patch("src.story.api_client.time.sleep") as mock_sleep:
+            mock_client = Mock()
+            mock_client.messages.batches.create.return_value = Mock(id="batch_1", processing_status="in_progress")
+            mock_client.messages.batches.retrieve.side_effect = [
+                Mock(id="batch_1", processing_status="in_progress"),
+                Mock(id="batch_1", processing_status="ended"),
+            ]
+            mock_client.messages.batches.results.return_value = [
+                _batch_entry("story-b", "Story B"),
+                _batch_entry("story-a", "Story A"),
+            ]
+            mock_anthropic.return_value = mock_client
+
+            results = call_claude_batch(
+                [
+                    {"custom_id": "story-a", "system_prompt": "S", "user_prompt": "U"},
+                    {"custom_id": "story-b", "system_prompt": "S", "user_prompt": "U"},
+                ],
+                self.config,
+                poll_interval=1.0
+            )
+
+            assert results["story-a"]["story_text"] == "Story A"
+            assert results["story-b"]["story_text"] == "Story B"
+            assert results["story-a"]["usage"]["total_tokens"] == 30
+
+            submitted = mock_client.messages.batches.create.call_args.kwargs["requests"]
+            assert [r["custom_id"] for r in submitted] == ["story-a", "story-b"]
+            assert submitted[0]["params"]["model"] == "claude-test"
+            assert submitted[0]["params"]["system"] == build_system_blocks("S")
+
+            # Exponential backoff between polls
+            assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+
+    def test_failed_entries_reported(self):
+        """Test that errored entries are returned with an error reason."""
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            mock_client = Mock()
+            mock_client.messages.batches.create.return_value = Mock(id="batch_1", processing_status="ended")
+            mock_client.messages.batches.results.return_value = [
+                _batch_entry("story-a", result_type="errored"),
+            ]
+            mock_anthropic.return_value = mock_client
+
+            results = call_claude_batch(
+                [{"custom_id": "story-a", "system_prompt": "S", "user_prompt": "U"}],
+                self.config
+            )
+
+            assert "error" in results["story-a"]
+            assert "story_text" not in results["story-a"]
+
+
+class TestGenerateSemanticSummariesBatch:
+    """Tests for generate_semantic_summaries_batch function."""
+
+    config = {"api_key": "test-key", "model": "claude-test"}
+
+    def test_summaries_matched_with_fallback(self):
+        """Test summary params, custom_id matching, and fallback for failed entries."""
+        stories = [
+            {"custom_id": "story-a", "story_text": "Story A text", "title": "A"},
+            {"custom_id": "story-b", "story_text": "Story B text", "title": "B"},
+        ]
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            mock_client = Mock()
+            mock_client.messages.batches.create.return_value = Mock(id="batch_1", processing_status="ended")
+            mock_client.messages.batches.results.return_value = [
+                _batch_entry("story-a", "  Summary A  "),
+                _batch_entry("story-b", result_type="errored"),
+            ]
+            mock_anthropic.return_value = mock_client
+
+            summaries = generate_semantic_summaries_batch(stories, self.config)
+
+            assert summaries == {"story-a": "Summary A", "story-b": "Story B text"}
+            submitted = mock_client.messages.batches.create.call_args.kwargs["requests"]
+            assert submitted[0]["params"]["max_tokens"] == 200
+            assert submitted[0]["params"]["temperature"] == 0.0
+
+    def test_empty_stories(self):
+        """Test that no batch is submitted for an empty story list."""
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            assert generate_semantic_summaries_batch([], self.config) == {}
+            mock_anthropic.assert_not_called()
+
+
 class TestGenerateSemanticSummary:
     """Tests for generate_semantic_summary function."""
 
@@ -100,7 +469,7 @@ class TestGenerateSemanticSummary:
         mock_message = Mock()
         mock_message.content = [Mock(text="This is a summary of the story.")]
 
-        with patch("src.story.api_client.anthropic.Anthropic") as mock_anthropic:
+        with patch("anthropic.Anthropic") as mock_anthropic:
             mock_client = Mock()
             mock_client.messages.create.return_value = mock_message
             mock_anthropic.return_value = mock_client
@@ -115,9 +484,24 @@ class TestGenerateSemanticSummary:
 
             assert result == "This is a summary of the story."
 
+    def test_long_story_input_is_truncated(self):
+        """Test that only the first SUMMARY_INPUT_CHARS characters are sent."""
+        mock_message = Mock()
+        mock_message.content = [Mock(text="요약")]
+
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            mock_client = mock_anthropic.return_value
+            mock_client.messages.create.return_value = mock_message
+
+            story_text = "가" * SUMMARY_INPUT_CHARS + "나" * 10
+            generate_semantic_summary(story_text, "Title", {"api_key": "k", "model": "m"})
+
+        content = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert content.endswith("가" * SUMMARY_INPUT_CHARS)
+
     def test_summary_fallback_on_error(self):
         """Test fallback to story snippet on error."""
-        with patch("src.story.api_client.anthropic.Anthropic") as mock_anthropic:
+        with patch("anthropic.Anthropic") as mock_anthropic:
             mock_client = Mock()
             mock_client.messages.create.side_effect = Exception("API Error")
             mock_anthropic.return_value = mock_client
@@ -140,7 +524,7 @@ class TestGenerateSemanticSummary:
         mock_message = Mock()
         mock_message.content = [Mock(text="Summary")]
 
-        with patch("src.story.api_client.anthropic.Anthropic") as mock_anthropic:
+        with patch("anthropic.Anthropic") as mock_anthropic:
             mock_client = Mock()
             mock_client.messages.create.return_value = mock_message
             mock_anthropic.return_value = mock_client
@@ -158,3 +542,33 @@ class TestGenerateSemanticSummary:
             assert call_args.kwargs["model"] == "claude-test"
             assert call_args.kwargs["max_tokens"] == 200
             assert call_args.kwargs["temperature"] == 0.0  # Deterministic
+
+
+class TestGenerateSemanticSummaryAsync:
+    """Tests for generate_semantic_summary_async function."""
+
+    config = {"api_key": "test-key", "model": "claude-test"}
+
+    async def test_successful_async_summary(self):
+        """Test async summary uses the same request parameters as the sync version."""
+        mock_message = Mock()
+        mock_message.content = [Mock(text="  Async summary.  ")]
+        mock_client = Mock()
+        mock_client.messages.create = AsyncMock(return_value=mock_message)
+
+        result = await generate_semantic_summary_async("Story text", "Title", self.config, mock_client)
+
+        assert result == "Async summary."
+        call_args = mock_client.messages.create.call_args
+        assert call_args.kwargs["max_tokens"] == 200
+        assert call_args.kwargs["temperature"] == 0.0
+
+    async def test_async_summary_fallback_on_error(self):
+        """Test fallback to story snippet on error."""
+        mock_client = Mock()
+        mock_client.messages.create = AsyncMock(side_effect=Exception("API Error"))
+
+        story_text = "Beginning of the story. " * 20
+        result = await generate_semantic_summary_async(story_text, "Title", self.config, mock_client)
+
+        assert result == story_text[:200].strip()
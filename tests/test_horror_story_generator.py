@@ -2,20 +2,35 @@
 Tests for horror_story_generator module.
 """
 
+import gzip
 import json
 import os
+import subprocess
+import sys
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
+from src.infra.json_io import read_json
 from src.story.generator import (
     load_prompt_template,
     extract_title_from_story,
     extract_tags_from_story,
     generate_description,
+    parse_story_metadata,
     save_story,
+    save_stories_archive,
+    load_environment,
+    GenerationConfig,
+    generate_stories_parallel,
+    generate_stories_concurrent,
+    generate_stories_batch,
+    _finalize_generation,
+    _write_story_markdown,
+    _tags_json,
 )
 
 
@@ -86,6 +101,53 @@ class TestExtractTagsFromStory:
         horror_count = sum(1 for t in tags if t.lower() == "horror")
         assert horror_count == 1
 
+    def test_story_without_tag_section_skips_section_search(self):
+        """Test that the tag section regex is not run when the story has no tag heading."""
+        from src.story import generator
+
+        with patch.object(generator, "_TAG_HEADING_RE") as mock_re:
+            tags = extract_tags_from_story("# Test\n\n본문만 있는 이야기", {})
+
+        mock_re.search.assert_not_called()
+        assert tags == ["호러", "horror"]
+
+    def test_tag_section_matches_previous_regex(self):
+        """Test that the tag section boundaries match the former lazy-lookahead regex."""
+        import re
+        from src.story import generator
+
+        old_re = re.compile(r'##\s*태그\s*\n([\s\S]+?)(?=\n##|\Z)', re.MULTILINE)
+        stories = [
+            "# T\n\n## 태그\n- #공포\n- #심리\n\n## 본문\n내용",
+            "# T\n\n##태그  \n\n- 도시\n- #밤",
+            "# T\n\n## 태그\n## 본문\n내용\n## 끝",
+            "# T\n\n## 태그\n- #a\n##\n- #b",
+            "# T\n\n본문만",
+        ]
+        for story in stories:
+            m = old_re.search(story)
+            assert generator._find_tag_section(story) == (m.group(1) if m else None)
+
+    def test_genre_matching_default_tag_not_duplicated(self):
+        """Test that a template genre equal to a default tag (any case) is added once."""
+        tags = extract_tags_from_story("# Test\n\n본문", {"story_config": {"genre": "Horror"}})
+
+        assert tags == ["호러", "horror"]
+
+    def test_blank_template_tags_dropped(self):
+        """Test that whitespace-only template tags do not produce empty tags."""
+        template = {"story_elements": {"horror_techniques": {"primary_fear_type": ["  ", "고립"]}}}
+        tags = extract_tags_from_story("# Test\n\n본문", template)
+
+        assert tags == ["호러", "horror", "고립"]
+
+    def test_dedup_keeps_first_spelling_and_order(self):
+        """Test that case-insensitive duplicates keep the first spelling in order."""
+        story = "# Test\n\n## 태그\n- #Ghost\n- #HORROR\n- #ghost\n- #도시\n\n## 본문\nContent..."
+        tags = extract_tags_from_story(story, {})
+
+        assert tags == ["호러", "horror", "Ghost", "도시"]
+
     def test_max_tags_limit(self):
         """Test that tags are limited to 10."""
         story = "# Test\n\n## 태그\n" + "\n".join([f"- #tag{i}" for i in range(20)])
@@ -121,6 +183,64 @@ class TestGenerateDescription:
 
         assert desc.endswith("...")
 
+    def test_subheading_removed_from_first_paragraph(self):
+        """Test that a ## heading line inside the first paragraph is dropped."""
+        story = "# Title\n\n## 1장\n복도 끝의 문이 열렸다.\n\n두 번째 문단."
+        desc = generate_description(story)
+
+        assert desc == "복도 끝의 문이 열렸다."
+
+    def test_single_paragraph_without_blank_line(self):
+        """Test that a story with no paragraph break uses the whole body."""
+        desc = generate_description("# Title\n\n한 문단뿐인 이야기")
+
+        assert desc == "한 문단뿐인 이야기"
+
+
+    def test_matches_strip_based_extraction(self):
+        """Test that offset-based slicing matches stripping the whole body first."""
+        from src.story import generator
+
+        def reference(story):
+            m = generator._TITLE_RE.search(story)
+            content = (story[m.end():] if m else story).strip()
+            para_end = content.find("\n\n")
+            first_para = content[:para_end] if para_end >= 0 else content
+            first_para = generator._H2_LINE_RE.sub("", first_para).strip()
+            return first_para[:200].strip() + ("..." if len(first_para) > 200 else "")
+
+        stories = [
+            "# T\n\n  \n\t본문 시작\n이어짐\n\n다음",
+            "# T\n\n끝에 공백만\n\n   \n",
+            "# T\n   \n\n",
+            "제목 없이\n\n## 2장\n둘째",
+            "# T\n\n" + "가" * 250,
+        ]
+        for story in stories:
+            assert generate_description(story) == reference(story)
+
+class TestParseStoryMetadata:
+    """Tests for parse_story_metadata function."""
+
+    def test_matches_individual_extractors(self):
+        """Test that the fused parse returns what the three extractors return."""
+        story = "# 녹색 복도\n\n첫 문단입니다.\n\n## 태그\n- #공포\n- 복도\n"
+        template = {"story_config": {"genre": "심리스릴러"}}
+
+        meta = parse_story_metadata(story, template)
+
+        assert meta == {
+            "title": extract_title_from_story(story),
+            "tags": extract_tags_from_story(story, template),
+            "description": generate_description(story),
+        }
+
+    def test_without_template_or_title(self):
+        """Test default tags and title when neither is available."""
+        meta = parse_story_metadata("본문만 있습니다.")
+
+        assert meta == {"title": "무제", "tags": ["호러", "horror"], "description": "본문만 있습니다."}
+
 
 class TestSaveStory:
     """Tests for save_story function."""
@@ -167,6 +287,65 @@ class TestSaveStory:
         assert 'title: "Test Story"' in content
         assert "draft: false" in content
 
+    def test_frontmatter_layout(self, tmp_path):
+        """Test the exact frontmatter layout, including the optional model fields."""
+        with patch("src.story.generator.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.side_effect = ["20260101_000000", "2026-01-01"]
+            file_path = save_story(
+                story_text="# 제목 {x}\n\n본문",
+                output_dir=str(tmp_path),
+                metadata={"model": "claude-test", "config": {"temperature": 0.7}},
+                template=None
+            )
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        assert content == (
+            '---\n'
+            'title: "제목 {x}"\n'
+            'date: 2026-01-01\n'
+            'description: "본문"\n'
+            'tags: ["호러", "horror"]\n'
+            'genre: "호러"\n'
+            'wordCount: 12\n'
+            'model: "claude-test"\n'
+            'temperature: 0.7\n'
+            'draft: false\n'
+            '---\n\n'
+            '# 제목 {x}\n\n본문'
+        )
+
+    def test_tags_json_is_cached(self, tmp_path):
+        """Test that stories with the same tags reuse the cached tags JSON."""
+        _tags_json.cache_clear()
+        parsed = {"title": "제목", "tags": ["호러", "horror", "고립"], "description": "설명"}
+
+        for _ in range(2):
+            save_story("# 제목\n\n본문", str(tmp_path), None, None, parsed=parsed)
+
+        info = _tags_json.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert _tags_json(("호러", "고립")) == '["호러", "고립"]'
+
+    def test_precomputed_metadata_skips_parsing(self, tmp_path):
+        """Test that passing parsed metadata skips re-extracting it from the story."""
+        parsed = {"title": "미리 구한 제목", "tags": ["호러"], "description": "설명"}
+
+        with patch("src.story.generator.parse_story_metadata") as mock_parse:
+            file_path = save_story(
+                story_text="# Test Story\n\nContent...",
+                output_dir=str(tmp_path),
+                metadata={"model": "claude-test"},
+                parsed=parsed
+            )
+
+        mock_parse.assert_not_called()
+        with open(file_path, "r", encoding="utf-8") as f:
+            assert 'title: "미리 구한 제목"' in f.read()
+        metadata = read_json(file_path.replace(".md", "_metadata.json"))
+        assert metadata["description"] == "설명"
+
     def test_save_creates_metadata_json(self, tmp_path):
         """Test that save_story creates metadata JSON file."""
         save_story(
@@ -186,6 +365,143 @@ class TestSaveStory:
         assert metadata["title"] == "Test Story"
 
 
+    def test_same_second_saves_do_not_overwrite(self, tmp_path):
+        """Test that stories saved within the same second get distinct files."""
+        with patch("src.story.generator.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = "20260101_000000"
+            path1 = save_story("# First\n\nA", str(tmp_path), {"model": "m"}, None)
+            path2 = save_story("# Second\n\nB", str(tmp_path), {"model": "m"}, None)
+
+        assert path1 != path2
+        assert len(list(tmp_path.glob("*.md"))) == 2
+        assert len(list(tmp_path.glob("*_metadata.json"))) == 2
+        assert "First" in Path(path1).read_text(encoding="utf-8")
+        assert "Second" in Path(path2).read_text(encoding="utf-8")
+
+
+class TestGenerateStoriesConcurrent:
+    """Tests for generate_stories_concurrent function."""
+
+    async def test_saves_story_and_observation_metadata(self, tmp_path):
+        """Test that the async path saves markdown and full metadata per story."""
+        config = GenerationConfig(
+            api_key="k", model="claude-test", max_tokens=100,
+            temperature=0.8, output_dir=str(tmp_path), log_level="INFO"
+        )
+        prepared = {
+            "template": None, "skeleton": None, "research_metadata": {},
+            "system_prompt": "s", "user_prompt": "u",
+            "template_path": None, "custom_request": None, "target_length": None,
+        }
+        client = MagicMock()
+        client.__aenter__.return_value = client
+        observation = {"signal": "LOW"}
+
+        with patch("src.story.generator.load_environment", return_value=config), \
+             patch("src.story.generator.create_async_client", return_value=client), \
+             patch("src.story.generator._prepare_generation", return_value=prepared), \
+             patch("src.story.generator.call_claude_api_async",
+                   AsyncMock(return_value={"story_text": "# 제목\n\n본문", "usage": None})), \
+             patch("src.story.generator.generate_semantic_summary_async",
+                   AsyncMock(return_value="요약")) as mock_summary, \
+             patch("src.story.generator.observe_similarity", return_value=observation), \
+             patch("src.story.generator.add_to_generation_memory"), \
+             patch("src.story.generator._extract_story_canonical"):
+            results = await generate_stories_concurrent(2, concurrency=2)
+
+        assert len(results) == 2
+        assert mock_summary.await_count == 2
+        assert len(list(tmp_path.glob("*.md"))) == 2
+        for result in results:
+            metadata_path = result["file_path"].replace(".md", "_metadata.json")
+            with open(metadata_path, encoding="utf-8") as f:
+                metadata = json.load(f)
+            assert metadata["title"] == "제목"
+            assert metadata["similarity_observation"] == observation
+
+
+class TestSaveStoriesArchive:
+    """Tests for save_stories_archive function."""
+
+    def test_writes_one_gzip_jsonl_file(self, tmp_path):
+        """Test that all stories go into a single compressed JSONL archive."""
+        stories = [
+            {"id": "story-a", "story_text": "# 첫 번째\n\n본문", "metadata": {"model": "m"}},
+            {"id": "story-b", "story_text": "# 두 번째\n\n본문", "metadata": None},
+        ]
+
+        archive_path = save_stories_archive(stories, str(tmp_path))
+
+        assert archive_path.endswith(".jsonl.gz")
+        assert list(tmp_path.glob("*.md")) == []
+        with gzip.open(archive_path, "rt", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+
+        assert [line["id"] for line in lines] == ["story-a", "story-b"]
+        assert lines[0]["markdown"].startswith("---")
+        assert 'title: "첫 번째"' in lines[0]["markdown"]
+        assert lines[0]["metadata"]["title"] == "첫 번째"
+        assert lines[1]["metadata"] is None
+
+
+    def test_single_clock_read_for_whole_archive(self, tmp_path):
+        """Test that all frontmatter dates and the file name share one timestamp."""
+        stories = [
+            {"id": f"story-{i}", "story_text": f"# 제목 {i}\n\n본문", "metadata": None}
+            for i in range(3)
+        ]
+
+        with patch("src.story.generator.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.side_effect = (
+                lambda fmt: "2026-01-01" if fmt == "%Y-%m-%d" else "20260101_000000"
+            )
+            archive_path = save_stories_archive(stories, str(tmp_path))
+
+        mock_datetime.now.assert_called_once()
+        assert archive_path.endswith("horror_stories_20260101_000000.jsonl.gz")
+
+class TestLoadEnvironment:
+    """Tests for load_environment function."""
+
+    def test_returns_frozen_config_snapshot(self, monkeypatch, tmp_path):
+        """Test that env vars are parsed once into an immutable config."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setenv("CLAUDE_MODEL", "claude-test")
+        monkeypatch.setenv("MAX_TOKENS", "1024")
+        monkeypatch.setenv("TEMPERATURE", "0.5")
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path))
+
+        with patch("dotenv.load_dotenv"):
+            config = load_environment()
+
+        assert isinstance(config, GenerationConfig)
+        assert config.max_tokens == 1024
+        assert config.temperature == 0.5
+        with pytest.raises(AttributeError):
+            config.model = "other"
+
+    def test_config_supports_dict_access(self):
+        """Test that existing dict-style callers keep working."""
+        config = GenerationConfig(
+            api_key="k", model="m", max_tokens=10,
+            temperature=0.8, output_dir="out", log_level="INFO"
+        )
+
+        assert config["model"] == "m"
+        assert config.get("max_tokens") == 10
+        assert config.get("missing", "default") == "default"
+        assert dict(config)["output_dir"] == "out"
+        with pytest.raises(KeyError):
+            config["keys"]
+
+    def test_missing_api_key_raises(self, monkeypatch):
+        """Test that a missing API key raises ValueError."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+        with patch("dotenv.load_dotenv"), pytest.raises(ValueError):
+            load_environment()
+
+
 class TestLoadPromptTemplate:
     """Tests for load_prompt_template function."""
 
@@ -205,7 +521,324 @@ class TestLoadPromptTemplate:
         assert loaded["story_config"]["genre"] == "horror"
         assert loaded["story_elements"]["setting"]["location"] == "hospital"
 
+    def test_repeated_loads_parse_once_and_return_copies(self, tmp_path):
+        """Test that the file is parsed once and callers get independent copies."""
+        template_path = tmp_path / "cached_template.json"
+        template_path.write_text(json.dumps({"story_config": {"genre": "horror"}}), encoding="utf-8")
+
+        with patch("src.story.generator.read_json", wraps=read_json) as mock_read:
+            first = load_prompt_template(str(template_path))
+            first["story_config"]["genre"] = "changed"
+            second = load_prompt_template(str(template_path))
+
+        assert mock_read.call_count == 1
+        assert second["story_config"]["genre"] == "horror"
+
+    def test_modified_template_is_reloaded(self, tmp_path):
+        """Test that editing the file on disk invalidates the cached parse."""
+        template_path = tmp_path / "edited_template.json"
+        template_path.write_text(json.dumps({"story_config": {"genre": "horror"}}), encoding="utf-8")
+        first = load_prompt_template(str(template_path))
+
+        template_path.write_text(json.dumps({"story_config": {"genre": "thriller"}}), encoding="utf-8")
+        os.utime(template_path, ns=(0, template_path.stat().st_mtime_ns + 1_000_000_000))
+        second = load_prompt_template(str(template_path))
+
+        assert first["story_config"]["genre"] == "horror"
+        assert second["story_config"]["genre"] == "thriller"
+
     def test_load_nonexistent_template(self):
         """Test loading a non-existent template file raises error."""
         with pytest.raises(FileNotFoundError):
             load_prompt_template("/nonexistent/path/template.json")
+
+
+class TestFinalizeGeneration:
+    """Tests for _finalize_generation function."""
+
+    def test_summary_overlaps_markdown_write(self, tmp_path):
+        """Test that the summary request runs while the markdown file is written."""
+        config = {"model": "claude-test", "output_dir": str(tmp_path), "api_key": "k"}
+        prepared = {"template": None, "skeleton": None}
+        markdown_written = threading.Event()
+
+        def write_markdown(*args, **kwargs):
+            saved = _write_story_markdown(*args, **kwargs)
+            markdown_written.set()
+            return saved
+
+        def summarize(story_text, title, config):
+            # Only finishes if the markdown write happens concurrently
+            return "요약" if markdown_written.wait(timeout=5) else "sequential"
+
+        with patch("src.story.generator._build_generation_result",
+                   return_value={"story": "# 제목\n\n본문", "metadata": {}}), \
+             patch("src.story.generator._write_story_markdown", side_effect=write_markdown), \
+             patch("src.story.generator.generate_semantic_summary", side_effect=summarize), \
+             patch("src.story.generator._observe_generation") as mock_observe, \
+             patch("src.story.generator._extract_story_canonical"):
+            result = _finalize_generation(
+                prepared, "# 제목\n\n본문", None, config, "claude-test", "anthropic"
+            )
+
+        assert mock_observe.call_args.args[3] == "요약"
+        assert os.path.exists(result["file_path"])
+        metadata_path = result["file_path"].replace(".md", "_metadata.json")
+        assert read_json(metadata_path)["title"] == "제목"
+
+
+    def test_identical_story_reuses_summary(self, tmp_path):
+        """Test that a story already in memory skips the summary request."""
+        config = {"model": "claude-test", "output_dir": str(tmp_path), "api_key": "k"}
+        prepared = {"template": None, "skeleton": None}
+
+        with patch("src.story.generator._build_generation_result",
+                   return_value={"story": "# 제목\n\n본문", "metadata": {}}), \
+             patch("src.story.generator.find_summary_by_content", return_value="기존 요약"), \
+             patch("src.story.generator.generate_semantic_summary") as mock_summary, \
+             patch("src.story.generator._observe_generation") as mock_observe, \
+             patch("src.story.generator._extract_story_canonical"):
+            _finalize_generation(
+                prepared, "# 제목\n\n본문", None, config, "claude-test", "anthropic",
+                save_output=False
+            )
+
+        mock_summary.assert_not_called()
+        assert mock_observe.call_args.args[3] == "기존 요약"
+
+    def test_story_metadata_parsed_once(self, tmp_path):
+        """Test that title/tags/description are parsed once for summary and markdown."""
+        from src.story import generator
+
+        config = {"model": "claude-test", "output_dir": str(tmp_path), "api_key": "k"}
+        prepared = {"template": None, "skeleton": None}
+
+        with patch("src.story.generator._build_generation_result",
+                   return_value={"story": "# 제목\n\n본문", "metadata": {}}), \
+             patch("src.story.generator.parse_story_metadata",
+                   wraps=generator.parse_story_metadata) as mock_parse, \
+             patch("src.story.generator.generate_semantic_summary", return_value="요약") as mock_summary, \
+             patch("src.story.generator._observe_generation"), \
+             patch("src.story.generator._extract_story_canonical"):
+            result = _finalize_generation(
+                prepared, "# 제목\n\n본문", None, config, "claude-test", "anthropic"
+            )
+
+        assert mock_parse.call_count == 1
+        assert mock_summary.call_args.args[1] == "제목"
+        metadata_path = result["file_path"].replace(".md", "_metadata.json")
+        assert read_json(metadata_path)["description"] == "본문"
+
+
+    def test_single_timestamp_for_result_file_and_story_id(self, tmp_path):
+        """Test that metadata, file name, frontmatter date and story_id share one timestamp."""
+        from datetime import datetime as real_datetime
+
+        config = {"model": "claude-test", "output_dir": str(tmp_path), "api_key": "k",
+                  "max_tokens": 100, "temperature": 0.8}
+        prepared = {"template": None, "skeleton": None, "research_metadata": {},
+                    "template_path": None, "custom_request": None, "target_length": None}
+        fixed = real_datetime(2026, 1, 2, 3, 4, 5)
+
+        with patch("src.story.generator.datetime") as mock_datetime, \
+             patch("src.story.generator.generate_semantic_summary", return_value="요약"), \
+             patch("src.story.generator.observe_similarity", return_value=None), \
+             patch("src.story.generator.add_to_generation_memory") as mock_add, \
+             patch("src.story.generator._extract_story_canonical"):
+            mock_datetime.now.return_value = fixed
+            result = _finalize_generation(
+                prepared, "# 제목\n\n본문", None, config, "claude-test", "anthropic"
+            )
+
+        assert mock_datetime.now.call_count == 1
+        assert os.path.basename(result["file_path"]) == "horror_story_20260102_030405.md"
+        assert result["metadata"]["generated_at"] == "2026-01-02T03:04:05"
+        assert mock_add.call_args.kwargs["story_id"] == "20260102_030405"
+        with open(result["file_path"], encoding="utf-8") as f:
+            assert "date: 2026-01-02\n" in f.read()
+
+
+    def test_story_ids_unique_within_same_second(self, monkeypatch):
+        """Test that story IDs issued in the same second get _1, _2 suffixes."""
+        from datetime import datetime as real_datetime
+        from src.story import generator
+
+        monkeypatch.setattr(generator, "_last_story_second", None)
+        same = real_datetime(2026, 3, 4, 5, 6, 7)
+
+        ids = [generator._make_story_id(same) for _ in range(3)]
+        ids.append(generator._make_story_id(real_datetime(2026, 3, 4, 5, 6, 8)))
+
+        assert ids == ["20260304_050607", "20260304_050607_1", "20260304_050607_2", "20260304_050608"]
+
+class TestGenerateStoriesParallel:
+    """Tests for generate_stories_parallel function."""
+
+    def test_results_in_request_order_and_failures_skipped(self):
+        """Test that results keep request order and failed calls are dropped."""
+        config = {"model": "claude-test"}
+        prepared = [{"system_prompt": "s", "user_prompt": f"u{i}"} for i in range(3)]
+
+        def fake_call(system_prompt, user_prompt, config):
+            if user_prompt == "u1":
+                raise Exception("API Error")
+            return {"story_text": f"story-{user_prompt}", "usage": None}
+
+        def fake_finalize(prepared, story_text, usage, config, **kwargs):
+            return {"story": story_text}
+
+        with patch("src.story.generator.load_environment", return_value=config), \
+             patch("src.story.generator._prepare_generation", side_effect=prepared), \
+             patch("src.story.generator.call_claude_api", side_effect=fake_call), \
+             patch("src.story.generator._finalize_generation", side_effect=fake_finalize):
+            results = generate_stories_parallel(3, max_workers=3, save_output=False)
+
+        assert [r["story"] for r in results] == ["story-u0", "story-u2"]
+
+
+class TestGenerateStoriesBatch:
+    """Tests for generate_stories_batch function."""
+
+    @staticmethod
+    def _prepared(template_id):
+        return {
+            "template": None, "skeleton": {"template_id": template_id}, "research_metadata": {},
+            "system_prompt": "s", "user_prompt": f"u-{template_id}",
+            "template_path": None, "custom_request": None, "target_length": None,
+        }
+
+    def test_results_mapped_by_custom_id_in_request_order(self, tmp_path):
+        """Test that batch results map back by custom_id, keep request order and skip errors."""
+        config = {"model": "claude-test", "output_dir": str(tmp_path),
+                  "max_tokens": 100, "temperature": 0.8}
+        # 배치 결과는 요청 순서와 다르게 돌아올 수 있음
+        batch_results = {
+            "story-T-2-2": {"story_text": "# 셋째\n\n본문", "usage": None},
+            "story-T-1-1": {"error": "overloaded"},
+            "story-T-0-0": {"story_text": "# 첫째\n\n본문", "usage": None},
+        }
+
+        with patch("src.story.generator.load_environment", return_value=config), \
+             patch("src.story.generator._prepare_generation",
+                   side_effect=[self._prepared(f"T-{i}") for i in range(3)]), \
+             patch("src.story.generator.call_claude_batch", return_value=batch_results) as mock_batch, \
+             patch("src.story.generator.generate_semantic_summary", return_value="요약"), \
+             patch("src.story.generator.observe_similarity", return_value=None), \
+             patch("src.story.generator.add_to_generation_memory"), \
+             patch("src.story.generator._extract_story_canonical"):
+            results = generate_stories_batch(3, save_output=False, batch_summaries=False)
+
+        sent = mock_batch.call_args.args[0]
+        assert [r["custom_id"] for r in sent] == ["story-T-0-0", "story-T-1-1", "story-T-2-2"]
+        assert [r["user_prompt"] for r in sent] == ["u-T-0", "u-T-1", "u-T-2"]
+        assert [r["metadata"]["batch_custom_id"] for r in results] == ["story-T-0-0", "story-T-2-2"]
+        assert [r["story"] for r in results] == ["# 첫째\n\n본문", "# 셋째\n\n본문"]
+
+    def test_jsonl_gz_output_writes_single_archive(self, tmp_path):
+        """Test that jsonl_gz mode writes one archive line per story and points results at it."""
+        config = {"model": "claude-test", "output_dir": str(tmp_path),
+                  "max_tokens": 100, "temperature": 0.8}
+        batch_results = {
+            f"story-T-{i}-{i}": {"story_text": f"# 제목 {i}\n\n본문", "usage": None}
+            for i in range(2)
+        }
+
+        with patch("src.story.generator.load_environment", return_value=config), \
+             patch("src.story.generator._prepare_generation",
+                   side_effect=[self._prepared(f"T-{i}") for i in range(2)]), \
+             patch("src.story.generator.call_claude_batch", return_value=batch_results), \
+             patch("src.story.generator.generate_semantic_summary", return_value="요약"), \
+             patch("src.story.generator.observe_similarity", return_value=None), \
+             patch("src.story.generator.add_to_generation_memory"), \
+             patch("src.story.generator._extract_story_canonical"):
+            results = generate_stories_batch(2, output_mode="jsonl_gz", batch_summaries=False)
+
+        archives = list(tmp_path.glob("horror_stories_*.jsonl.gz"))
+        assert len(archives) == 1
+        assert list(tmp_path.glob("*.md")) == []
+        with gzip.open(archives[0], "rt", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+
+        assert len(lines) == 2
+        assert all(set(line) == {"id", "markdown", "metadata"} for line in lines)
+        assert [line["id"] for line in lines] == ["story-T-0-0", "story-T-1-1"]
+        assert 'title: "제목 0"' in lines[0]["markdown"]
+        assert all(r["file_path"] == str(archives[0]) for r in results)
+
+    def _run_with_summary_batch(self, tmp_path, summary_batch):
+        config = {"model": "claude-test", "output_dir": str(tmp_path),
+                  "max_tokens": 100, "temperature": 0.8}
+        batch_results = {
+            f"story-T-{i}-{i}": {"story_text": f"# 제목 {i}\n\n본문 {i}", "usage": None}
+            for i in range(2)
+        }
+
+        with patch("src.story.generator.load_environment", return_value=config), \
+             patch("src.story.generator._prepare_generation",
+                   side_effect=[self._prepared(f"T-{i}") for i in range(2)]), \
+             patch("src.story.generator.call_claude_batch", return_value=batch_results), \
+             patch("src.story.generator.find_summary_by_content", return_value=None), \
+             patch("src.story.generator.generate_semantic_summaries_batch",
+                   side_effect=summary_batch) as mock_batch_summary, \
+             patch("src.story.generator.generate_semantic_summary",
+                   return_value="동기 요약") as mock_summary, \
+             patch("src.story.generator.observe_similarity", return_value=None), \
+             patch("src.story.generator.add_to_generation_memory") as mock_add, \
+             patch("src.story.generator._extract_story_canonical"):
+            generate_stories_batch(2, save_output=False)
+
+        stored = [c.kwargs["semantic_summary"] for c in mock_add.call_args_list]
+        return mock_batch_summary, mock_summary, stored
+
+    def test_batch_summaries_mapped_by_custom_id(self, tmp_path):
+        """Test that batched summaries are used per story and no sync summary is requested."""
+        def summary_batch(requests, config):
+            return {r["custom_id"]: f"배치 요약 {r['title']}" for r in requests}
+
+        mock_batch_summary, mock_summary, stored = self._run_with_summary_batch(tmp_path, summary_batch)
+
+        requests = mock_batch_summary.call_args.args[0]
+        assert [r["custom_id"] for r in requests] == ["story-T-0-0", "story-T-1-1"]
+        mock_summary.assert_not_called()
+        assert stored == ["배치 요약 제목 0", "배치 요약 제목 1"]
+
+    def test_failed_summary_batch_falls_back_to_sync_summaries(self, tmp_path):
+        """Test that a failed summary batch falls back to one sync summary per story."""
+        mock_batch_summary, mock_summary, stored = self._run_with_summary_batch(
+            tmp_path, Exception("batch failed")
+        )
+
+        mock_batch_summary.assert_called_once()
+        assert mock_summary.call_count == 2
+        assert stored == ["동기 요약", "동기 요약"]
+
+class TestImportCost:
+    """Tests for what importing the generator module pulls in."""
+
+    def test_import_does_not_load_http_clients(self):
+        """Test that importing the generator leaves anthropic/httpx unloaded until a call needs them."""
+        code = (
+            "import sys, src.story.generator; "
+            "print(sorted(m for m in ('anthropic', 'httpx') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_import_does_not_load_numpy_or_faiss(self):
+        """Test that research vector/dedup backends are not loaded by importing the generator."""
+        code = (
+            "import sys, src.story.generator; "
+            "print(sorted(m for m in ('faiss', 'numpy') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
@@ -0,0 +1,91 @@
+"""
+Tests for json_io module.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.infra import json_io
+from src.infra.json_io import dumps, loads, read_json, write_bytes_atomic, write_json
+
+
+class TestJsonIo:
+    """Tests for JSON read/write helpers."""
+
+    def test_round_trip_preserves_korean(self, tmp_path):
+        """Test that non-ASCII text is written unescaped and read back intact."""
+        path = tmp_path / "data.json"
+        write_json(path, {"title": "귀신의 집", "tags": ["호러"]})
+
+        assert "귀신의 집" in path.read_text(encoding="utf-8")
+        assert read_json(path) == {"title": "귀신의 집", "tags": ["호러"]}
+
+    def test_indent_output(self):
+        """Test that indented output uses 2-space indentation."""
+        assert dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+    def test_compact_output_matches_orjson_format(self):
+        """Test that the stdlib fallback emits orjson-style compact JSON."""
+        with patch.object(json_io, "ORJSON_AVAILABLE", False):
+            assert dumps({"tags": ["호러", "horror"]}) == '{"tags":["호러","horror"]}'.encode("utf-8")
+
+    def test_loads_accepts_bytes_and_str(self):
+        """Test parsing from both bytes and str."""
+        assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        assert loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_stdlib_fallback(self, tmp_path):
+        """Test that helpers work without orjson installed."""
+        path = tmp_path / "data.json"
+        with patch.object(json_io, "ORJSON_AVAILABLE", False):
+            write_json(path, {"title": "무제"})
+            assert read_json(path) == {"title": "무제"}
+
+    def test_write_replaces_existing_file(self, tmp_path):
+        """Test that writes replace the target and leave no temporary files."""
+        path = tmp_path / "data.json"
+        path.write_text("old", encoding="utf-8")
+
+        write_json(path, {"a": 1})
+
+        assert read_json(path) == {"a": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    def test_written_file_follows_current_umask(self, tmp_path):
+        """Test that files get open()-style permissions under the umask at write time."""
+        path = tmp_path / "data.json"
+        previous = os.umask(0o027)
+        try:
+            write_json(path, {"a": 1})
+        finally:
+            os.umask(previous)
+
+        assert path.stat().st_mode & 0o777 == 0o640
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        """Test that a failed write leaves the original file and no temp file."""
+        path = tmp_path / "story.md"
+        path.write_bytes(b"original")
+
+        with patch("src.infra.json_io.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_bytes_atomic(path, b"new")
+
+        assert path.read_bytes() == b"original"
+        assert [p.name for p in tmp_path.iterdir()] == ["story.md"]
+
+    def test_short_writes_are_resumed(self, tmp_path):
+        """Test that partial os.write results still produce the full file."""
+        path = tmp_path / "story.md"
+        data = "무서운 이야기".encode("utf-8") * 100
+        real_write = json_io.os.write
+
+        def short_write(fd, buf):
+            return real_write(fd, bytes(buf[:7]))
+
+        with patch("src.infra.json_io.os.write", side_effect=short_write):
+            write_bytes_atomic(path, data)
+
+        assert path.read_bytes() == data
@@ -26,8 +26,11 @@ class TestDailyRotatingFileHandler:
         handler.close()
 
     def test_handler_creates_log_file(self, tmp_path):
-        """Test that handler creates a log file with correct naming."""
+        """Test that handler creates a log file with correct naming on first write."""
         handler = DailyRotatingFileHandler(log_dir=str(tmp_path))
+        assert list(tmp_path.glob("horror_story_*.log")) == []
+
+        handler.emit(logging.LogRecord("test", logging.INFO, "", 0, "msg", (), None))
 
         log_files = list(tmp_path.glob("horror_story_*.log"))
         assert len(log_files) == 1
@@ -62,6 +65,66 @@ class TestDailyRotatingFileHandler:
         assert "Test message" in content
 
 
+    def _record(self, msg, level=logging.INFO):
+        return logging.LogRecord(
+            name="test", level=level, pathname="", lineno=0,
+            msg=msg, args=(), exc_info=None
+        )
+
+    def test_info_records_buffered_until_close(self, tmp_path):
+        """Test that low-severity records are coalesced in the write buffer."""
+        handler = DailyRotatingFileHandler(log_dir=str(tmp_path))
+        handler.setFormatter(logging.Formatter('%(message)s'))
+
+        handler.emit(self._record("buffered message"))
+        log_file = next(tmp_path.glob("horror_story_*.log"))
+        assert "buffered message" not in log_file.read_text()
+
+        handler.close()
+        assert "buffered message" in log_file.read_text()
+
+    def test_error_record_flushes_buffer(self, tmp_path):
+        """Test that a record at flush_level flushes pending records."""
+        handler = DailyRotatingFileHandler(log_dir=str(tmp_path))
+        handler.setFormatter(logging.Formatter('%(message)s'))
+
+        handler.emit(self._record("info before error"))
+        handler.emit(self._record("error message", level=logging.ERROR))
+
+        content = next(tmp_path.glob("horror_story_*.log")).read_text()
+        assert "info before error" in content
+        assert "error message" in content
+        handler.close()
+
+    def test_date_not_reformatted_before_midnight(self, tmp_path):
+        """Test that emit skips strftime until the next rollover time."""
+        handler = DailyRotatingFileHandler(log_dir=str(tmp_path))
+
+        with patch("src.infra.logging_config.time.strftime") as mock_strftime:
+            handler.emit(self._record("same day"))
+
+        mock_strftime.assert_not_called()
+        handler.close()
+
+    def test_rotates_to_new_file_after_midnight(self, tmp_path):
+        """Test that a record past the rollover time switches log files."""
+        handler = DailyRotatingFileHandler(log_dir=str(tmp_path))
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler.emit(self._record("day one"))
+        first_file = handler.baseFilename
+
+        handler._next_rollover = 0
+        with patch("src.infra.logging_config.time.strftime", return_value="20991231"):
+            handler.emit(self._record("day two"))
+        handler.close()
+
+        assert handler.baseFilename != first_file
+        assert "20991231" in handler.baseFilename
+        assert "day one" in Path(first_file).read_text()
+        assert "day two" in Path(handler.baseFilename).read_text()
+        assert handler._next_rollover > 0
+
+
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
@@ -116,3 +179,53 @@ class TestSetupLogging:
         assert logger.propagate is False
 
         logger.handlers.clear()
+
+    def test_repeated_calls_reuse_handlers(self):
+        """Test that calling setup_logging again does not rebuild handlers."""
+        test_logger = logging.getLogger("horror_story_generator")
+        test_logger.handlers.clear()
+
+        logger = setup_logging("INFO")
+        handlers = list(logger.handlers)
+
+        logger = setup_logging("INFO")
+        assert logger.handlers == handlers
+
+        logger.handlers.clear()
+
+    def test_level_change_updates_existing_handlers(self):
+        """Test that a new level is applied in place to existing handlers."""
+        test_logger = logging.getLogger("horror_story_generator")
+        test_logger.handlers.clear()
+
+        logger = setup_logging("INFO")
+        handlers = list(logger.handlers)
+
+        logger = setup_logging("DEBUG")
+        assert logger.handlers == handlers
+        assert logger.level == logging.DEBUG
+        assert all(h.level == logging.DEBUG for h in logger.handlers)
+
+        logger.handlers.clear()
+
+    def test_file_records_written_by_queue_listener(self, tmp_path, monkeypatch):
+        """Test that file logging goes through a queue drained by a listener thread."""
+        from logging.handlers import QueueHandler
+
+        from src.infra import logging_config
+
+        monkeypatch.chdir(tmp_path)
+        test_logger = logging.getLogger("horror_story_generator")
+        test_logger.handlers.clear()
+
+        logger = setup_logging("INFO")
+        assert any(isinstance(h, QueueHandler) for h in logger.handlers)
+        assert not any(isinstance(h, DailyRotatingFileHandler) for h in logger.handlers)
+
+        logger.info("queued record")
+        logging_config._stop_queue_listener()
+
+        content = next((tmp_path / "logs").glob("horror_story_*.log")).read_text(encoding="utf-8")
+        assert "INFO - queued record" in content
+
+        logger.handlers.clear()
@@ -66,6 +66,20 @@ class TestBuildSystemPrompt:
         assert "isolation" in result
         assert "Act 1" in result or "act_1" in result.lower()
 
+    def test_skeleton_section_is_memoized(self):
+        """Should render the skeleton section once per distinct skeleton."""
+        from src.story.prompt_builder import build_system_prompt, _render_skeleton_suffix
+
+        skeleton = {"template_name": "memo_template", "canonical_core": {"setting": "subway"}}
+        _render_skeleton_suffix.cache_clear()
+
+        first = build_system_prompt(skeleton=skeleton)
+        second = build_system_prompt(skeleton=dict(skeleton))
+
+        assert first == second
+        assert "Setting Type: subway" in first
+        assert _render_skeleton_suffix.cache_info().hits == 1
+
     def test_includes_research_context_when_provided(self):
         """Should include research context when provided."""
         from src.story.prompt_builder import build_system_prompt
@@ -320,6 +334,38 @@ class TestFormatSeedContext:
         assert "inspire" in result.lower() or "seeds" in result.lower()
 
 
+class TestSplitSystemPrompt:
+    """Tests for split_system_prompt function."""
+
+    def test_static_prefix_shared_across_skeletons(self):
+        """Should keep the core prompt in the prefix and the skeleton in the suffix."""
+        from src.story.prompt_builder import build_system_prompt, split_system_prompt
+
+        skeleton = {"template_name": "test_template", "canonical_core": {}, "story_skeleton": {}}
+        plain = build_system_prompt()
+        with_skeleton = build_system_prompt(skeleton=skeleton)
+
+        static, dynamic = split_system_prompt(with_skeleton)
+
+        assert static == plain
+        assert static + dynamic == with_skeleton
+        assert "test_template" in dynamic
+
+    def test_legacy_template_prompt_is_all_prefix(self):
+        """Should treat legacy template prompts as entirely static."""
+        from src.story.prompt_builder import build_system_prompt, split_system_prompt
+
+        prompt = build_system_prompt(template={"story_config": {"genre": "horror"}})
+
+        assert split_system_prompt(prompt) == (prompt, "")
+
+    def test_custom_prompt_without_section(self):
+        """Should return the whole prompt as prefix when the section is absent."""
+        from src.story.prompt_builder import split_system_prompt
+
+        assert split_system_prompt("Custom prompt") == ("Custom prompt", "")
+
+
 class TestBuildUserPrompt:
     """Tests for build_user_prompt function."""
 
@@ -24,6 +24,26 @@ class TestDedupSignal:
         assert DedupSignal.HIGH.value == "HIGH"
 
 
+class TestPackageExports:
+    """Tests for the lazily resolved research exports of src.dedup."""
+
+    def test_research_exports_resolve_on_access(self):
+        """Should resolve research dedup names from the package on first access."""
+        import src.dedup as dedup
+        from src.dedup.research import FaissIndex, check_duplicate
+
+        assert dedup.RESEARCH_DEDUP_AVAILABLE
+        assert dedup.FaissIndex is FaissIndex
+        assert dedup.check_duplicate is check_duplicate
+        assert "FaissIndex" in dedup.__all__
+
+    def test_unknown_attribute_raises(self):
+        """Should raise AttributeError for names the package does not export."""
+        import src.dedup as dedup
+
+        with pytest.raises(AttributeError):
+            dedup.not_an_export
+
 class TestGetDedupSignal:
     """Tests for get_dedup_signal function."""
 
@@ -2,6 +2,10 @@
 Tests for similarity module.
 """
 
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 
 from src.dedup.similarity import (
@@ -13,6 +17,8 @@ from src.dedup.similarity import (
     should_accept_story,
     get_generation_memory_count,
     clear_generation_memory,
+    load_past_stories_into_memory,
+    find_summary_by_content,
 )
 
 
@@ -80,6 +86,47 @@ class TestGenerationRecord:
         assert record.canonical_keys == {"setting": "digital"}
         assert record.generated_at == "2026-01-11T12:00:00"
 
+    def test_record_is_slotted_and_frozen(self):
+        """Test that records have no per-instance __dict__ and cannot be mutated."""
+        record = GenerationRecord(
+            story_id="test_001",
+            template_id=None,
+            title="Test Story",
+            semantic_summary="Summary",
+            canonical_keys={},
+            generated_at="2026-01-11T12:00:00"
+        )
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            record.title = "Changed"
+
+    def test_canonical_pairs_normalized(self):
+        """Test that canonical keys are normalized once at creation."""
+        record = GenerationRecord(
+            story_id="test_001",
+            template_id=None,
+            title="Test Story",
+            semantic_summary="Summary",
+            canonical_keys={"setting": " Apartment ", "twist": None},
+            generated_at="2026-01-11T12:00:00"
+        )
+
+        assert record.canonical_pairs == frozenset({("setting", "apartment")})
+
+    def test_word_set_tokenized_once(self):
+        """Test that the summary word set is computed at creation."""
+        record = GenerationRecord(
+            story_id="test_001",
+            template_id=None,
+            title="Test Story",
+            semantic_summary="The Ghost, the ghost!",
+            canonical_keys={},
+            generated_at="2026-01-11T12:00:00"
+        )
+
+        assert record.word_set == frozenset({"the", "ghost"})
+
 
 class TestGenerationMemory:
     """Tests for generation memory functions."""
@@ -120,6 +167,129 @@ class TestGenerationMemory:
         clear_generation_memory()
         assert get_generation_memory_count() == 0
 
+    def test_memory_is_bounded(self):
+        """Test that the oldest records are dropped beyond GEN_MEMORY_SIZE."""
+        with patch("src.dedup.similarity.GEN_MEMORY_SIZE", 3):
+            clear_generation_memory()
+            for i in range(5):
+                add_to_generation_memory(
+                    story_id=f"test_{i:03d}",
+                    template_id=None,
+                    title=f"Story {i}",
+                    semantic_summary=f"unique{i} words",
+                    canonical_keys={}
+                )
+
+            assert get_generation_memory_count() == 3
+            result = observe_similarity("unique0 words", "New", {})
+            assert result["closest_story_id"] != "test_000"
+
+    def test_word_index_compacted_after_turnover(self):
+        """Test that words of evicted records are dropped from the bit index."""
+        from src.dedup import similarity
+
+        with patch("src.dedup.similarity.GEN_MEMORY_SIZE", 3):
+            clear_generation_memory()
+            for i in range(6):
+                add_to_generation_memory(
+                    story_id=f"test_{i:03d}",
+                    template_id=None,
+                    title=f"Story {i}",
+                    semantic_summary=f"unique{i} shared words",
+                    canonical_keys={}
+                )
+
+            assert set(similarity._word_bit_index) == {
+                "unique3", "unique4", "unique5", "shared", "words"
+            }
+            result = observe_similarity("unique4 shared words", "New", {})
+            assert result["closest_story_id"] == "test_004"
+            assert result["text_similarity"] == 1.0
+
+    def test_load_past_stories_keeps_newest(self):
+        """Test that loading more history than fits keeps the newest stories."""
+        records = [
+            SimpleNamespace(
+                id=f"past_{i}", template_id=None, title=f"Past {i}",
+                semantic_summary=f"past{i} story", created_at="2026-01-01"
+            )
+            for i in range(5)  # newest first
+        ]
+
+        with patch("src.dedup.similarity.GEN_MEMORY_SIZE", 2):
+            clear_generation_memory()
+            loaded = load_past_stories_into_memory(records)
+            add_to_generation_memory("new", None, "New", "new story", {})
+
+            assert loaded == 2
+            assert get_generation_memory_count() == 2
+            result = observe_similarity("past0 story", "Query", {})
+            assert result["closest_story_id"] == "past_0"
+
+    def test_load_past_stories_matches_sequential_adds(self):
+        """Test that bulk loading scores the same as adding records one by one."""
+        summaries = ["ghost hospital ward", "family apartment night", "cats in the park"]
+        records = [
+            SimpleNamespace(
+                id=f"past_{i}", template_id=None, title=f"Past {i}",
+                semantic_summary=summary, created_at="2026-01-01"
+            )
+            for i, summary in enumerate(summaries)
+        ]
+
+        add_to_generation_memory("existing", None, "Existing", "old ghost story", {})
+        load_past_stories_into_memory(records)
+        bulk = observe_similarity("ghost apartment night", "Q", {})
+
+        clear_generation_memory()
+        add_to_generation_memory("existing", None, "Existing", "old ghost story", {})
+        for record in reversed(records):
+            add_to_generation_memory(record.id, None, record.title, record.semantic_summary, {})
+        sequential = observe_similarity("ghost apartment night", "Q", {})
+
+        assert get_generation_memory_count() == 4
+        assert bulk == sequential
+        assert bulk["closest_story_id"] == "past_1"
+
+
+class TestFindSummaryByContent:
+    """Tests for the content-hash summary lookup."""
+
+    def setup_method(self):
+        """Clear memory before each test."""
+        clear_generation_memory()
+
+    def teardown_method(self):
+        """Clear memory after each test."""
+        clear_generation_memory()
+
+    def test_reuses_summary_of_normalized_identical_story(self):
+        """Test that case and whitespace differences still match."""
+        add_to_generation_memory(
+            "test_001", None, "A", "요약 A", {}, story_text="# 제목\n\n그날  밤, Door가 열렸다."
+        )
+
+        assert find_summary_by_content("# 제목 그날 밤, door가 열렸다.  ") == "요약 A"
+        assert find_summary_by_content("# 제목\n\n다른 이야기") is None
+
+    def test_records_without_story_text_not_indexed(self):
+        """Test that records added without story text never match."""
+        add_to_generation_memory("test_001", None, "A", "요약 A", {})
+
+        assert find_summary_by_content("요약 A") is None
+
+    def test_evicted_records_leave_index(self):
+        """Test that the hash entry is dropped with its record."""
+        with patch("src.dedup.similarity.GEN_MEMORY_SIZE", 2):
+            clear_generation_memory()
+            for i in range(3):
+                add_to_generation_memory(
+                    f"test_{i}", None, f"T{i}", f"요약 {i}", {}, story_text=f"본문 {i}"
+                )
+
+            assert find_summary_by_content("본문 0") is None
+            assert find_summary_by_content("본문 2") == "요약 2"
+
 
 class TestObserveSimilarity:
     """Tests for observe_similarity function."""
@@ -182,6 +352,98 @@ class TestObserveSimilarity:
         # Should be HIGH (>=0.5) due to high word overlap
         assert result["signal"] in ["MEDIUM", "HIGH"]
 
+    def test_unseen_query_words_count_towards_union(self):
+        """Test that words absent from memory still lower the Jaccard score."""
+        add_to_generation_memory("test_001", None, "A", "ghost hospital", {})
+
+        result = observe_similarity("ghost apartment", "B", {})
+
+        assert result["text_similarity"] == round(1 / 3, 3)
+        assert result["text_similarity"] == round(
+            compute_text_similarity("ghost apartment", "ghost hospital"), 3
+        )
+
+    def test_result_banner_is_one_log_record(self):
+        """Test that the observation banner is emitted as a single multi-line record."""
+        from src.dedup import similarity
+
+        add_to_generation_memory("test_001", None, "A", "ghost hospital", {})
+
+        with patch.object(similarity.logger, "info") as mock_info:
+            result = observe_similarity("ghost apartment", "B", {})
+
+        assert result["closest_story_id"] == "test_001"
+        assert mock_info.call_count == 2  # scan start line + banner
+        banner = mock_info.call_args.args[0] % mock_info.call_args.args[1:]
+        assert len(banner.splitlines()) == 9
+        assert all(line.startswith("[Phase2B][OBSERVE]") for line in banner.splitlines())
+        assert '"A" (ID: test_001)' in banner
+        assert "33.33%" in banner
+
+    def test_picks_closest_of_many(self):
+        """Test that the closest record is reported with its exact Jaccard score."""
+        summaries = [
+            "A ghost haunts the old hospital ward",
+            "A family moves into a quiet apartment",
+            "Cats and dogs play in the park at night",
+        ]
+        for i, summary in enumerate(summaries):
+            add_to_generation_memory(
+                story_id=f"test_{i:03d}",
+                template_id="T-001",
+                title=f"Story {i}",
+                semantic_summary=summary,
+                canonical_keys={"setting": "park" if i == 2 else "hospital"}
+            )
+
+        current = "Cats and dogs play in the park"
+        result = observe_similarity(
+            current_summary=current,
+            current_title="Story X",
+            canonical_keys={"setting": "park"}
+        )
+
+        assert result["closest_story_id"] == "test_002"
+        assert result["text_similarity"] == round(
+            compute_text_similarity(current, summaries[2]), 3
+        )
+        assert result["canonical_matches"] == 1
+
+    def test_stop_at_high_returns_first_high_match(self):
+        """Test that stop_at_high scans oldest first and stops at the first HIGH record."""
+        add_to_generation_memory("test_000", None, "Old", "family apartment", {})
+        add_to_generation_memory("test_001", None, "Near", "ghost hospital night", {})
+        add_to_generation_memory("test_002", None, "Exact", "ghost hospital night ward", {})
+
+        full = observe_similarity("ghost hospital night ward", "Q", {})
+        fast = observe_similarity("ghost hospital night ward", "Q", {}, stop_at_high=True)
+
+        assert full["closest_story_id"] == "test_002"
+        assert fast["closest_story_id"] == "test_001"
+        assert fast["signal"] == full["signal"] == "HIGH"
+
+    def test_ties_resolve_to_oldest_record(self):
+        """Test that equal scores keep the oldest record, with or without stop_at_high."""
+        for i in range(3):
+            add_to_generation_memory(f"test_00{i}", None, f"T{i}", "ghost hospital ward at night", {})
+
+        for stop_at_high in (False, True):
+            medium = observe_similarity("ghost hospital basement", "Q", {}, stop_at_high=stop_at_high)
+            high = observe_similarity("ghost hospital ward", "Q", {}, stop_at_high=stop_at_high)
+
+            assert medium["closest_story_id"] == "test_000"
+            assert high["closest_story_id"] == "test_000"
+
+    def test_stop_at_high_scans_all_when_no_high_match(self):
+        """Test that stop_at_high still finds the maximum below the HIGH threshold."""
+        add_to_generation_memory("test_000", None, "A", "ghost hospital ward at night", {})
+        add_to_generation_memory("test_001", None, "B", "family apartment", {})
+
+        result = observe_similarity("ghost hospital basement", "Q", {}, stop_at_high=True)
+
+        assert result["closest_story_id"] == "test_000"
+        assert result["signal"] == "MEDIUM"
+
 
 class TestSimilaritySignal:
     """Tests for get_similarity_signal function."""
@@ -132,7 +132,7 @@ class TestFireAndForgetWebhook:
 class TestSendWebhookInThread:
     """Tests for _send_webhook_in_thread function."""
 
-    @patch("src.infra.webhook.httpx.Client")
+    @patch("httpx.Client")
     def test_successful_send(self, mock_client_class):
         """Test successful webhook send."""
         mock_response = MagicMock()
@@ -154,7 +154,7 @@ class TestSendWebhookInThread:
         call_args = mock_client.post.call_args
         assert call_args[1]["json"] == payload
 
-    @patch("src.infra.webhook.httpx.Client")
+    @patch("httpx.Client")
     def test_retries_on_failure(self, mock_client_class):
         """Test that webhook retries on HTTP error."""
         mock_response = MagicMock()
@@ -176,7 +176,7 @@ class TestSendWebhookInThread:
         # Should have been called twice (initial + 1 retry)
         assert mock_client.post.call_count == 2
 
-    @patch("src.infra.webhook.httpx.Client")
+    @patch("httpx.Client")
     def test_includes_custom_headers(self, mock_client_class):
         """Test that custom headers are included."""
         mock_response = MagicMock()
@@ -484,7 +484,7 @@ class TestDiscordWebhookIntegration:
         assert "event" in payload
         assert "embeds" not in payload
 
-    @patch("src.infra.webhook.httpx.Client")
+    @patch("httpx.Client")
     def test_discord_webhook_no_custom_headers(self, mock_client_class):
         """Test that Discord webhooks don't get custom X-Webhook headers."""
         mock_response = MagicMock()
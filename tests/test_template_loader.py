@@ -2,10 +2,13 @@
 Tests for template_loader module.
 """
 
+import os
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from src.infra.json_io import read_json
 from src.story.template_loader import (
     load_template_skeletons,
     select_random_template,
@@ -37,6 +40,40 @@ class TestLoadTemplateSkeletons:
         assert "template_id" in skeleton
         assert "template_name" in skeleton
 
+    def test_skeletons_are_cached(self):
+        """Test that repeated loads reuse the parsed file."""
+        load_template_skeletons.cache_clear()
+        with patch("src.story.template_loader.read_json", wraps=read_json) as mock_load:
+            first = load_template_skeletons()
+            second = load_template_skeletons()
+
+        assert first is second
+        assert mock_load.call_count == 1
+
+    def test_cache_clear_forces_reload(self):
+        """Test that cache_clear() re-reads the file."""
+        first = load_template_skeletons()
+        load_template_skeletons.cache_clear()
+        second = load_template_skeletons()
+
+        assert first is not second
+        assert first == second
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        """Test that a changed mtime invalidates the cached skeletons."""
+        path = tmp_path / "skeletons.json"
+        path.write_text('[{"template_id": "T-A"}]', encoding="utf-8")
+
+        with patch("src.story.template_loader.TEMPLATE_SKELETONS_PATH", path):
+            first = load_template_skeletons()
+            path.write_text('[{"template_id": "T-B"}]', encoding="utf-8")
+            os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000_000))
+            second = load_template_skeletons()
+
+        load_template_skeletons.cache_clear()
+        assert first == [{"template_id": "T-A"}]
+        assert second == [{"template_id": "T-B"}]
+
 
 class TestSelectRandomTemplate:
     """Tests for select_random_template function."""
@@ -61,6 +98,17 @@ class TestSelectRandomTemplate:
         if len(skeletons) > 1:
             assert template1.get("template_id") != template2.get("template_id")
 
+    def test_back_to_back_prevention_repeated(self):
+        """Test that no consecutive repeats occur and every template stays reachable."""
+        skeletons = load_template_skeletons()
+        if len(skeletons) < 2:
+            pytest.skip("Need at least 2 templates for this test")
+
+        selected_ids = [select_random_template().get("template_id") for _ in range(500)]
+
+        assert all(a != b for a, b in zip(selected_ids, selected_ids[1:]))
+        assert set(selected_ids) == {s.get("template_id") for s in skeletons}
+
     def test_exclude_template_ids(self):
         """Test excluding specific template IDs."""
         skeletons = load_template_skeletons()
@@ -73,10 +121,37 @@ class TestSelectRandomTemplate:
         # Selected template should not be the excluded one
         assert template.get("template_id") != first_id
 
+    def test_selection_ignores_global_random_state(self):
+        """Test that selection uses the module RNG, not the global random state."""
+        import random
+
+        from src.story import template_loader
+
+        def pick_sequence():
+            reset_last_template_id()
+            return [select_random_template()["template_id"] for _ in range(5)]
+
+        with patch.object(template_loader, "_rng", random.Random(7)):
+            random.seed(1)
+            first = pick_sequence()
+        with patch.object(template_loader, "_rng", random.Random(7)):
+            random.seed(2)
+            second = pick_sequence()
+
+        assert first == second
+
 
 class TestComputeTemplateWeights:
     """Tests for compute_template_weights function."""
 
+    def test_penalty_at_each_threshold_boundary(self):
+        """Test that each count maps to the multiplier of the highest threshold reached."""
+        skeletons = [{"template_id": "T-SYS-001"}]
+        expected = {0: 1.0, 3: 1.0, 4: 0.50, 5: 0.50, 6: 0.20, 7: 0.20, 8: 0.05, 100: 0.05}
+
+        for count, multiplier in expected.items():
+            assert compute_template_weights(skeletons, cluster_count=count) == [multiplier]
+
     def test_no_penalty_below_threshold(self):
         """Test no penalty when cluster count is below threshold."""
         skeletons = [
@@ -156,6 +231,14 @@ class TestClusterConfiguration:
 class TestLoadTemplateSkeletonsEdgeCases:
     """Tests for edge cases in load_template_skeletons."""
 
+    def setup_method(self):
+        """Drop the cached skeletons so the patched path is read."""
+        load_template_skeletons.cache_clear()
+
+    def teardown_method(self):
+        """Drop the cached result produced under the patched path."""
+        load_template_skeletons.cache_clear()
+
     def test_file_not_found_returns_empty_list(self):
         """Test that missing file returns empty list."""
         with patch.object(Path, 'exists', return_value=False):